@@ -0,0 +1,134 @@
+"""
+User Activity Tracking
+last_login / last_seen timestamps are buffered in process memory and written
+in bulk_update batches by a background timer, at most ACTIVITY_FLUSH_INTERVAL
+seconds after the first buffered event. Requests never write to admin_users
+for bookkeeping, and bulk_update leaves updated_at alone. Timestamps only
+move forward, so flushes from several workers can land in any order.
+ACTIVITY_FLUSH_INTERVAL=0 (the default under `manage.py test`) writes each
+event synchronously instead, with no timer thread or exit-time flush.
+"""
+
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
+
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_logins = {}  # user_id -> datetime
+_seen = {}    # user_id -> datetime
+_timer = None
+
+
+def _flush_interval():
+    return getattr(settings, 'ACTIVITY_FLUSH_INTERVAL', 60)
+
+
+def _schedule_flush():
+    global _timer
+    if _timer is None and _flush_interval() > 0:
+        _timer = threading.Timer(_flush_interval(), _flush_in_background)
+        _timer.daemon = True
+        _timer.start()
+
+
+def record_login(user_id, when=None):
+    when = when or timezone.now()
+    with _lock:
+        _logins[user_id] = when
+        _seen[user_id] = when
+        _schedule_flush()
+    if _flush_interval() <= 0:
+        flush_activity()
+
+
+def record_seen(user_id, when=None):
+    when = when or timezone.now()
+    with _lock:
+        _seen[user_id] = when
+        _schedule_flush()
+    if _flush_interval() <= 0:
+        flush_activity()
+
+
+def _later_of(field, when):
+    return Greatest(Coalesce(F(field), Value(when)), Value(when))
+
+
+def flush_activity():
+    """Write buffered timestamps. Returns the number of users updated."""
+    from .models import AdminUser
+
+    global _timer
+    with _lock:
+        logins, seen = _logins.copy(), _seen.copy()
+        _logins.clear()
+        _seen.clear()
+        _timer = None
+    if not seen:
+        return 0
+
+    batch_size = getattr(settings, 'ACTIVITY_FLUSH_BATCH_SIZE', 500)
+    try:
+        login_rows = []
+        seen_rows = []
+        for user_id, last_seen in seen.items():
+            user = AdminUser(pk=user_id)
+            user.last_seen = _later_of('last_seen', last_seen)
+            if user_id in logins:
+                user.last_login = _later_of('last_login', logins[user_id])
+                login_rows.append(user)
+            else:
+                seen_rows.append(user)
+        if login_rows:
+            AdminUser.objects.bulk_update(login_rows, ['last_login', 'last_seen'], batch_size=batch_size)
+        if seen_rows:
+            AdminUser.objects.bulk_update(seen_rows, ['last_seen'], batch_size=batch_size)
+    except Exception:
+        # Put the batch back (newer events win) and try again next interval
+        with _lock:
+            for user_id, when in logins.items():
+                _logins.setdefault(user_id, when)
+            for user_id, when in seen.items():
+                _seen.setdefault(user_id, when)
+            _schedule_flush()
+        raise
+    return len(seen)
+
+
+def _flush_in_background():
+    close_old_connections()
+    try:
+        flush_activity()
+    except Exception:
+        logger.exception('Failed to flush user activity')
+    finally:
+        connection.close()
+
+
+atexit.register(lambda: _flush_in_background() if _seen else None)
+
+
+class ActivityMiddleware:
+    """Records last_seen for requests that DRF authenticated."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        # DRF assigns the authenticated user onto the Django request; the
+        # session-based lazy user is skipped so it is never evaluated here
+        user = request.__dict__.get('user')
+        if user is not None and not isinstance(user, SimpleLazyObject) and user.is_authenticated:
+            record_seen(user.pk)
+        return response
@@ -30,7 +30,7 @@ class AdminUserAdmin(BaseUserAdmin):
             'fields': ('two_factor_enabled', 'two_factor_secret')
         }),
         ('Important dates', {
-            'fields': ('last_login', 'date_joined')
+            'fields': ('last_login', 'last_seen', 'date_joined')
         }),
     )
     
@@ -44,7 +44,7 @@ class AdminUserAdmin(BaseUserAdmin):
         }),
     )
     
-    readonly_fields = ['date_joined', 'last_login']
+    readonly_fields = ['date_joined', 'last_login', 'last_seen']
 
 
 @admin.register(UniversityProfile)
@@ -0,0 +1,277 @@
+"""
+Club Application Executor
+Applies approved member additions, position changes and removals in batches.
+Target users and memberships are resolved with one query each, changes are
+worked out in memory and written with bulk_create/bulk_update, and every
+membership change gets a RoleHistory row.
+"""
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .club_directory import invalidate_club_directory
+from .reviewer_scope import invalidate_reviewer_scopes
+
+
+# Processed in this order, so a batch can add a member and then promote them
+AUTOMATED_TYPES = ['member_addition', 'position_change', 'member_removal']
+
+# Membership statuses that count as currently in the club
+CURRENT_MEMBER_STATUSES = ['active', 'approved']
+
+MEMBER_UPDATE_FIELDS = ['role', 'status', 'approved_at', 'approved_by', 'revoked_at', 'revoked_by']
+
+
+class ApplicationSkipped(Exception):
+    """The application cannot be applied; the message is reported back to the caller."""
+
+
+class _Roster:
+    """In-memory view of the memberships touched by one batch."""
+
+    def __init__(self, members):
+        self.members = {}
+        for member in members:
+            self.members.setdefault((member.club_id, member.user_id), []).append(member)
+        self.created = []
+        self.changed = {}
+        self.history = []
+
+    def memberships(self, club_id, user_id):
+        return self.members.setdefault((club_id, user_id), [])
+
+    def current(self, club_id, user_id):
+        return [m for m in self.memberships(club_id, user_id) if m.status in CURRENT_MEMBER_STATUSES]
+
+    def with_role(self, club_id, user_id, role):
+        return next((m for m in self.memberships(club_id, user_id) if m.role == role), None)
+
+    def add(self, member):
+        self.memberships(member.club_id, member.user_id).append(member)
+        self.created.append(member)
+
+    def touch(self, member):
+        if member.pk:
+            self.changed[member.pk] = member
+
+    def log(self, member, action, remarks):
+        self.history.append((member, action, remarks))
+
+
+def _target_key(data, *id_keys):
+    for key in id_keys:
+        if data.get(key):
+            try:
+                return ('id', int(data[key]))
+            except (TypeError, ValueError):
+                raise ApplicationSkipped(f'Invalid user id: {data[key]}')
+    if data.get('target_username'):
+        return ('username', data['target_username'].strip().lower())
+    if data.get('target_email'):
+        return ('email', data['target_email'].strip().lower())
+    raise ApplicationSkipped('Application does not name a target user')
+
+
+def _resolve_users(keys):
+    """Load every referenced user in one query, indexed by id, username and email."""
+    from .models import AdminUser
+
+    ids = {v for k, v in keys if k == 'id'}
+    usernames = {v for k, v in keys if k == 'username'}
+    emails = {v for k, v in keys if k == 'email'}
+    if not (ids or usernames or emails):
+        return {}
+
+    query = Q(id__in=ids)
+    for username in usernames:
+        query |= Q(username__iexact=username)
+    for email in emails:
+        query |= Q(email__iexact=email)
+
+    users = {}
+    for user in AdminUser.objects.filter(query).only('id', 'username', 'email'):
+        users[('id', user.id)] = user
+        users[('username', user.username.lower())] = user
+        users[('email', user.email.lower())] = user
+    return users
+
+
+def _add_member(application, target, roster, reviewer, now):
+    from .models import ClubMember
+
+    role = application.application_data.get('proposed_position') or 'member'
+    club_id = application.club_id
+
+    if roster.current(club_id, target.id):
+        raise ApplicationSkipped(f'{target.username} is already an active member')
+
+    member = roster.with_role(club_id, target.id, role) or next(iter(roster.memberships(club_id, target.id)), None)
+    if member:
+        # Reactivate
+        member.role = role
+        member.status = 'active'
+        member.approved_at = now
+        member.approved_by = reviewer
+        member.revoked_at = None
+        member.revoked_by = None
+        roster.touch(member)
+    else:
+        member = ClubMember(
+            club_id=club_id,
+            user_id=target.id,
+            role=role,
+            status='active',
+            approved_at=now,
+            approved_by=reviewer,
+        )
+        roster.add(member)
+
+    roster.log(member, 'approved', f'Added as {role} via application {application.application_id}')
+    return f'Successfully added {target.username} as {role}'
+
+
+def _change_position(application, target, roster, reviewer, now):
+    new_role = application.application_data.get('new_position')
+    if not new_role:
+        raise ApplicationSkipped('Application does not specify new_position')
+
+    club_id = application.club_id
+    current = roster.current(club_id, target.id)
+    if not current:
+        raise ApplicationSkipped(f'{target.username} is not an active member of this club')
+    if any(m.role == new_role for m in current):
+        raise ApplicationSkipped(f'{target.username} already holds {new_role}')
+    if roster.with_role(club_id, target.id, new_role):
+        raise ApplicationSkipped(f'{target.username} already has a {new_role} membership record')
+
+    member = current[0]
+    old_role = member.role
+    member.role = new_role
+    roster.touch(member)
+    roster.log(member, 'approved', f'Role changed from {old_role} to {new_role} via application {application.application_id}')
+    return f'Changed {target.username} from {old_role} to {new_role}'
+
+
+def _remove_member(application, target, roster, reviewer, now):
+    current = roster.current(application.club_id, target.id)
+    if not current:
+        raise ApplicationSkipped(f'{target.username} is not an active member of this club')
+
+    for member in current:
+        member.status = 'revoked'
+        member.revoked_at = now
+        member.revoked_by = reviewer
+        roster.touch(member)
+        roster.log(member, 'revoked', f'Removed via application {application.application_id}')
+    return f'Successfully removed {target.username} from club'
+
+
+HANDLERS = {
+    'member_addition': (_add_member, ('target_user_id',)),
+    'position_change': (_change_position, ('user_id', 'target_user_id')),
+    'member_removal': (_remove_member, ('target_user_id', 'user_id')),
+}
+
+
+def implement_applications(application_ids, reviewer, notes='', include_manual=False, club_ids=None):
+    """
+    Implement approved club applications in one transaction.
+    Returns {application pk: {'success', 'message', 'status'}} for every id.
+    Applications of non-automated types are only marked implemented when
+    include_manual is set (the reviewer has carried them out by hand).
+    club_ids, when given, restricts the batch to those clubs.
+    """
+    from .models import ClubApplication, ClubMember, RoleHistory
+
+    now = timezone.now()
+    results = {
+        pk: {'success': False, 'message': 'Application not found or not approved', 'status': None}
+        for pk in application_ids
+    }
+
+    with transaction.atomic():
+        applications = ClubApplication.objects.select_for_update().filter(
+            id__in=application_ids, status='approved'
+        )
+        if club_ids is not None:
+            applications = applications.filter(club_id__in=club_ids)
+        applications = list(applications)
+        for application in applications:
+            results[application.id]['status'] = application.status
+
+        by_type = {}
+        manual = []
+        for application in applications:
+            if application.application_type in HANDLERS:
+                by_type.setdefault(application.application_type, []).append(application)
+            else:
+                manual.append(application)
+
+        # Resolve every target user and membership up front
+        targets = {}
+        for group in by_type.values():
+            for application in group:
+                _, id_keys = HANDLERS[application.application_type]
+                try:
+                    targets[application.id] = _target_key(application.application_data, *id_keys)
+                except ApplicationSkipped as exc:
+                    results[application.id]['message'] = str(exc)
+        users = _resolve_users(set(targets.values()))
+
+        club_ids = {a.club_id for group in by_type.values() for a in group}
+        user_ids = {u.id for u in users.values()}
+        roster = _Roster(ClubMember.objects.filter(club_id__in=club_ids, user_id__in=user_ids))
+
+        implemented = []
+        for application_type in AUTOMATED_TYPES:
+            handler, _ = HANDLERS[application_type]
+            for application in sorted(by_type.get(application_type, []), key=lambda a: (a.admin_reviewed_at or now, a.id)):
+                if application.id not in targets:
+                    continue
+                target = users.get(targets[application.id])
+                if target is None:
+                    results[application.id]['message'] = 'Target user not found'
+                    continue
+                try:
+                    message = handler(application, target, roster, reviewer, now)
+                except ApplicationSkipped as exc:
+                    results[application.id]['message'] = str(exc)
+                    continue
+                results[application.id].update(success=True, message=message)
+                implemented.append(application.id)
+
+        for application in manual:
+            if include_manual:
+                results[application.id].update(success=True, message='Marked as implemented (manual action)')
+                implemented.append(application.id)
+            else:
+                results[application.id]['message'] = (
+                    f'Implementation not automated for {application.get_application_type_display()}. '
+                    'Manual action required.'
+                )
+
+        ClubMember.objects.bulk_create(roster.created)
+        ClubMember.objects.bulk_update(list(roster.changed.values()), MEMBER_UPDATE_FIELDS)
+        RoleHistory.objects.bulk_create([
+            RoleHistory(club_member=member, action=action, performed_by=reviewer, remarks=remarks)
+            for member, action, remarks in roster.history
+        ])
+
+        ClubApplication.objects.filter(id__in=implemented).update(
+            status='implemented',
+            implemented_by=reviewer,
+            implemented_at=now,
+            implementation_notes=notes,
+            updated_at=now,
+        )
+        for pk in implemented:
+            results[pk]['status'] = 'implemented'
+
+        # Bulk writes skip the ClubMember signals that drop cached scopes and the directory
+        affected = {m.user_id for m, _, _ in roster.history}
+        if affected:
+            transaction.on_commit(lambda: invalidate_reviewer_scopes(affected))
+            transaction.on_commit(invalidate_club_directory)
+
+    return results
@@ -137,16 +137,12 @@ def pending_faculty_club_applications_view(request):
     Only accessible by faculty members.
     """
     try:
-        from .models import ClubApplication, ClubMember
+        from .models import ClubApplication
+        from .reviewer_scope import get_reviewer_scope
         
         # Check if user is faculty - must be a faculty member of at least one club
-        faculty_memberships = ClubMember.objects.filter(
-            user=request.user,
-            role='faculty',
-            status='active'
-        ).values_list('club_id', flat=True)
-        
-        if not faculty_memberships:
+        scope = get_reviewer_scope(request)
+        if not scope.is_faculty:
             return Response({
                 'error': 'Access denied. Faculty role required.'
             }, status=status.HTTP_403_FORBIDDEN)
@@ -154,7 +150,7 @@ def pending_faculty_club_applications_view(request):
         # Get club applications pending faculty approval for faculty's clubs only
         applications = ClubApplication.objects.filter(
             status='pending_faculty',
-            club_id__in=faculty_memberships
+            club_id__in=scope.faculty_club_ids
         ).select_related('club', 'submitted_by').order_by('-priority', '-created_at')
         
         applications_data = []
@@ -206,23 +202,24 @@ def faculty_approve_club_application_view(request, application_id):
     Changes status from 'pending_faculty' to 'pending_admin'.
     """
     try:
-        from .models import ClubApplication, UniversityProfile
+        from .models import ClubApplication
+        from .reviewer_scope import get_reviewer_scope
         from django.utils import timezone
         
-        # Check if user is faculty
-        try:
-            profile = UniversityProfile.objects.get(user=request.user)
-            if profile.user_role != 'faculty':
-                return Response({
-                    'error': 'Access denied. Faculty role required.'
-                }, status=status.HTTP_403_FORBIDDEN)
-        except UniversityProfile.DoesNotExist:
+        # Check if user is faculty of the application's club
+        scope = get_reviewer_scope(request)
+        if not scope.is_faculty:
             return Response({
-                'error': 'User profile not found'
-            }, status=status.HTTP_404_NOT_FOUND)
+                'error': 'Access denied. Faculty role required.'
+            }, status=status.HTTP_403_FORBIDDEN)
         
         application = ClubApplication.objects.get(id=application_id)
         
+        if not scope.is_faculty_of(application.club_id):
+            return Response({
+                'error': 'Access denied. You can only review applications from your clubs.'
+            }, status=status.HTTP_403_FORBIDDEN)
+        
         if application.status != 'pending_faculty':
             return Response({
                 'error': f'Application is not pending faculty approval. Current status: {application.get_status_display()}'
@@ -254,22 +251,23 @@ def faculty_reject_club_application_view(request, application_id):
     Faculty rejects a club application.
     """
     try:
-        from .models import ClubApplication, UniversityProfile
+        from .models import ClubApplication
+        from .reviewer_scope import get_reviewer_scope
         
-        # Check if user is faculty
-        try:
-            profile = UniversityProfile.objects.get(user=request.user)
-            if profile.user_role != 'faculty':
-                return Response({
-                    'error': 'Access denied. Faculty role required.'
-                }, status=status.HTTP_403_FORBIDDEN)
-        except UniversityProfile.DoesNotExist:
+        # Check if user is faculty of the application's club
+        scope = get_reviewer_scope(request)
+        if not scope.is_faculty:
             return Response({
-                'error': 'User profile not found'
-            }, status=status.HTTP_404_NOT_FOUND)
+                'error': 'Access denied. Faculty role required.'
+            }, status=status.HTTP_403_FORBIDDEN)
         
         application = ClubApplication.objects.get(id=application_id)
         
+        if not scope.is_faculty_of(application.club_id):
+            return Response({
+                'error': 'Access denied. You can only review applications from your clubs.'
+            }, status=status.HTTP_403_FORBIDDEN)
+        
         if application.status != 'pending_faculty':
             return Response({
                 'error': f'Application is not pending faculty approval. Current status: {application.get_status_display()}'
@@ -302,23 +300,87 @@ def faculty_reject_club_application_view(request, application_id):
 @permission_classes([IsAuthenticated])
 def pending_admin_club_applications_view(request):
     """
-    Get all club applications pending admin approval.
+    Get club applications pending admin approval, highest priority and newest first.
     Only accessible by admin users.
+    Keyset-paginated: pass the returned next_cursor as ?cursor= for the next page.
     """
     try:
+        from .models import ClubApplication
+        from .pagination import InvalidCursor, keyset_paginate, parse_page_size
+        from .reviewer_scope import get_reviewer_scope
+        
         # Check if user is admin using AdminUser.role
-        if not hasattr(request.user, 'role') or request.user.role != 'admin':
+        if not get_reviewer_scope(request).is_admin:
             return Response({
                 'error': 'Access denied. Admin role required.'
             }, status=status.HTTP_403_FORBIDDEN)
         
-        # TODO: ClubApplication table needs migration
-        # For now, return empty list until migrations are run
-        return Response({'pending_applications': []})
+        applications = ClubApplication.objects.filter(
+            status='pending_admin'
+        ).select_related('club', 'submitted_by', 'faculty_reviewed_by')
+        
+        application_type = request.query_params.get('type')
+        if application_type and application_type != 'all':
+            applications = applications.filter(application_type=application_type)
+        
+        try:
+            page_size = parse_page_size(request.query_params.get('page_size'))
+            page, next_cursor = keyset_paginate(
+                applications,
+                ['-priority', '-created_at', '-id'],
+                cursor=request.query_params.get('cursor'),
+                page_size=page_size,
+            )
+        except InvalidCursor as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        applications_data = []
+        for app in page:
+            submitted_by_data = None
+            if app.submitted_by:
+                submitted_by_data = {
+                    'id': app.submitted_by.id,
+                    'name': f"{app.submitted_by.first_name} {app.submitted_by.last_name}",
+                    'email': app.submitted_by.email,
+                }
+            
+            faculty_data = None
+            if app.faculty_reviewed_by:
+                faculty_data = {
+                    'id': app.faculty_reviewed_by.id,
+                    'name': f"{app.faculty_reviewed_by.first_name} {app.faculty_reviewed_by.last_name}",
+                }
+            
+            applications_data.append({
+                'id': app.id,
+                'application_id': app.application_id,
+                'application_type': app.application_type,
+                'application_type_display': app.get_application_type_display(),
+                'club': {
+                    'id': app.club.id,
+                    'name': app.club.name,
+                },
+                'title': app.title,
+                'description': app.description,
+                'justification': app.justification,
+                'application_data': app.application_data,
+                'expected_impact': app.expected_impact,
+                'submitted_by': submitted_by_data,
+                'faculty_approved_by': faculty_data,
+                'faculty_reviewed_at': app.faculty_reviewed_at.isoformat() if app.faculty_reviewed_at else None,
+                'faculty_comments': app.faculty_comments,
+                'created_at': app.created_at.isoformat(),
+                'deadline': app.deadline.isoformat() if app.deadline else None,
+                'priority': app.priority,
+            })
+        
+        return Response({
+            'pending_applications': applications_data,
+            'next_cursor': next_cursor,
+            'page_size': page_size,
+        })
     
     except Exception as exc:
-        import traceback
-        traceback.print_exc()
         return Response(
             {'error': 'Failed to fetch pending applications', 'details': str(exc)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -334,19 +396,14 @@ def admin_approve_club_application_view(request, application_id):
     Application moves to 'approved' status and can be implemented.
     """
     try:
-        from .models import ClubApplication, UniversityProfile
+        from .models import ClubApplication
+        from .reviewer_scope import get_reviewer_scope
         
         # Check if user is admin
-        try:
-            profile = UniversityProfile.objects.get(user=request.user)
-            if profile.user_role != 'admin':
-                return Response({
-                    'error': 'Access denied. Admin role required.'
-                }, status=status.HTTP_403_FORBIDDEN)
-        except UniversityProfile.DoesNotExist:
+        if not get_reviewer_scope(request).is_admin:
             return Response({
-                'error': 'User profile not found'
-            }, status=status.HTTP_404_NOT_FOUND)
+                'error': 'Access denied. Admin role required.'
+            }, status=status.HTTP_403_FORBIDDEN)
         
         application = ClubApplication.objects.get(id=application_id)
         
@@ -363,10 +420,14 @@ def admin_approve_club_application_view(request, application_id):
         # Auto-implement if requested (for simple applications like member additions)
         if auto_implement:
             implementation_result = implement_club_application(application, request.user)
+            if implementation_result['success']:
+                message = 'Application approved and implemented successfully.'
+            else:
+                message = 'Application approved by admin, but could not be implemented automatically.'
             return Response({
-                'message': 'Application approved and implemented successfully.',
+                'message': message,
                 'application_id': application.application_id,
-                'status': 'implemented',
+                'status': implementation_result['status'],
                 'implementation_result': implementation_result,
             })
         
@@ -393,19 +454,14 @@ def admin_reject_club_application_view(request, application_id):
     Admin rejects a club application.
     """
     try:
-        from .models import ClubApplication, UniversityProfile
+        from .models import ClubApplication
+        from .reviewer_scope import get_reviewer_scope
         
         # Check if user is admin
-        try:
-            profile = UniversityProfile.objects.get(user=request.user)
-            if profile.user_role != 'admin':
-                return Response({
-                    'error': 'Access denied. Admin role required.'
-                }, status=status.HTTP_403_FORBIDDEN)
-        except UniversityProfile.DoesNotExist:
+        if not get_reviewer_scope(request).is_admin:
             return Response({
-                'error': 'User profile not found'
-            }, status=status.HTTP_404_NOT_FOUND)
+                'error': 'Access denied. Admin role required.'
+            }, status=status.HTTP_403_FORBIDDEN)
         
         application = ClubApplication.objects.get(id=application_id)
         
@@ -437,6 +493,122 @@ def admin_reject_club_application_view(request, application_id):
         )
 
 
+def _bulk_review_club_applications(request, approve):
+    from .bulk_actions import BulkActionError, bulk_review_club_applications, parse_bulk_ids
+    from .reviewer_scope import get_reviewer_scope
+    
+    scope = get_reviewer_scope(request)
+    if not scope.is_reviewer:
+        return Response({
+            'error': 'Access denied. Faculty or admin role required.'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        ids = parse_bulk_ids(request.data)
+    except BulkActionError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    reason = request.data.get('rejection_reason', '')
+    if not approve and not reason:
+        return Response({
+            'error': 'Rejection reason is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    result = bulk_review_club_applications(
+        request.user, scope, ids, approve,
+        comments=request.data.get('comments', ''),
+        reason=reason,
+    )
+    stage = 'admin' if scope.is_admin else 'faculty'
+    verb = 'approved' if approve else 'rejected'
+    return Response({
+        'message': f"{len(result['processed'])} application(s) {verb} by {stage}.",
+        **result,
+    })
+
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def bulk_approve_club_applications_view(request):
+    """
+    Approve many club applications at the reviewer's stage.
+    Body: {"ids": [...], "comments": "..."}.
+    """
+    try:
+        return _bulk_review_club_applications(request, approve=True)
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to approve applications', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def bulk_reject_club_applications_view(request):
+    """
+    Reject many club applications at the reviewer's stage.
+    Body: {"ids": [...], "rejection_reason": "..."}.
+    """
+    try:
+        return _bulk_review_club_applications(request, approve=False)
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to reject applications', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def bulk_implement_club_applications_view(request):
+    """
+    Implement many approved club applications in one batch.
+    Body: {"ids": [...], "notes": "..."}. Faculty are limited to their own clubs.
+    """
+    try:
+        from .application_executor import implement_applications
+        from .bulk_actions import BulkActionError, parse_bulk_ids
+        from .reviewer_scope import get_reviewer_scope
+        
+        scope = get_reviewer_scope(request)
+        if not scope.is_reviewer:
+            return Response({
+                'error': 'Access denied. Admin or Faculty role required.'
+            }, status=status.HTTP_403_FORBIDDEN)
+        
+        try:
+            ids = parse_bulk_ids(request.data)
+        except BulkActionError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        results = implement_applications(
+            ids, request.user,
+            notes=request.data.get('notes', ''),
+            include_manual=str(request.data.get('include_manual', '')).lower() in ['true', '1', 'yes'],
+            club_ids=None if scope.is_admin else scope.faculty_club_ids,
+        )
+        
+        processed = [{'id': pk, **results[pk]} for pk in ids if results[pk]['success']]
+        skipped = [
+            {'id': pk, 'reason': results[pk]['message']} for pk in ids if not results[pk]['success']
+        ]
+        return Response({
+            'message': f'{len(processed)} application(s) implemented.',
+            'processed': processed,
+            'skipped': skipped,
+        })
+    
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to implement applications', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 @csrf_exempt
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
@@ -446,31 +618,37 @@ def implement_club_application_view(request, application_id):
     Executes the requested changes (add member, change position, etc.).
     """
     try:
-        from .models import ClubApplication, UniversityProfile
+        from .models import ClubApplication
+        from .reviewer_scope import get_reviewer_scope
         
-        # Check if user is admin or faculty
-        try:
-            profile = UniversityProfile.objects.get(user=request.user)
-            if profile.user_role not in ['admin', 'faculty']:
-                return Response({
-                    'error': 'Access denied. Admin or Faculty role required.'
-                }, status=status.HTTP_403_FORBIDDEN)
-        except UniversityProfile.DoesNotExist:
+        # Check if user is admin or faculty of the application's club
+        scope = get_reviewer_scope(request)
+        if not scope.is_reviewer:
             return Response({
-                'error': 'User profile not found'
-            }, status=status.HTTP_404_NOT_FOUND)
+                'error': 'Access denied. Admin or Faculty role required.'
+            }, status=status.HTTP_403_FORBIDDEN)
         
         application = ClubApplication.objects.get(id=application_id)
         
+        if not scope.can_review_club(application.club_id):
+            return Response({
+                'error': 'Access denied. You can only implement applications from your clubs.'
+            }, status=status.HTTP_403_FORBIDDEN)
+        
         if application.status != 'approved':
             return Response({
                 'error': f'Application must be approved before implementation. Current status: {application.get_status_display()}'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        result = implement_club_application(application, request.user)
-        
         notes = request.data.get('notes', '')
-        application.mark_implemented(request.user, notes)
+        result = implement_club_application(application, request.user, notes, include_manual=True)
+        
+        if not result['success']:
+            return Response({
+                'error': 'Application could not be implemented',
+                'application_id': application.application_id,
+                'result': result,
+            }, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({
             'message': 'Application implemented successfully.',
@@ -488,91 +666,11 @@ def implement_club_application_view(request, application_id):
         )
 
 
-def implement_club_application(application, user):
+def implement_club_application(application, user, notes='', include_manual=False):
     """
-    Helper function to implement the actual changes based on application type.
+    Implement a single approved application through the batch executor.
+    Returns {'success', 'message', 'status'}.
     """
-    from .models import ClubMember, AdminUser
-    from django.utils import timezone
-    
-    result = {'success': False, 'message': ''}
-    
-    try:
-        if application.application_type == 'member_addition':
-            # Add new member to club
-            data = application.application_data
-            target_user = AdminUser.objects.get(id=data.get('target_user_id'))
-            position = data.get('proposed_position', 'member')
-            
-            # Check if already a member
-            existing = ClubMember.objects.filter(
-                club=application.club,
-                user=target_user
-            ).first()
-            
-            if existing and existing.status == 'active':
-                result['message'] = 'User is already an active member'
-            else:
-                if existing:
-                    # Reactivate
-                    existing.status = 'active'
-                    existing.position = position
-                    existing.approved_at = timezone.now()
-                    existing.approved_by = user
-                    existing.save()
-                else:
-                    # Create new membership
-                    ClubMember.objects.create(
-                        club=application.club,
-                        user=target_user,
-                        position=position,
-                        status='active',
-                        approved_at=timezone.now(),
-                        approved_by=user
-                    )
-                result['success'] = True
-                result['message'] = f'Successfully added {target_user.username} as {position}'
-        
-        elif application.application_type == 'position_change':
-            # Change member position
-            data = application.application_data
-            target_user = AdminUser.objects.get(id=data.get('user_id'))
-            new_position = data.get('new_position')
-            
-            member = ClubMember.objects.get(
-                club=application.club,
-                user=target_user,
-                status='active'
-            )
-            
-            old_position = member.position
-            member.position = new_position
-            member.save()
-            
-            result['success'] = True
-            result['message'] = f'Changed {target_user.username} from {old_position} to {new_position}'
-        
-        elif application.application_type == 'member_removal':
-            # Remove member from club
-            data = application.application_data
-            target_user = AdminUser.objects.get(id=data.get('target_user_id'))
-            
-            member = ClubMember.objects.get(
-                club=application.club,
-                user=target_user
-            )
-            
-            member.status = 'removed'
-            member.save()
-            
-            result['success'] = True
-            result['message'] = f'Successfully removed {target_user.username} from club'
-        
-        else:
-            result['message'] = f'Implementation not automated for {application.get_application_type_display()}. Manual action required.'
-    
-    except Exception as e:
-        result['success'] = False
-        result['message'] = f'Implementation failed: {str(e)}'
+    from .application_executor import implement_applications
     
-    return result
+    return implement_applications([application.id], user, notes, include_manual)[application.id]
@@ -0,0 +1,258 @@
+"""
+Approval SLA Metrics
+Time spent in each review stage, reviewer throughput and backlog age, derived
+from the review timestamps on Event, ClubApplication and ApprovalRequest (and
+the 'submitted' EventLog entry). Percentiles use CUME_DIST() window functions
+and the results are written to ApprovalStageMetric / ApprovalReviewerMetric,
+so the dashboard reads a handful of precomputed rows.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+
+PERCENTILES = [50, 90, 95]
+
+
+def _seconds_between(start, end):
+    """SQL for the number of seconds from `start` to `end`."""
+    if connection.vendor == 'sqlite':
+        return f"((julianday({end}) - julianday({start})) * 86400.0)"
+    return f"EXTRACT(EPOCH FROM ({end} - {start}))"
+
+
+def _hours_between(start, end):
+    return f"({_seconds_between(start, end)} / 3600.0)"
+
+
+def _table(model):
+    return connection.ops.quote_name(model._meta.db_table)
+
+
+def _interval_branches(now, since, include_pending=True):
+    """
+    (sql, params) pieces of a UNION ALL with one row per review interval:
+    item_type, stage, reviewer_id, left_at, outcome, is_pending, hours.
+    Completed intervals are limited to those that ended after `since`;
+    pending intervals are measured up to `now`.
+    """
+    from .models import ApprovalRequest, ClubApplication, Event, EventLog
+
+    event = _table(Event)
+    event_log = _table(EventLog)
+    application = _table(ClubApplication)
+    approval = _table(ApprovalRequest)
+
+    submitted = f"""
+        LEFT JOIN (
+            SELECT event_id, MIN(timestamp) AS submitted_at
+            FROM {event_log}
+            WHERE action = 'submitted'
+            GROUP BY event_id
+        ) s ON s.event_id = e.id
+    """
+    event_entered = 'COALESCE(s.submitted_at, e.created_at)'
+    event_admin_entered = 'COALESCE(e.faculty_approved_at, e.created_at)'
+    application_admin_entered = 'COALESCE(a.faculty_reviewed_at, a.created_at)'
+
+    def completed(item_type, stage, table, alias, join, reviewer, entered, left, rejected_when):
+        sql = f"""
+            SELECT '{item_type}' AS item_type, '{stage}' AS stage, {reviewer} AS reviewer_id,
+                   {left} AS left_at,
+                   CASE WHEN {rejected_when} THEN 'rejected' ELSE 'approved' END AS outcome,
+                   0 AS is_pending,
+                   {_hours_between(entered, left)} AS hours
+            FROM {table} {alias} {join}
+            WHERE {left} IS NOT NULL AND {left} >= %s
+        """
+        return sql, [since]
+
+    def pending(item_type, stage, table, alias, join, entered, status_sql):
+        sql = f"""
+            SELECT '{item_type}', '{stage}', NULL, NULL, NULL, 1,
+                   {_hours_between(entered, '%s')}
+            FROM {table} {alias} {join}
+            WHERE {alias}.status {status_sql}
+        """
+        return sql, [now]
+
+    branches = [
+        completed('event', 'faculty', event, 'e', submitted, 'e.faculty_approved_by_id',
+                  event_entered, 'e.faculty_approved_at', "e.status = 'faculty_rejected'"),
+        completed('event', 'admin', event, 'e', '', 'e.admin_approved_by_id',
+                  event_admin_entered, 'e.admin_approved_at', "e.status = 'admin_rejected'"),
+        completed('club_application', 'faculty', application, 'a', '', 'a.faculty_reviewed_by_id',
+                  'a.created_at', 'a.faculty_reviewed_at', "a.status = 'faculty_rejected'"),
+        completed('club_application', 'admin', application, 'a', '', 'a.admin_reviewed_by_id',
+                  application_admin_entered, 'a.admin_reviewed_at', "a.status = 'admin_rejected'"),
+        completed('approval', 'review', approval, 'r', '', 'COALESCE(r.approved_by_id, r.rejected_by_id)',
+                  'r.created_at', 'r.reviewed_at', "r.status = 'rejected'"),
+    ]
+    if include_pending:
+        branches += [
+            pending('event', 'faculty', event, 'e', submitted, event_entered, "= 'pending_faculty_approval'"),
+            pending('event', 'admin', event, 'e', '', event_admin_entered, "= 'pending_admin_approval'"),
+            pending('club_application', 'faculty', application, 'a', '', 'a.created_at', "= 'pending_faculty'"),
+            pending('club_application', 'admin', application, 'a', '', application_admin_entered, "= 'pending_admin'"),
+            pending('approval', 'review', approval, 'r', '', 'r.created_at', "IN ('pending', 'under_review')"),
+        ]
+    return branches
+
+
+def _union(branches):
+    sql = ' UNION ALL '.join(b[0] for b in branches)
+    params = [p for b in branches for p in b[1]]
+    return sql, params
+
+
+def _percentile_columns(prefix_filter=''):
+    return ',\n'.join(
+        f"MIN(CASE WHEN {prefix_filter}cd >= {p / 100} THEN hours END)" for p in PERCENTILES
+    )
+
+
+def refresh_approval_metrics(window_days=None, sla_hours=None):
+    """
+    Rebuild both summary tables. Returns (stage_rows, reviewer_rows).
+    """
+    from .models import ApprovalReviewerMetric, ApprovalStageMetric
+
+    window_days = window_days or settings.APPROVAL_METRICS_WINDOW_DAYS
+    sla_hours = sla_hours or settings.APPROVAL_SLA_HOURS
+
+    now = timezone.now()
+    adapt = connection.ops.adapt_datetimefield_value
+    db_now = adapt(now)
+    db_since = adapt(now - timedelta(days=window_days))
+
+    intervals, interval_params = _union(_interval_branches(db_now, db_since))
+    completed, completed_params = _union(_interval_branches(db_now, db_since, include_pending=False))
+
+    stage_sql = f"""
+        INSERT INTO {_table(ApprovalStageMetric)} (
+            item_type, stage, completed_count, approved_count, rejected_count,
+            avg_hours, p50_hours, p90_hours, p95_hours, max_hours,
+            pending_count, pending_p50_hours, pending_oldest_hours, pending_over_sla,
+            refreshed_at
+        )
+        SELECT
+            item_type,
+            stage,
+            SUM(1 - is_pending),
+            SUM(CASE WHEN outcome = 'approved' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN outcome = 'rejected' THEN 1 ELSE 0 END),
+            AVG(CASE WHEN is_pending = 0 THEN hours END),
+            {_percentile_columns('is_pending = 0 AND ')},
+            MAX(CASE WHEN is_pending = 0 THEN hours END),
+            SUM(is_pending),
+            MIN(CASE WHEN is_pending = 1 AND cd >= 0.5 THEN hours END),
+            MAX(CASE WHEN is_pending = 1 THEN hours END),
+            SUM(CASE WHEN is_pending = 1 AND hours > %s THEN 1 ELSE 0 END),
+            %s
+        FROM (
+            SELECT
+                intervals.*,
+                CUME_DIST() OVER (PARTITION BY item_type, stage, is_pending ORDER BY hours) AS cd
+            FROM ({intervals}) AS intervals
+        ) AS ranked
+        GROUP BY item_type, stage
+    """
+
+    reviewer_sql = f"""
+        INSERT INTO {_table(ApprovalReviewerMetric)} (
+            reviewer_id, item_type, stage, decisions, approved_count, rejected_count,
+            p50_hours, last_decision_at, refreshed_at
+        )
+        SELECT
+            reviewer_id,
+            item_type,
+            stage,
+            COUNT(*),
+            SUM(CASE WHEN outcome = 'approved' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN outcome = 'rejected' THEN 1 ELSE 0 END),
+            MIN(CASE WHEN cd >= 0.5 THEN hours END),
+            MAX(left_at),
+            %s
+        FROM (
+            SELECT
+                intervals.*,
+                CUME_DIST() OVER (PARTITION BY reviewer_id, item_type, stage ORDER BY hours) AS cd
+            FROM ({completed}) AS intervals
+            WHERE reviewer_id IS NOT NULL
+        ) AS ranked
+        GROUP BY reviewer_id, item_type, stage
+    """
+
+    with transaction.atomic():
+        ApprovalStageMetric.objects.all().delete()
+        ApprovalReviewerMetric.objects.all().delete()
+        with connection.cursor() as cursor:
+            cursor.execute(stage_sql, [sla_hours, db_now, *interval_params])
+            stage_rows = cursor.rowcount
+            cursor.execute(reviewer_sql, [db_now, *completed_params])
+            reviewer_rows = cursor.rowcount
+    return stage_rows, reviewer_rows
+
+
+def _round(value):
+    return round(value, 2) if value is not None else None
+
+
+def approval_metrics_payload():
+    """Dashboard payload built from the summary tables (refreshing them if never built)."""
+    from .models import ApprovalReviewerMetric, ApprovalStageMetric
+
+    stages = list(ApprovalStageMetric.objects.all())
+    if not stages:
+        refresh_approval_metrics()
+        stages = list(ApprovalStageMetric.objects.all())
+
+    reviewers = ApprovalReviewerMetric.objects.select_related('reviewer')
+
+    return {
+        'stages': [
+            {
+                'item_type': m.item_type,
+                'stage': m.stage,
+                'completed': m.completed_count,
+                'approved': m.approved_count,
+                'rejected': m.rejected_count,
+                'latency_hours': {
+                    'avg': _round(m.avg_hours),
+                    'p50': _round(m.p50_hours),
+                    'p90': _round(m.p90_hours),
+                    'p95': _round(m.p95_hours),
+                    'max': _round(m.max_hours),
+                },
+                'backlog': {
+                    'pending': m.pending_count,
+                    'p50_age_hours': _round(m.pending_p50_hours),
+                    'oldest_age_hours': _round(m.pending_oldest_hours),
+                    'over_sla': m.pending_over_sla,
+                },
+            }
+            for m in stages
+        ],
+        'reviewers': [
+            {
+                'reviewer': {
+                    'id': m.reviewer_id,
+                    'name': f"{m.reviewer.first_name} {m.reviewer.last_name}".strip() or m.reviewer.username,
+                },
+                'item_type': m.item_type,
+                'stage': m.stage,
+                'decisions': m.decisions,
+                'approved': m.approved_count,
+                'rejected': m.rejected_count,
+                'p50_hours': _round(m.p50_hours),
+                'last_decision_at': m.last_decision_at.isoformat() if m.last_decision_at else None,
+            }
+            for m in reviewers
+        ],
+        'window_days': settings.APPROVAL_METRICS_WINDOW_DAYS,
+        'sla_hours': settings.APPROVAL_SLA_HOURS,
+        'refreshed_at': stages[0].refreshed_at.isoformat() if stages else None,
+    }
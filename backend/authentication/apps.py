@@ -7,8 +7,10 @@ class AuthenticationConfig(AppConfig):
     
     def ready(self):
         """
-        Called when Django starts - ensure admin user exists
+        Called when Django starts - connect signal handlers and ensure admin user exists
         """
+        from . import checks, signals  # noqa: F401
+        
         # Only run once, not in reloader
         import os
         import sys
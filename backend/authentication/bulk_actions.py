@@ -0,0 +1,201 @@
+"""
+Bulk Review Actions
+Approve or reject many events, club applications or approval requests at once.
+Each batch locks and scope-checks its targets in one query, moves them with a
+single filtered UPDATE and writes EventLog/ApprovalHistory rows with
+bulk_create, all in one transaction.
+"""
+
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+
+from .caching import bump_generation
+from .inbox import (
+    APPROVAL_PENDING_STATUSES, ITEM_APPROVAL, ITEM_CLUB_APPLICATION, ITEM_EVENT, pending_querysets
+)
+from .reports import BUDGET_REPORT_NAMESPACE
+
+
+BULK_ACTION_MAX_ITEMS = 200
+
+
+class BulkActionError(ValueError):
+    """Invalid bulk action payload."""
+
+
+def parse_bulk_ids(data):
+    """Validate the 'ids' list of a bulk action request, keeping order and dropping duplicates."""
+    ids = data.get('ids')
+    if not isinstance(ids, list) or not ids:
+        raise BulkActionError('ids must be a non-empty list')
+    if len(ids) > BULK_ACTION_MAX_ITEMS:
+        raise BulkActionError(f'At most {BULK_ACTION_MAX_ITEMS} items can be processed at once')
+    try:
+        parsed = [int(pk) for pk in ids]
+    except (TypeError, ValueError):
+        raise BulkActionError('ids must be integers')
+    return list(dict.fromkeys(parsed))
+
+
+def _lock_targets(model, pending, ids, fields=()):
+    """
+    Lock the requested rows and flag which of them are pending this reviewer,
+    in one query.
+    """
+    rows = model.objects.select_for_update(of=('self',)).filter(id__in=ids).annotate(
+        reviewable=Exists(pending.filter(pk=OuterRef('pk')))
+    ).values('id', 'status', 'reviewable', *fields)
+    found = {row['id']: row for row in rows}
+
+    targets, skipped = [], []
+    for pk in ids:
+        row = found.get(pk)
+        if row is None:
+            skipped.append({'id': pk, 'reason': 'Not found'})
+        elif not row['reviewable']:
+            skipped.append({'id': pk, 'reason': f"Not pending your review (status: {row['status']})"})
+        else:
+            targets.append(row)
+    return targets, skipped
+
+
+def bulk_review_events(user, scope, ids, approve, reason=''):
+    """Faculty or admin stage approval/rejection of event applications."""
+    from .models import Event, EventLog
+
+    stage = 'admin' if scope.is_admin else 'faculty'
+    from_status = 'pending_admin_approval' if scope.is_admin else 'pending_faculty_approval'
+    now = timezone.now()
+
+    if stage == 'faculty':
+        changes = {'faculty_approved_by': user, 'faculty_approved_at': now}
+        if approve:
+            changes['status'] = 'pending_admin_approval'
+        else:
+            changes.update(status='faculty_rejected', faculty_rejection_reason=reason)
+    else:
+        changes = {'admin_approved_by': user, 'admin_approved_at': now}
+        if approve:
+            changes.update(
+                status='approved',
+                approved_by=user,  # Legacy field
+                approved_at=now,
+                approved_budget=F('estimated_budget'),
+            )
+        else:
+            changes.update(status='admin_rejected', admin_rejection_reason=reason)
+
+    with transaction.atomic():
+        targets, skipped = _lock_targets(
+            Event, pending_querysets(scope)[ITEM_EVENT], ids, ['event_id', 'estimated_budget']
+        )
+        target_ids = [row['id'] for row in targets]
+        Event.objects.filter(id__in=target_ids, status=from_status).update(updated_at=now, **changes)
+
+        logs = []
+        for row in targets:
+            metadata = {'approval_stage': stage, 'bulk': True}
+            if approve:
+                description = f'Event application approved by {stage}'
+                if stage == 'admin':
+                    description += '. Event is now active.'
+                    metadata['approved_budget'] = str(row['estimated_budget'])
+            else:
+                description = f'Event application rejected by {stage}: {reason}'
+            logs.append(EventLog(
+                event_id=row['id'],
+                action='approved' if approve else 'rejected',
+                performed_by=user,
+                description=description,
+                metadata=metadata,
+            ))
+        EventLog.objects.bulk_create(logs)
+
+        if target_ids:
+            # update() skips the post_save receivers that invalidate the report
+            transaction.on_commit(lambda: bump_generation(BUDGET_REPORT_NAMESPACE))
+
+    return {
+        'processed': [
+            {'id': row['id'], 'event_id': row['event_id'], 'status': changes['status']}
+            for row in targets
+        ],
+        'skipped': skipped,
+    }
+
+
+def bulk_review_club_applications(user, scope, ids, approve, comments='', reason=''):
+    """Faculty or admin stage approval/rejection of club applications."""
+    from .models import ClubApplication
+
+    now = timezone.now()
+    if scope.is_admin:
+        from_status = 'pending_admin'
+        changes = {'admin_reviewed_by': user, 'admin_reviewed_at': now}
+        if approve:
+            changes.update(status='approved', admin_comments=comments)
+        else:
+            changes.update(status='admin_rejected', admin_rejection_reason=reason)
+    else:
+        from_status = 'pending_faculty'
+        changes = {'faculty_reviewed_by': user, 'faculty_reviewed_at': now}
+        if approve:
+            changes.update(status='pending_admin', faculty_comments=comments)
+        else:
+            changes.update(status='faculty_rejected', faculty_rejection_reason=reason)
+
+    with transaction.atomic():
+        targets, skipped = _lock_targets(
+            ClubApplication, pending_querysets(scope)[ITEM_CLUB_APPLICATION], ids, ['application_id']
+        )
+        ClubApplication.objects.filter(
+            id__in=[row['id'] for row in targets], status=from_status
+        ).update(updated_at=now, **changes)
+
+    return {
+        'processed': [
+            {'id': row['id'], 'application_id': row['application_id'], 'status': changes['status']}
+            for row in targets
+        ],
+        'skipped': skipped,
+    }
+
+
+def bulk_review_approval_requests(user, scope, ids, approve, comment='', reason='', admin_notes=None):
+    """Approve or reject approval requests and record ApprovalHistory for each."""
+    from .models import ApprovalHistory, ApprovalRequest
+
+    now = timezone.now()
+    if approve:
+        changes = {'status': 'approved', 'approved_by': user, 'reviewed_at': now}
+        history_comment = comment or 'Request approved'
+    else:
+        changes = {'status': 'rejected', 'rejected_by': user, 'reviewed_at': now, 'rejection_reason': reason}
+        history_comment = f'Request rejected: {reason}'
+    if admin_notes is not None:
+        changes['admin_notes'] = admin_notes
+
+    with transaction.atomic():
+        targets, skipped = _lock_targets(ApprovalRequest, pending_querysets(scope)[ITEM_APPROVAL], ids)
+        ApprovalRequest.objects.filter(
+            id__in=[row['id'] for row in targets], status__in=APPROVAL_PENDING_STATUSES
+        ).update(updated_at=now, **changes)
+
+        ApprovalHistory.objects.bulk_create([
+            ApprovalHistory(
+                approval_request_id=row['id'],
+                action=changes['status'],
+                performed_by=user,
+                field_changed='status',
+                old_value=row['status'],
+                new_value=changes['status'],
+                comment=history_comment,
+            )
+            for row in targets
+        ])
+
+    return {
+        'processed': [{'id': row['id'], 'status': changes['status']} for row in targets],
+        'skipped': skipped,
+    }
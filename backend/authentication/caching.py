@@ -0,0 +1,45 @@
+"""
+Cache helpers.
+Generation-based invalidation: cached values embed a namespace generation in
+their key, and writes bump the generation instead of deleting keys one by one.
+Stale entries simply stop being read and expire on their own.
+"""
+
+import time
+
+from django.core.cache import cache
+
+
+def _generation_key(namespace):
+    return f"cachegen:{namespace}"
+
+
+def _fresh_generation():
+    # Time-based so a generation evicted from the cache is never reused
+    return time.time_ns() // 1000
+
+
+def get_generation(namespace):
+    """Current generation number for a cache namespace."""
+    key = _generation_key(namespace)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, _fresh_generation(), timeout=None)
+        generation = cache.get(key) or _fresh_generation()
+    return generation
+
+
+def bump_generation(namespace):
+    """Invalidate every cached value in a namespace."""
+    key = _generation_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key missing (first write or evicted) - start a fresh generation
+        cache.set(key, _fresh_generation(), timeout=None)
+
+
+def generational_key(namespace, *parts):
+    """Build a cache key that is tied to the namespace's current generation."""
+    suffix = ':'.join(str(p) for p in parts)
+    return f"{namespace}:g{get_generation(namespace)}:{suffix}"
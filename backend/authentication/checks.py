@@ -0,0 +1,39 @@
+"""
+System checks for deployment settings the app relies on.
+Registered in AuthenticationConfig.ready().
+"""
+
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+
+# Backends whose entries are only visible to the process that wrote them
+PROCESS_LOCAL_CACHES = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    Cache generations (club directory, budget report, university profile) are
+    bumped by whichever process writes, including process_jobs and
+    provision_users, so every process must share one cache outside DEBUG.
+    """
+    if settings.DEBUG:
+        return []
+    backend = settings.CACHES.get('default', {}).get('BACKEND')
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Warning(
+            f'The default cache ({backend}) is per-process.',
+            hint=(
+                'Invalidations made by the job worker and management commands will not '
+                'reach the web workers. Set CACHE_BACKEND/CACHE_LOCATION to a shared cache '
+                '(e.g. django.core.cache.backends.redis.RedisCache).'
+            ),
+            id='authentication.W001',
+        )
+    ]
@@ -0,0 +1,62 @@
+"""
+Public Club Directory
+The club list shown on the login page. Built from one annotated query and
+cached as a ready-to-send JSON body with its ETag; Club and ClubMember writes
+bump the namespace generation so the next request rebuilds it.
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from rest_framework.utils.encoders import JSONEncoder
+
+from .caching import bump_generation, generational_key
+
+
+CLUB_DIRECTORY_NAMESPACE = 'club_directory'
+
+
+def build_club_directory():
+    """Every club with its active member count, ordered by name."""
+    from .models import Club
+
+    # Mentor email and department live on the mentor's user record
+    clubs = Club.objects.annotate(
+        member_count=Count('members', filter=Q(members__status='active'))
+    ).order_by('name').values(
+        'id', 'name', 'club_number', 'faculty_mentor_name', 'faculty_mentor__email',
+        'faculty_mentor__department', 'member_count', 'created_at',
+    )
+    return [
+        {
+            'id': club['id'],
+            'name': club['name'],
+            'club_number': club['club_number'],
+            'description': '',  # Club model doesn't have description field
+            'domain': 'general',  # Club model doesn't have domain field yet
+            'faculty_mentor_name': club['faculty_mentor_name'] or '',
+            'faculty_mentor_email': club['faculty_mentor__email'] or '',
+            'department': club['faculty_mentor__department'] or '',
+            'member_count': club['member_count'],
+            'created_at': club['created_at'],
+        }
+        for club in clubs
+    ]
+
+
+def club_directory_blob():
+    """(json_bytes, etag) for the directory, rebuilt only after a club or membership change."""
+    key = generational_key(CLUB_DIRECTORY_NAMESPACE, 'all')
+    blob = cache.get(key)
+    if blob is None:
+        body = json.dumps(build_club_directory(), cls=JSONEncoder).encode('utf-8')
+        blob = (body, f'"{hashlib.md5(body).hexdigest()}"')
+        cache.set(key, blob, getattr(settings, 'CLUB_DIRECTORY_CACHE_TTL', 3600))
+    return blob
+
+
+def invalidate_club_directory():
+    bump_generation(CLUB_DIRECTORY_NAMESPACE)
@@ -0,0 +1,126 @@
+"""
+Club Setup Jobs
+Side effects of creating a club, run on the background job queue: the
+declaration PDF (rendered and saved to object storage; skipped when only
+local storage is available), then one notification job per member that
+issues a password and emails the declaration link.
+"""
+
+import secrets
+from io import BytesIO
+
+from django.conf import settings
+
+from .jobs import enqueue
+from .presigned_urls import presign_object_url
+from .storage import get_storage
+
+
+def enqueue_club_setup(club, members, created_by):
+    """
+    Queue the declaration job for a new club; it queues the notifications.
+    `members` is a list of {'user_id', 'name', 'role'}. Returns the job handle.
+    """
+    job = enqueue(
+        'club_declaration',
+        {'club_id': club.id, 'members': members},
+        created_by=created_by,
+    )
+    return job.handle
+
+
+def render_declaration(club):
+    """Declaration of Inclusion for a club, as PDF bytes."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=A4)
+    p.setFont("Helvetica-Bold", 16)
+    p.drawString(72, 800, "Declaration of Inclusion")
+    p.setFont("Helvetica", 12)
+    p.drawString(72, 770, f"Club: {club.name} ({club.club_number})")
+    p.drawString(72, 750, f"Issued On: {club.created_at.strftime('%Y-%m-%d')}")
+    p.drawString(72, 730, "Members:")
+    y = 710
+    for m in club.members.select_related('user'):
+        text = f"- {m.user.username} ({m.user.email}) - {m.role.title()}"
+        p.drawString(90, y, text)
+        y -= 18
+        if y < 100:
+            p.showPage()
+            y = 800
+    p.showPage()
+    p.save()
+    return buffer.getvalue()
+
+
+def _enqueue_notifications(job):
+    for member in job.payload.get('members', []):
+        enqueue(
+            'club_member_notification',
+            {'club_id': job.payload['club_id'], **member},
+            handle=job.handle,
+            created_by=job.created_by,
+        )
+
+
+def build_declaration(job):
+    """Render and upload the declaration PDF, then queue the member notifications."""
+    from .models import Club
+
+    club = Club.objects.get(id=job.payload['club_id'])
+    result = {}
+
+    storage = get_storage()
+    if storage.name == 'local':
+        # A worker's local file has no URL members or the separately hosted
+        # frontend can open, so the declaration waits for object storage
+        result['declaration_url'] = None
+        result['skipped'] = 'Object storage is not configured'
+    else:
+        key = f"clubs/{club.club_number}/declaration_{club.club_number}.pdf"
+        club.declaration_url = storage.save(key, render_declaration(club), 'application/pdf')
+        club.save(update_fields=['declaration_url', 'updated_at'])
+        result['declaration_url'] = club.declaration_url
+
+    _enqueue_notifications(job)
+    return result
+
+
+def declaration_failed(job):
+    """Members still get their credentials when the declaration cannot be built."""
+    _enqueue_notifications(job)
+
+
+def notify_member(job):
+    """Issue a fresh password to one member and email it with the declaration link."""
+    from django.core.mail import send_mail
+    from .models import AdminUser, Club
+
+    club = Club.objects.get(id=job.payload['club_id'])
+    user = AdminUser.objects.get(id=job.payload['user_id'])
+
+    # Rolled back with the job if the email fails, so the sent password is always current
+    password = secrets.token_urlsafe(10)
+    user.set_password(password)
+    user.save(update_fields=['password'])
+
+    declaration_url = presign_object_url(club.declaration_url, tier='week')
+    role_label = job.payload['role'].replace('_', ' ').title()
+    member_name = job.payload.get('name') or user.username
+    body = (
+        f"Hello {member_name},\n\n"
+        f"You have been added to the club '{club.name}' as {role_label}.\n"
+        f"Login credentials:\nUsername: {user.username}\nPassword: {password}\n\n"
+        f"Declaration link: {declaration_url or 'TBD'}\n\n"
+        "Regards, CAMPUSPHERE"
+    )
+    send_mail(
+        subject=f"{club.name} Club Membership",
+        message=body,
+        from_email=getattr(settings, 'DEFAULT_FROM_EMAIL', 'no-reply@campusphere.local'),
+        recipient_list=[user.email],
+        fail_silently=False,
+    )
+    return {'email': user.email}
@@ -3,15 +3,18 @@ Event Management Views
 Comprehensive API endpoints for event browsing, registration, attendance tracking, and expense management.
 """
 
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from django.conf import settings
 from django.views.decorators.csrf import csrf_exempt
+from .stateless_auth import StatelessJWTAuthentication
+from .image_derivatives import image_urls, thumbnail_urls, variant_maps
 
 
 @api_view(['GET'])
+@authentication_classes([StatelessJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def events_list_view(request):
     """
@@ -60,7 +63,8 @@ def events_list_view(request):
                 Q(event_type__icontains=search)
             )
         
-        events = events.distinct().order_by('-start_date')[:100]
+        events = list(events.distinct().order_by('-start_date')[:100])
+        poster_thumbnails = thumbnail_urls([event.poster_url for event in events])
         
         events_data = []
         for event in events:
@@ -83,6 +87,7 @@ def events_list_view(request):
                 'is_online': event.is_online,
                 'online_meeting_link': event.online_meeting_link if event.is_online else None,
                 'poster_url': event.poster_url,
+                'poster_thumbnail_url': poster_thumbnails.get(event.poster_url, ''),
                 'requires_registration': event.requires_registration,
                 'registration_fee': float(event.registration_fee) if event.registration_fee else 0,
                 'max_participants': event.max_participants,
@@ -104,6 +109,7 @@ def events_list_view(request):
 
 
 @api_view(['GET'])
+@authentication_classes([StatelessJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def event_detail_view(request, event_id):
     """Get detailed information about a specific event."""
@@ -113,10 +119,10 @@ def event_detail_view(request, event_id):
         event = Event.objects.select_related('primary_club', 'primary_coordinator').prefetch_related('collaborating_clubs').get(id=event_id)
         
         # Check if user is registered
-        is_registered = EventRegistration.objects.filter(event=event, user=request.user).exists()
+        reg = EventRegistration.objects.filter(event=event, user_id=request.user.id).first()
+        is_registered = reg is not None
         user_registration = None
         if is_registered:
-            reg = EventRegistration.objects.get(event=event, user=request.user)
             user_registration = {
                 'registration_number': reg.registration_number,
                 'status': reg.status,
@@ -157,6 +163,7 @@ def event_detail_view(request, event_id):
             'poster_url': event.poster_url,
             'banner_url': event.banner_url,
             'gallery_urls': event.gallery_urls,
+            'image_variants': variant_maps(image_urls(event)),
             'status': event.status,
             'registration_open': event.registration_open,
             'is_past': event.is_past,
@@ -200,6 +207,9 @@ def event_registrations_view(request):
                 user=request.user
             ).select_related('event', 'event__primary_club').order_by('-registered_at')
             
+            registrations = list(registrations)
+            poster_thumbnails = thumbnail_urls([reg.event.poster_url for reg in registrations])
+            
             reg_data = []
             for reg in registrations:
                 reg_data.append({
@@ -213,6 +223,7 @@ def event_registrations_view(request):
                         'end_date': reg.event.end_date,
                         'venue': reg.event.venue,
                         'poster_url': reg.event.poster_url,
+                        'poster_thumbnail_url': poster_thumbnails.get(reg.event.poster_url, ''),
                         'is_past': reg.event.is_past,
                         'is_upcoming': reg.event.is_upcoming,
                         'is_ongoing': reg.event.is_ongoing,
@@ -300,6 +311,7 @@ def event_registrations_view(request):
 
 
 @api_view(['GET'])
+@authentication_classes([StatelessJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def my_event_attendances_view(request):
     """Get user's event attendance records with certificate status."""
@@ -307,7 +319,7 @@ def my_event_attendances_view(request):
         from .models import EventAttendance, EventCertificate
         
         attendances = EventAttendance.objects.filter(
-            user=request.user
+            user_id=request.user.id
         ).select_related('event', 'event__primary_club').order_by('-check_in_time')
         
         attendance_data = []
@@ -315,7 +327,7 @@ def my_event_attendances_view(request):
             # Check for certificate
             certificate = None
             try:
-                cert = EventCertificate.objects.get(event=att.event, user=request.user)
+                cert = EventCertificate.objects.get(event=att.event, user_id=request.user.id)
                 certificate = {
                     'id': cert.id,
                     'certificate_id': cert.certificate_id,
@@ -389,6 +401,7 @@ def submit_event_feedback_view(request, attendance_id):
 
 
 @api_view(['GET'])
+@authentication_classes([StatelessJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def my_certificates_view(request):
     """Get all certificates earned by the user."""
@@ -396,7 +409,7 @@ def my_certificates_view(request):
         from .models import EventCertificate
         
         certificates = EventCertificate.objects.filter(
-            user=request.user,
+            user_id=request.user.id,
             status__in=['generated', 'issued', 'downloaded']
         ).select_related('event').order_by('-issued_at')
         
@@ -554,6 +567,180 @@ def add_event_expense_view(request, event_id):
         )
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def event_spend_timeseries_view(request, event_id):
+    """
+    Cumulative spend-over-time series for the live ledger chart.
+    Served from EventSpendSnapshot (one row per day with spend).
+    """
+    try:
+        from .models import Event, EventSpendSnapshot, ClubMember, EventRegistration
+
+        event = Event.objects.get(id=event_id)
+
+        # Same audience as the expense ledger
+        is_authorized = (
+            ClubMember.objects.filter(club=event.primary_club, user=request.user, status='active').exists() or
+            event.created_by == request.user or
+            EventRegistration.objects.filter(event=event, user=request.user).exists()
+        )
+
+        if not is_authorized:
+            return Response({'error': 'Unauthorized. You must be a club member, event creator, or registered participant to view expenses.'}, status=status.HTTP_403_FORBIDDEN)
+
+        snapshots = EventSpendSnapshot.objects.filter(event=event).order_by('date').values_list(
+            'date', 'daily_spend', 'cumulative_spend', 'expense_count'
+        )
+
+        series = [
+            {
+                'date': day,
+                'daily_spend': float(daily),
+                'cumulative_spend': float(cumulative),
+                'expense_count': count,
+            }
+            for day, daily, cumulative, count in snapshots
+        ]
+
+        return Response({
+            'event_id': event.event_id,
+            'approved_budget': float(event.approved_budget) if event.approved_budget else 0,
+            'total_expenses': series[-1]['cumulative_spend'] if series else 0,
+            'series': series,
+        }, status=status.HTTP_200_OK)
+
+    except Event.DoesNotExist:
+        return Response({'error': 'Event not found'}, status=status.HTTP_404_NOT_FOUND)
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to fetch spend series', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def budget_utilization_report_view(request):
+    """
+    Approved vs. actual spend per club and academic term, with variance and top categories.
+    Admin only. Cached until any event or expense changes.
+    """
+    try:
+        from django.core.cache import cache
+        from .reports import build_budget_utilization_report, budget_report_cache_key
+
+        if not hasattr(request.user, 'role') or request.user.role != 'admin':
+            return Response({
+                'error': 'Access denied. Admin role required.'
+            }, status=status.HTTP_403_FORBIDDEN)
+
+        cache_key = budget_report_cache_key()
+        report = cache.get(cache_key)
+        if report is None:
+            report = build_budget_utilization_report()
+            cache.set(cache_key, report, getattr(settings, 'BUDGET_REPORT_CACHE_TTL', 600))
+
+        return Response(report, status=status.HTTP_200_OK)
+
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to build budget report', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def import_event_expenses_view(request, event_id):
+    """
+    Bulk import expenses for an event from a CSV upload (multipart field 'file').
+    Rows are validated in one streaming pass; nothing is inserted if any row is
+    invalid unless skip_invalid=true is passed.
+    """
+    try:
+        from .models import Event, EventExpense, ClubMember
+        from .expense_import import parse_expense_csv, allocate_expense_ids
+        from .spend_snapshots import rebuild_spend_snapshots
+        from .caching import bump_generation
+        from .reports import BUDGET_REPORT_NAMESPACE
+        from django.db import transaction
+
+        event = Event.objects.get(id=event_id)
+
+        # Same authorization as adding a single expense
+        is_authorized = (
+            ClubMember.objects.filter(club=event.primary_club, user=request.user, status='active').exists() or
+            event.created_by == request.user
+        )
+
+        if not is_authorized:
+            return Response({'error': 'Unauthorized. Only club members can add expenses.'}, status=status.HTTP_403_FORBIDDEN)
+
+        upload = request.FILES.get('file')
+        if not upload:
+            return Response({'error': 'No file provided'}, status=status.HTTP_400_BAD_REQUEST)
+
+        valid_rows, row_errors, missing_columns = parse_expense_csv(upload)
+
+        if missing_columns:
+            return Response({
+                'error': 'Missing required columns',
+                'missing_columns': missing_columns,
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        skip_invalid = str(request.data.get('skip_invalid', '')).lower() in ['true', '1', 'yes']
+        if row_errors and not skip_invalid:
+            return Response({
+                'error': 'Some rows are invalid. No expenses were imported.',
+                'row_errors': row_errors,
+                'valid_rows': len(valid_rows),
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if not valid_rows:
+            return Response({'error': 'No valid rows to import', 'row_errors': row_errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        default_status = request.data.get('status', 'pending')
+        if default_status not in dict(EventExpense.STATUS_CHOICES):
+            return Response({'error': f'Invalid status: {default_status}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        expense_ids = allocate_expense_ids(event, len(valid_rows))
+        expenses = [
+            EventExpense(
+                event=event,
+                expense_id=expense_id,
+                submitted_by=request.user,
+                status=default_status,
+                **row
+            )
+            for expense_id, row in zip(expense_ids, valid_rows)
+        ]
+
+        with transaction.atomic():
+            EventExpense.objects.bulk_create(expenses, batch_size=500)
+            # bulk_create skips signals, so rebuild this event's spend series in one query
+            rebuild_spend_snapshots(event.id)
+            transaction.on_commit(lambda: bump_generation(BUDGET_REPORT_NAMESPACE))
+
+        return Response({
+            'message': f'{len(expenses)} expenses imported successfully',
+            'imported': len(expenses),
+            'skipped': len(row_errors),
+            'row_errors': row_errors,
+            'expense_ids': expense_ids,
+        }, status=status.HTTP_201_CREATED)
+
+    except Event.DoesNotExist:
+        return Response({'error': 'Event not found'}, status=status.HTTP_404_NOT_FOUND)
+    except UnicodeDecodeError:
+        return Response({'error': 'File must be UTF-8 encoded CSV'}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to import expenses', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 @csrf_exempt
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
@@ -740,16 +927,12 @@ def pending_faculty_approvals_view(request):
     Only accessible by faculty members (users with role='faculty').
     """
     try:
-        from .models import Event, ClubMember
+        from .models import Event
+        from .reviewer_scope import get_reviewer_scope
         
         # Check if user is faculty - must be a faculty member of at least one club
-        faculty_memberships = ClubMember.objects.filter(
-            user=request.user,
-            role='faculty',
-            status='active'
-        ).values_list('club_id', flat=True)
-        
-        if not faculty_memberships:
+        scope = get_reviewer_scope(request)
+        if not scope.is_faculty:
             return Response({
                 'error': 'Access denied. Faculty role required.'
             }, status=status.HTTP_403_FORBIDDEN)
@@ -757,7 +940,7 @@ def pending_faculty_approvals_view(request):
         # Get events pending faculty approval for faculty's clubs only
         events = Event.objects.filter(
             status='pending_faculty_approval',
-            primary_club_id__in=faculty_memberships
+            primary_club_id__in=scope.faculty_club_ids
         ).select_related('primary_club', 'created_by').prefetch_related('collaborating_clubs').order_by('-created_at')
         
         events_data = []
@@ -818,17 +1001,13 @@ def faculty_approve_event_view(request, event_id):
     Changes status from 'pending_faculty_approval' to 'pending_admin_approval'.
     """
     try:
-        from .models import Event, ClubMember, EventLog
+        from .models import Event, EventLog
+        from .reviewer_scope import get_reviewer_scope
         from django.utils import timezone
         
         # Check if user is faculty - must be a faculty member of at least one club
-        faculty_memberships = ClubMember.objects.filter(
-            user=request.user,
-            role='faculty',
-            status='active'
-        ).values_list('club_id', flat=True)
-        
-        if not faculty_memberships:
+        scope = get_reviewer_scope(request)
+        if not scope.is_faculty:
             return Response({
                 'error': 'Access denied. Faculty role required.'
             }, status=status.HTTP_403_FORBIDDEN)
@@ -837,7 +1016,7 @@ def faculty_approve_event_view(request, event_id):
         event = Event.objects.get(id=event_id)
         
         # Verify event belongs to one of faculty's clubs
-        if event.primary_club_id not in faculty_memberships:
+        if not scope.is_faculty_of(event.primary_club_id):
             return Response({
                 'error': 'Access denied. You can only approve events from your clubs.'
             }, status=status.HTTP_403_FORBIDDEN)
@@ -886,17 +1065,13 @@ def faculty_reject_event_view(request, event_id):
     Changes status from 'pending_faculty_approval' to 'faculty_rejected'.
     """
     try:
-        from .models import Event, ClubMember, EventLog
+        from .models import Event, EventLog
+        from .reviewer_scope import get_reviewer_scope
         from django.utils import timezone
         
         # Check if user is faculty - must be a faculty member of at least one club
-        faculty_memberships = ClubMember.objects.filter(
-            user=request.user,
-            role='faculty',
-            status='active'
-        ).values_list('club_id', flat=True)
-        
-        if not faculty_memberships:
+        scope = get_reviewer_scope(request)
+        if not scope.is_faculty:
             return Response({
                 'error': 'Access denied. Faculty role required.'
             }, status=status.HTTP_403_FORBIDDEN)
@@ -905,7 +1080,7 @@ def faculty_reject_event_view(request, event_id):
         event = Event.objects.get(id=event_id)
         
         # Verify event belongs to one of faculty's clubs
-        if event.primary_club_id not in faculty_memberships:
+        if not scope.is_faculty_of(event.primary_club_id):
             return Response({
                 'error': 'Access denied. You can only reject events from your clubs.'
             }, status=status.HTTP_403_FORBIDDEN)
@@ -961,9 +1136,10 @@ def pending_admin_approvals_view(request):
     """
     try:
         from .models import Event
+        from .reviewer_scope import get_reviewer_scope
         
         # Check if user is admin using AdminUser.role
-        if not hasattr(request.user, 'role') or request.user.role != 'admin':
+        if not get_reviewer_scope(request).is_admin:
             return Response({
                 'error': 'Access denied. Admin role required.'
             }, status=status.HTTP_403_FORBIDDEN)
@@ -1039,7 +1215,8 @@ def admin_approve_event_view(request, event_id):
     Event becomes active and visible to all users.
     """
     try:
-        from .models import Event, AdminUser, EventLog
+        from .models import Event, EventLog
+        from .reviewer_scope import get_reviewer_scope
         from django.utils import timezone
         import traceback
         
@@ -1047,7 +1224,7 @@ def admin_approve_event_view(request, event_id):
         print(f"Request user: {request.user}")
         
         # Check if user is admin (request.user IS an AdminUser instance)
-        if not hasattr(request.user, 'role') or request.user.role != 'admin':
+        if not get_reviewer_scope(request).is_admin:
             print(f"Access denied. User role: {getattr(request.user, 'role', 'no role attr')}")
             return Response({
                 'error': 'Access denied. Admin role required.'
@@ -1117,14 +1294,15 @@ def admin_reject_event_view(request, event_id):
     Changes status from 'pending_admin_approval' to 'admin_rejected'.
     """
     try:
-        from .models import Event, AdminUser, EventLog
+        from .models import Event, EventLog
+        from .reviewer_scope import get_reviewer_scope
         from django.utils import timezone
         import traceback
         
         print(f"Admin reject called for event_id: {event_id}")
         
         # Check if user is admin (request.user IS an AdminUser instance)
-        if not hasattr(request.user, 'role') or request.user.role != 'admin':
+        if not get_reviewer_scope(request).is_admin:
             print(f"Access denied. User role: {getattr(request.user, 'role', 'no role attr')}")
             return Response({
                 'error': 'Access denied. Admin role required.'
@@ -1176,3 +1354,141 @@ def admin_reject_event_view(request, event_id):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+
+
+def _bulk_review_events(request, approve):
+    from .bulk_actions import BulkActionError, bulk_review_events, parse_bulk_ids
+    from .reviewer_scope import get_reviewer_scope
+    
+    scope = get_reviewer_scope(request)
+    if not scope.is_reviewer:
+        return Response({
+            'error': 'Access denied. Faculty or admin role required.'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        ids = parse_bulk_ids(request.data)
+    except BulkActionError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    rejection_reason = request.data.get('rejection_reason', '')
+    if not approve and not rejection_reason:
+        return Response({
+            'error': 'Rejection reason is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    result = bulk_review_events(request.user, scope, ids, approve, reason=rejection_reason)
+    stage = 'admin' if scope.is_admin else 'faculty'
+    verb = 'approved' if approve else 'rejected'
+    return Response({
+        'message': f"{len(result['processed'])} event(s) {verb} by {stage}.",
+        **result,
+    })
+
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def bulk_approve_events_view(request):
+    """
+    Approve many event applications at the reviewer's stage.
+    Faculty move events to 'pending_admin_approval'; admins approve them with
+    the estimated budget. Body: {"ids": [...]}.
+    """
+    try:
+        return _bulk_review_events(request, approve=True)
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to approve events', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def bulk_reject_events_view(request):
+    """
+    Reject many event applications at the reviewer's stage.
+    Body: {"ids": [...], "rejection_reason": "..."}.
+    """
+    try:
+        return _bulk_review_events(request, approve=False)
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to reject events', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+# ================ EXPORTS ================
+
+def _can_export_event(request, event):
+    """Event creator, active members of the organizing club and its reviewers."""
+    from .models import ClubMember
+    from .reviewer_scope import get_reviewer_scope
+    
+    return (
+        event.created_by_id == request.user.id or
+        get_reviewer_scope(request).can_review_club(event.primary_club_id) or
+        ClubMember.objects.filter(club_id=event.primary_club_id, user=request.user, status='active').exists()
+    )
+
+
+def _event_export(request, event_id, model, columns, ordering, label):
+    from .exports import csv_export_response, export_filename
+    from .models import Event
+    
+    try:
+        event = Event.objects.only('id', 'event_id', 'created_by_id', 'primary_club_id').get(id=event_id)
+    except Event.DoesNotExist:
+        return Response({'error': 'Event not found'}, status=status.HTTP_404_NOT_FOUND)
+    
+    if not _can_export_event(request, event):
+        return Response({
+            'error': 'Unauthorized. Only event organizers can export participant data.'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    rows = model.objects.filter(event_id=event.id)
+    status_filter = request.query_params.get('status')
+    if status_filter and status_filter != 'all':
+        rows = rows.filter(status=status_filter)
+    return csv_export_response(rows.order_by(*ordering), columns, export_filename(event.event_id, label))
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_event_registrations_view(request, event_id):
+    """Stream an event's registrations as CSV (optional ?status=)."""
+    try:
+        from .exports import REGISTRATION_EXPORT_COLUMNS
+        from .models import EventRegistration
+        
+        return _event_export(
+            request, event_id, EventRegistration, REGISTRATION_EXPORT_COLUMNS,
+            ['registered_at', 'id'], 'registrations',
+        )
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to export registrations', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_event_attendance_view(request, event_id):
+    """Stream an event's attendance records as CSV (optional ?status=)."""
+    try:
+        from .exports import ATTENDANCE_EXPORT_COLUMNS
+        from .models import EventAttendance
+        
+        return _event_export(
+            request, event_id, EventAttendance, ATTENDANCE_EXPORT_COLUMNS,
+            ['session_number', 'user__last_name', 'user__first_name', 'id'], 'attendance',
+        )
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to export attendance', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
@@ -0,0 +1,201 @@
+"""
+Bulk Expense Import
+Streaming validation of CSV exports (from spreadsheets or accounting tools)
+into EventExpense rows.
+"""
+
+import csv
+import io
+import re
+import secrets
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+
+
+REQUIRED_COLUMNS = ['category', 'title', 'amount', 'paid_to']
+OPTIONAL_COLUMNS = [
+    'description', 'gst_amount', 'total_amount', 'payment_mode', 'payment_reference',
+    'payment_date', 'paid_to_contact', 'invoice_number', 'invoice_date',
+    'bill_image_url', 'bill_pdf_url', 'notes',
+]
+TEXT_LIMITS = {
+    'title': 255,
+    'paid_to': 255,
+    'paid_to_contact': 100,
+    'payment_reference': 100,
+    'invoice_number': 100,
+}
+
+
+def _open_csv(uploaded_file):
+    """Wrap the upload in a text stream and sniff the delimiter (comma, semicolon or tab)."""
+    stream = io.TextIOWrapper(uploaded_file, encoding='utf-8-sig', newline='')
+    sample = stream.read(4096)
+    stream.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=',;\t')
+    except csv.Error:
+        dialect = csv.excel
+    return csv.DictReader(stream, dialect=dialect)
+
+
+def _normalise_amount(value, decimal_comma):
+    """
+    `value` with a plain '.' decimal point, or None if its separators are
+    ambiguous. When both ',' and '.' appear, the last one is the decimal
+    point. A lone ',' is the decimal point in semicolon/tab files (European
+    exports) and a thousands separator in comma files, where it must then
+    group digits in threes: '12,50' is rejected rather than read as 1250.
+    """
+    if ',' not in value:
+        return value
+    if '.' in value:
+        decimal = '.' if value.rfind('.') > value.rfind(',') else ','
+    else:
+        decimal = ',' if decimal_comma else '.'
+    group = ',' if decimal == '.' else '.'
+    pattern = rf'(\d+|\d{{1,3}}(\{group}\d{{3}})+)(\{decimal}\d+)?'
+    if not re.fullmatch(pattern, value):
+        return None
+    return value.replace(group, '').replace(decimal, '.')
+
+
+def _parse_decimal(value, field, errors, required=False, decimal_comma=False):
+    value = (value or '').strip()
+    if not value:
+        if required:
+            errors[field] = 'This field is required'
+        return None
+    normalised = _normalise_amount(value, decimal_comma)
+    if normalised is None:
+        errors[field] = f'Ambiguous amount: {value} (use "." for decimals in comma-delimited files)'
+        return None
+    try:
+        parsed = Decimal(normalised)
+    except InvalidOperation:
+        errors[field] = f'Invalid amount: {value}'
+        return None
+    if parsed < 0:
+        errors[field] = 'Amount cannot be negative'
+        return None
+    if parsed != parsed.quantize(Decimal('0.01')) or parsed >= Decimal('100000000'):
+        errors[field] = 'Amount must have at most 8 digits and 2 decimal places'
+        return None
+    return parsed
+
+
+def _parse_date(value, field, errors):
+    value = (value or '').strip()
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        errors[field] = f'Invalid date (expected YYYY-MM-DD): {value}'
+        return None
+
+
+def validate_row(row, decimal_comma=False):
+    """
+    Validate and normalise one CSV row. `decimal_comma` reads a lone ',' in
+    amounts as the decimal point (see _normalise_amount).
+    Returns (cleaned_data, errors); errors is a dict of field -> message.
+    """
+    from .models import EventExpense
+
+    errors = {}
+    raw = {key.strip().lower(): (value or '').strip() for key, value in row.items() if key}
+
+    for field in REQUIRED_COLUMNS:
+        if not raw.get(field):
+            errors[field] = 'This field is required'
+
+    category = raw.get('category', '').lower()
+    if category and category not in dict(EventExpense.CATEGORY_CHOICES):
+        errors['category'] = f'Unknown category: {category}'
+
+    payment_mode = raw.get('payment_mode', '').lower()
+    if payment_mode and payment_mode not in dict(EventExpense.PAYMENT_MODE_CHOICES):
+        errors['payment_mode'] = f'Unknown payment mode: {payment_mode}'
+
+    for field, limit in TEXT_LIMITS.items():
+        if len(raw.get(field, '')) > limit:
+            errors[field] = f'Must be at most {limit} characters'
+
+    amount = _parse_decimal(raw.get('amount'), 'amount', errors, required=True, decimal_comma=decimal_comma)
+    gst_amount = _parse_decimal(raw.get('gst_amount'), 'gst_amount', errors, decimal_comma=decimal_comma) or Decimal('0')
+    total_amount = _parse_decimal(raw.get('total_amount'), 'total_amount', errors, decimal_comma=decimal_comma)
+    if total_amount is None and amount is not None:
+        total_amount = amount + gst_amount
+
+    cleaned = {
+        'category': category,
+        'title': raw.get('title', ''),
+        'description': raw.get('description', ''),
+        'amount': amount,
+        'gst_amount': gst_amount,
+        'total_amount': total_amount,
+        'payment_mode': payment_mode,
+        'payment_reference': raw.get('payment_reference', ''),
+        'payment_date': _parse_date(raw.get('payment_date'), 'payment_date', errors),
+        'paid_to': raw.get('paid_to', ''),
+        'paid_to_contact': raw.get('paid_to_contact', ''),
+        'invoice_number': raw.get('invoice_number', ''),
+        'invoice_date': _parse_date(raw.get('invoice_date'), 'invoice_date', errors),
+        'bill_image_url': raw.get('bill_image_url', ''),
+        'bill_pdf_url': raw.get('bill_pdf_url', ''),
+        'notes': raw.get('notes', ''),
+    }
+    return cleaned, errors
+
+
+def parse_expense_csv(uploaded_file):
+    """
+    Single streaming pass over the upload.
+    Returns (valid_rows, row_errors, missing_columns). Row numbers are 1-based
+    data rows, i.e. excluding the header.
+    """
+    reader = _open_csv(uploaded_file)
+    headers = [h.strip().lower() for h in (reader.fieldnames or []) if h]
+    missing = [c for c in REQUIRED_COLUMNS if c not in headers]
+    if missing:
+        return [], [], missing
+
+    # Semicolon and tab delimited exports come from locales that write decimal commas
+    decimal_comma = reader.reader.dialect.delimiter != ','
+    max_rows = getattr(settings, 'EXPENSE_IMPORT_MAX_ROWS', 5000)
+    valid_rows = []
+    row_errors = []
+    for row_number, row in enumerate(reader, start=1):
+        if row_number > max_rows:
+            row_errors.append({'row': row_number, 'errors': {'file': f'Import is limited to {max_rows} rows'}})
+            break
+        if not any((value or '').strip() for value in row.values() if isinstance(value, str)):
+            continue  # skip blank lines
+        cleaned, errors = validate_row(row, decimal_comma)
+        if errors:
+            row_errors.append({'row': row_number, 'errors': errors})
+        else:
+            valid_rows.append(cleaned)
+    return valid_rows, row_errors, []
+
+
+def allocate_expense_ids(event, count):
+    """
+    Allocate `count` unique expense IDs for an event using one lookup query
+    (plus a retry round in the unlikely case of a collision).
+    """
+    from .models import EventExpense
+
+    prefix = f"EXP{event.event_id}"
+    allocated = set()
+    while len(allocated) < count:
+        needed = count - len(allocated)
+        candidates = {f"{prefix}{secrets.token_hex(4).upper()}" for _ in range(needed)} - allocated
+        taken = set(
+            EventExpense.objects.filter(expense_id__in=candidates).values_list('expense_id', flat=True)
+        )
+        allocated |= candidates - taken
+    return list(allocated)
@@ -0,0 +1,119 @@
+"""
+Streaming CSV Exports
+Club rosters, event registrations and attendance as CSV downloads. Rows are
+read with values_list().iterator(chunk_size=...) and written through
+StreamingHttpResponse, so memory stays flat and the first bytes go out
+before the last rows have been read.
+"""
+
+import csv
+from datetime import datetime
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+
+# (CSV header, values_list path)
+MEMBER_EXPORT_COLUMNS = [
+    ('Username', 'user__username'),
+    ('First Name', 'user__first_name'),
+    ('Last Name', 'user__last_name'),
+    ('Email', 'user__email'),
+    ('Student ID', 'user__student_id'),
+    ('Role', 'role'),
+    ('Status', 'status'),
+    ('Department', 'department'),
+    ('Academic Year', 'academic_year'),
+    ('Joined', 'created_at'),
+    ('Approved At', 'approved_at'),
+]
+
+REGISTRATION_EXPORT_COLUMNS = [
+    ('Registration Number', 'registration_number'),
+    ('Username', 'user__username'),
+    ('First Name', 'user__first_name'),
+    ('Last Name', 'user__last_name'),
+    ('Email', 'user__email'),
+    ('Student ID', 'user__student_id'),
+    ('Status', 'status'),
+    ('Payment Status', 'payment_status'),
+    ('Payment Amount', 'payment_amount'),
+    ('Payment Reference', 'payment_reference'),
+    ('Team Name', 'team_name'),
+    ('Registered At', 'registered_at'),
+    ('Confirmed At', 'confirmed_at'),
+    ('Cancelled At', 'cancelled_at'),
+]
+
+ATTENDANCE_EXPORT_COLUMNS = [
+    ('Username', 'user__username'),
+    ('First Name', 'user__first_name'),
+    ('Last Name', 'user__last_name'),
+    ('Email', 'user__email'),
+    ('Student ID', 'user__student_id'),
+    ('Registration Number', 'registration__registration_number'),
+    ('Session', 'session_number'),
+    ('Session Name', 'session_name'),
+    ('Status', 'status'),
+    ('Check In', 'check_in_time'),
+    ('Check Out', 'check_out_time'),
+    ('Duration (min)', 'duration_minutes'),
+    ('Verification', 'verification_method'),
+    ('Verified By', 'verified_by__username'),
+    ('Feedback Rating', 'feedback_rating'),
+]
+
+# Rows per chunk written to the client
+ROWS_PER_WRITE = 500
+
+
+class _Echo:
+    """File-like object whose write() returns the line instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+# Leading characters spreadsheet apps treat as the start of a formula (OWASP CSV injection)
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _cell(value):
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        # Keep spreadsheet apps from evaluating user-supplied text as a formula
+        return "'" + value
+    return value
+
+
+def iter_csv(queryset, columns, chunk_size=None):
+    """Yield the CSV header, then the rows of `queryset` in chunks of ROWS_PER_WRITE."""
+    chunk_size = chunk_size or getattr(settings, 'EXPORT_CHUNK_SIZE', 2000)
+    writer = csv.writer(_Echo())
+    yield writer.writerow([header for header, _ in columns])
+
+    rows = queryset.values_list(*[path for _, path in columns]).iterator(chunk_size=chunk_size)
+    buffer = []
+    for row in rows:
+        buffer.append(writer.writerow([_cell(value) for value in row]))
+        if len(buffer) >= ROWS_PER_WRITE:
+            yield ''.join(buffer)
+            buffer = []
+    if buffer:
+        yield ''.join(buffer)
+
+
+def csv_export_response(queryset, columns, filename):
+    response = StreamingHttpResponse(iter_csv(queryset, columns), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+def export_filename(*parts):
+    stamp = datetime.now().strftime('%Y%m%d')
+    safe = '_'.join(''.join(c if c.isalnum() or c in '-_' else '-' for c in str(p)) for p in parts)
+    return f"{safe}_{stamp}.csv"
@@ -0,0 +1,205 @@
+"""
+Image Derivatives
+Branding and event images are uploaded at full size but shown in cards and
+headers. When an image URL is saved, a background job loads the original
+through the storage layer and stores WebP and JPEG variants at
+DERIVATIVE_WIDTHS; the URLs are recorded on an ImageDerivative row keyed by
+the source URL. List endpoints swap in thumbnail_urls() (one query per page),
+falling back to the original until the variants exist.
+"""
+
+import hashlib
+from io import BytesIO
+
+from django.conf import settings
+from django.db import transaction
+
+from .jobs import enqueue
+from .storage import get_storage
+
+
+DERIVATIVE_WIDTHS = (160, 320, 640, 1280)
+THUMBNAIL_WIDTH = 320
+
+# (name, content type, Pillow format, save options)
+DERIVATIVE_FORMATS = [
+    ('webp', 'image/webp', 'WEBP', {'quality': 80, 'method': 4}),
+    ('jpeg', 'image/jpeg', 'JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+]
+
+# Image URL fields per model; Event.gallery_urls is a list of URLs
+IMAGE_FIELDS = {
+    'UniversityProfile': ['logo_url', 'hero_image_url'],
+    'Event': ['poster_url', 'banner_url'],
+}
+
+
+def source_hash(url):
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def image_urls(instance):
+    """Image URLs on a UniversityProfile or Event that should get derivatives."""
+    urls = [getattr(instance, field) for field in IMAGE_FIELDS.get(type(instance).__name__, [])]
+    urls.extend(getattr(instance, 'gallery_urls', None) or [])
+    return [url for url in urls if isinstance(url, str) and url]
+
+
+def request_derivatives(urls, created_by=None):
+    """
+    Queue a derivative job for each URL without ready or pending variants;
+    failed and skipped ones are reset to pending and tried again (the object
+    may have been re-uploaded or the failure transient). Returns the number queued.
+    """
+    from django.utils import timezone
+    from .models import ImageDerivative
+
+    by_hash = {source_hash(url): url for url in urls if url}
+    if not by_hash:
+        return 0
+    statuses = dict(ImageDerivative.objects.filter(source_hash__in=by_hash).values_list('source_hash', 'status'))
+    new = {digest: url for digest, url in by_hash.items() if digest not in statuses}
+    ImageDerivative.objects.bulk_create(
+        [ImageDerivative(source_hash=digest, source_url=url) for digest, url in new.items()],
+        ignore_conflicts=True,
+    )
+    queued = list(new)
+    for digest, row_status in statuses.items():
+        if row_status in ('ready', 'pending'):
+            continue
+        # Conditional, so concurrent saves of the same URL queue it once
+        reset = ImageDerivative.objects.filter(source_hash=digest, status=row_status).update(
+            status='pending', error='', updated_at=timezone.now()
+        )
+        if reset:
+            queued.append(digest)
+    for digest in queued:
+        enqueue('image_derivatives', {'source_hash': digest}, created_by=created_by)
+    return len(queued)
+
+
+def _flatten(image):
+    """RGB copy for JPEG, with transparency composited onto white."""
+    from PIL import Image
+
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        rgba = image.convert('RGBA')
+        background = Image.new('RGB', rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def render_variants(data, widths=DERIVATIVE_WIDTHS):
+    """
+    ((width, height), {width: {format: (content_type, bytes)}}) for an image.
+    Widths at or above the original are skipped; an image narrower than every
+    width gets one variant at its own size. Raises PIL.UnidentifiedImageError
+    for data Pillow cannot read (SVG, ICO files with odd sizes, ...).
+    """
+    from PIL import Image, ImageOps
+
+    image = Image.open(BytesIO(data))
+    original = image.size
+    # Let the JPEG decoder downscale while decoding when even the largest variant is much smaller
+    image.draft('RGB', (max(widths), max(widths) * image.height // max(image.width, 1)))
+    decoded = image.size
+    image = ImageOps.exif_transpose(image)
+    size = original if image.size == decoded else original[::-1]
+
+    targets = sorted({w for w in widths if w < image.width} or {image.width}, reverse=True)
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'P') else 'RGB')
+
+    variants = {}
+    current = image
+    for width in targets:
+        height = max(1, round(image.height * width / image.width))
+        # Each step resizes the previous, larger variant rather than the original
+        current = current.resize((width, height), Image.LANCZOS)
+        variants[width] = {}
+        for name, content_type, pil_format, options in DERIVATIVE_FORMATS:
+            out = BytesIO()
+            source = _flatten(current) if pil_format == 'JPEG' else current
+            source.save(out, pil_format, **options)
+            variants[width][name] = (content_type, out.getvalue())
+    return size, variants
+
+
+def build_derivatives(job):
+    """Job handler: render and store the variants of one source image."""
+    from PIL import UnidentifiedImageError
+    from .models import ImageDerivative
+    from .university_profile import get_university_profile, invalidate_university_profile
+
+    record = ImageDerivative.objects.get(source_hash=job.payload['source_hash'])
+    storage = get_storage()
+    key = storage.key_for_url(record.source_url)
+    if key is None:
+        record.status = 'skipped'
+        record.error = 'Not in object storage'
+        record.save(update_fields=['status', 'error', 'updated_at'])
+        return {'skipped': record.error}
+
+    try:
+        (width, height), rendered = render_variants(storage.read(key))
+    except UnidentifiedImageError:
+        record.status = 'skipped'
+        record.error = 'Not a raster image'
+        record.save(update_fields=['status', 'error', 'updated_at'])
+        return {'skipped': record.error}
+
+    prefix = f"derivatives/{record.source_hash[:2]}/{record.source_hash}"
+    variants = {}
+    for variant_width, formats in rendered.items():
+        variants[str(variant_width)] = {
+            name: storage.save(f"{prefix}/{variant_width}.{name}", body, content_type)
+            for name, (content_type, body) in formats.items()
+        }
+
+    record.status = 'ready'
+    record.width, record.height = width, height
+    record.variants = variants
+    record.error = ''
+    record.save(update_fields=['status', 'width', 'height', 'variants', 'error', 'updated_at'])
+    # The cached university profile embeds logo/hero variants. Its version is
+    # bumped (in the shared cache) only after this job commits, so no web
+    # worker can rebuild it from the old row under the new version.
+    if record.source_url in image_urls(get_university_profile()):
+        transaction.on_commit(invalidate_university_profile)
+    return {'variants': sorted(variants, key=int)}
+
+
+def derivatives_failed(job):
+    from .models import ImageDerivative
+
+    ImageDerivative.objects.filter(source_hash=job.payload['source_hash']).update(
+        status='failed', error=job.last_error[:1000]
+    )
+
+
+def variant_maps(urls):
+    """{url: variants} for the URLs whose derivatives are ready, in one query."""
+    from .models import ImageDerivative
+
+    by_hash = {source_hash(url): url for url in urls if url}
+    if not by_hash:
+        return {}
+    rows = ImageDerivative.objects.filter(source_hash__in=by_hash, status='ready').values_list('source_hash', 'variants')
+    return {by_hash[digest]: variants for digest, variants in rows}
+
+
+def pick_variant(variants, width=THUMBNAIL_WIDTH, fmt='webp'):
+    """URL of the smallest variant at least `width` wide (else the largest), or None."""
+    if not variants:
+        return None
+    widths = sorted(int(w) for w in variants)
+    chosen = next((w for w in widths if w >= width), widths[-1])
+    return variants[str(chosen)].get(fmt)
+
+
+def thumbnail_urls(urls, width=None, fmt='webp'):
+    """{url: thumbnail URL} for every URL given, falling back to the original."""
+    width = width or getattr(settings, 'IMAGE_THUMBNAIL_WIDTH', THUMBNAIL_WIDTH)
+    maps = variant_maps(urls)
+    return {url: pick_variant(maps.get(url), width, fmt) or url for url in urls if url}
@@ -0,0 +1,170 @@
+"""
+Reviewer Inbox
+Pending approval requests, event applications and club applications for one
+reviewer, merged into a single UNION ALL query with a common row shape.
+"""
+
+from django.db.models import Case, CharField, Count, F, IntegerField, Value, When
+
+from .pagination import cursor_condition, page_from_rows
+
+
+ITEM_APPROVAL = 'approval'
+ITEM_EVENT = 'event'
+ITEM_CLUB_APPLICATION = 'club_application'
+
+ITEM_TYPES = [ITEM_APPROVAL, ITEM_EVENT, ITEM_CLUB_APPLICATION]
+
+# Highest priority first, then the oldest (longest waiting) item
+INBOX_ORDERING = ['-priority_rank', 'item_created_at', 'item_type', 'item_id']
+
+# ApprovalRequest uses labels; the other models use integers where 0 is the default
+APPROVAL_PRIORITY_RANK = Case(
+    When(priority='high', then=Value(1)),
+    When(priority='low', then=Value(-1)),
+    default=Value(0),
+    output_field=IntegerField(),
+)
+
+APPROVAL_PENDING_STATUSES = ['pending', 'under_review']
+
+# Column order must be identical in every branch of the union
+INBOX_COLUMNS = [
+    'item_type', 'item_id', 'reference', 'item_title', 'subtype', 'item_status',
+    'priority_rank', 'inbox_club_id', 'club_name', 'submitter_id',
+    'submitter_first_name', 'submitter_last_name', 'item_created_at',
+]
+
+
+def _project(queryset, item_type, reference, title, subtype, priority, club_id, club_name, submitter):
+    return queryset.annotate(
+        item_type=Value(item_type, output_field=CharField()),
+        item_id=F('id'),
+        reference=reference,
+        item_title=F(title),
+        subtype=F(subtype),
+        item_status=F('status'),
+        priority_rank=priority,
+        inbox_club_id=F(club_id),
+        club_name=F(club_name),
+        submitter_id=F(f'{submitter}_id'),
+        submitter_first_name=F(f'{submitter}__first_name'),
+        submitter_last_name=F(f'{submitter}__last_name'),
+        item_created_at=F('created_at'),
+    ).values(*INBOX_COLUMNS).order_by()
+
+
+def pending_querysets(scope):
+    """Pending items of each type that `scope` may review."""
+    from .models import ApprovalRequest, ClubApplication, Event
+
+    if scope.is_admin:
+        approvals = ApprovalRequest.objects.filter(status__in=APPROVAL_PENDING_STATUSES)
+        events = Event.objects.filter(status='pending_admin_approval')
+        applications = ClubApplication.objects.filter(status='pending_admin')
+    else:
+        clubs = scope.faculty_club_ids
+        approvals = ApprovalRequest.objects.filter(
+            status__in=APPROVAL_PENDING_STATUSES,
+            current_reviewer_role='faculty',
+            club_id__in=clubs
+        )
+        events = Event.objects.filter(status='pending_faculty_approval', primary_club_id__in=clubs)
+        applications = ClubApplication.objects.filter(status='pending_faculty', club_id__in=clubs)
+
+    return {
+        ITEM_APPROVAL: approvals,
+        ITEM_EVENT: events,
+        ITEM_CLUB_APPLICATION: applications,
+    }
+
+
+def inbox_branches(scope):
+    """One projected queryset per item type, all with the INBOX_COLUMNS shape."""
+    pending = pending_querysets(scope)
+    return {
+        ITEM_APPROVAL: _project(
+            pending[ITEM_APPROVAL], ITEM_APPROVAL,
+            reference=Value('', output_field=CharField()),
+            title='title',
+            subtype='request_type',
+            priority=APPROVAL_PRIORITY_RANK,
+            club_id='club_id',
+            club_name='club__name',
+            submitter='requested_by',
+        ),
+        ITEM_EVENT: _project(
+            pending[ITEM_EVENT], ITEM_EVENT,
+            reference=F('event_id'),
+            title='title',
+            subtype='event_type',
+            priority=F('priority'),
+            club_id='primary_club_id',
+            club_name='primary_club__name',
+            submitter='created_by',
+        ),
+        ITEM_CLUB_APPLICATION: _project(
+            pending[ITEM_CLUB_APPLICATION], ITEM_CLUB_APPLICATION,
+            reference=F('application_id'),
+            title='title',
+            subtype='application_type',
+            priority=F('priority'),
+            club_id='club_id',
+            club_name='club__name',
+            submitter='submitted_by',
+        ),
+    }
+
+
+def inbox_page(scope, item_types=None, cursor=None, page_size=50):
+    """
+    One page of the inbox as (rows, next_cursor). The keyset condition is pushed
+    into every branch so each side of the union can stop early on its index.
+    """
+    branches = inbox_branches(scope)
+    selected = [branches[t] for t in (item_types or ITEM_TYPES)]
+    after = cursor_condition(INBOX_ORDERING, cursor)
+
+    first, *rest = [qs.filter(after) for qs in selected]
+    merged = first.union(*rest, all=True) if rest else first
+    rows = merged.order_by(*INBOX_ORDERING)[:page_size + 1]
+    return page_from_rows(rows, INBOX_ORDERING, page_size)
+
+
+def inbox_counts(scope):
+    """Pending count per item type, in one UNION ALL query."""
+    counts = {t: 0 for t in ITEM_TYPES}
+    totals = [
+        qs.order_by().annotate(
+            item_type=Value(item_type, output_field=CharField())
+        ).values('item_type').annotate(total=Count('id')).values('item_type', 'total')
+        for item_type, qs in pending_querysets(scope).items()
+    ]
+    first, *rest = totals
+    for row in first.union(*rest, all=True):
+        counts[row['item_type']] = row['total']
+    return counts
+
+
+def serialize_inbox_row(row):
+    submitter = None
+    if row['submitter_id']:
+        submitter = {
+            'id': row['submitter_id'],
+            'name': f"{row['submitter_first_name']} {row['submitter_last_name']}".strip(),
+        }
+    return {
+        'type': row['item_type'],
+        'id': row['item_id'],
+        'reference': row['reference'] or None,
+        'title': row['item_title'],
+        'subtype': row['subtype'],
+        'status': row['item_status'],
+        'priority': row['priority_rank'],
+        'club': {
+            'id': row['inbox_club_id'],
+            'name': row['club_name'],
+        },
+        'submitted_by': submitter,
+        'created_at': row['item_created_at'].isoformat(),
+    }
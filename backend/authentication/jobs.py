@@ -0,0 +1,187 @@
+"""
+Background Jobs
+A small database-backed work queue for side effects that should not run
+inside a request (PDF rendering, uploads, email). Jobs are claimed with
+SELECT ... FOR UPDATE SKIP LOCKED, so several workers can run side by side,
+and failed jobs are retried with exponential backoff.
+Run the worker with 'manage.py process_jobs --loop'.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger(__name__)
+
+# job_type -> (handler, give-up hook or None), as dotted paths.
+# Handlers take the BackgroundJob and return a JSON-serializable result; they
+# run in a transaction and may enqueue follow-up jobs. The give-up hook runs
+# once a job has failed for the last time.
+JOB_HANDLERS = {
+    'club_declaration': (
+        'authentication.club_setup.build_declaration',
+        'authentication.club_setup.declaration_failed',
+    ),
+    'club_member_notification': ('authentication.club_setup.notify_member', None),
+    'image_derivatives': (
+        'authentication.image_derivatives.build_derivatives',
+        'authentication.image_derivatives.derivatives_failed',
+    ),
+}
+
+
+class UnknownJobType(ValueError):
+    pass
+
+
+# Mail backends that never deliver; a worker using one would only log the
+# passwords issued by the club notification jobs
+NON_DELIVERING_EMAIL_BACKENDS = {
+    'django.core.mail.backends.console.EmailBackend',
+    'django.core.mail.backends.filebased.EmailBackend',
+    'django.core.mail.backends.locmem.EmailBackend',
+    'django.core.mail.backends.dummy.EmailBackend',
+}
+
+
+def worker_configuration_errors():
+    """
+    Why this process cannot run the job handlers for real: outside DEBUG they
+    need a mail backend that delivers and S3 (a worker's local disk is not
+    served by the web service). Empty when the worker may start.
+    """
+    from .storage import s3_configured
+
+    if settings.DEBUG:
+        return []
+    errors = []
+    if settings.EMAIL_BACKEND in NON_DELIVERING_EMAIL_BACKENDS:
+        errors.append(f'EMAIL_BACKEND is {settings.EMAIL_BACKEND}, which does not send mail')
+    if not s3_configured():
+        errors.append('S3 is not configured (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_STORAGE_BUCKET_NAME)')
+    return errors
+
+
+def enqueue(job_type, payload, handle=None, created_by=None, run_after=None, max_attempts=None):
+    """Queue a job. Call inside the transaction that creates the data it works on."""
+    from .models import BackgroundJob
+
+    if job_type not in JOB_HANDLERS:
+        raise UnknownJobType(job_type)
+
+    fields = {
+        'job_type': job_type,
+        'payload': payload,
+        'created_by': created_by,
+        'run_after': run_after or timezone.now(),
+        'max_attempts': max_attempts or getattr(settings, 'JOB_MAX_ATTEMPTS', 5),
+    }
+    if handle is not None:
+        fields['handle'] = handle
+    return BackgroundJob.objects.create(**fields)
+
+
+def retry_delay(attempts):
+    """Backoff before the next attempt: base, 2x base, 4x base, ..."""
+    base = getattr(settings, 'JOB_RETRY_BASE_DELAY', 30)
+    return timedelta(seconds=base * 2 ** max(attempts - 1, 0))
+
+
+def claim_jobs(batch_size=None):
+    """
+    Mark up to batch_size ready jobs as running and return them. Jobs left
+    'running' longer than JOB_LOCK_TIMEOUT (a crashed worker) are claimed again.
+    """
+    from .models import BackgroundJob
+
+    batch_size = batch_size or getattr(settings, 'JOB_BATCH_SIZE', 20)
+    now = timezone.now()
+    stale = now - timedelta(seconds=getattr(settings, 'JOB_LOCK_TIMEOUT', 600))
+
+    with transaction.atomic():
+        jobs = list(
+            BackgroundJob.objects.select_for_update(skip_locked=True).filter(
+                Q(status='queued', run_after__lte=now) | Q(status='running', locked_at__lt=stale)
+            ).order_by('run_after', 'id')[:batch_size]
+        )
+        for job in jobs:
+            job.status = 'running'
+            job.locked_at = now
+            job.attempts += 1
+        BackgroundJob.objects.bulk_update(jobs, ['status', 'locked_at', 'attempts'])
+    return jobs
+
+
+def run_job(job):
+    """Run one claimed job and record the outcome. Returns True on success."""
+    handler_path, give_up_path = JOB_HANDLERS.get(job.job_type, (None, None))
+
+    try:
+        if handler_path is None:
+            raise UnknownJobType(job.job_type)
+        with transaction.atomic():
+            job.result = import_string(handler_path)(job) or {}
+            job.status = 'succeeded'
+            job.finished_at = timezone.now()
+            job.last_error = ''
+            job.save(update_fields=['result', 'status', 'finished_at', 'last_error'])
+        return True
+    except Exception as exc:
+        job.last_error = f"{type(exc).__name__}: {exc}"
+        if job.attempts >= job.max_attempts or isinstance(exc, UnknownJobType):
+            job.status = 'failed'
+            job.finished_at = timezone.now()
+        else:
+            job.status = 'queued'
+            job.run_after = timezone.now() + retry_delay(job.attempts)
+        job.locked_at = None
+        job.save(update_fields=['last_error', 'status', 'finished_at', 'run_after', 'locked_at'])
+
+        if job.status == 'failed' and give_up_path:
+            try:
+                with transaction.atomic():
+                    import_string(give_up_path)(job)
+            except Exception:
+                logger.exception('Give-up hook for job %s failed', job.pk)
+        return False
+
+
+def process_jobs(batch_size=None):
+    """Claim and run one batch. Returns (succeeded, failed_or_retrying)."""
+    succeeded = failed = 0
+    for job in claim_jobs(batch_size):
+        if run_job(job):
+            succeeded += 1
+        else:
+            failed += 1
+    return succeeded, failed
+
+
+def job_group_status(jobs):
+    """Overall status of the jobs sharing a handle."""
+    statuses = {job.status for job in jobs}
+    if not statuses:
+        return None
+    if statuses & {'queued', 'running'}:
+        return 'running' if statuses - {'queued'} else 'queued'
+    return 'failed' if 'failed' in statuses else 'succeeded'
+
+
+def serialize_job(job):
+    return {
+        'id': job.id,
+        'type': job.job_type,
+        'status': job.status,
+        'attempts': job.attempts,
+        'max_attempts': job.max_attempts,
+        'last_error': job.last_error or None,
+        'result': job.result,
+        'created_at': job.created_at.isoformat(),
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+    }
@@ -0,0 +1,19 @@
+"""
+Django management command to (re)build event spend snapshots
+Useful after deploying the snapshot table or after bulk data fixes
+"""
+from django.core.management.base import BaseCommand
+from authentication.spend_snapshots import rebuild_spend_snapshots
+
+
+class Command(BaseCommand):
+    help = 'Rebuild daily spend snapshots from EventExpense with one windowed query'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--event', type=int, default=None, help='Only rebuild this event (database id)')
+
+    def handle(self, *args, **options):
+        rows = rebuild_spend_snapshots(options['event'])
+        self.stdout.write(
+            self.style.SUCCESS(f'✓ Wrote {rows} spend snapshot rows')
+        )
@@ -0,0 +1,81 @@
+"""
+Django management command to benchmark the login endpoint on one core
+Runs login_view in-process against a throwaway user (rolled back afterwards)
+and reports successful logins, failed logins and throttled rejections per second.
+"""
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIRequestFactory
+
+from authentication.models import AdminUser
+from authentication.views import login_view
+
+
+BENCH_USERNAME = 'login-benchmark-user'
+BENCH_PASSWORD = 'benchmark-Passw0rd!'
+
+
+class Command(BaseCommand):
+    help = 'Measure logins per second per core (success, wrong password, throttled)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Requests per scenario')
+
+    def _run(self, label, iterations, payload, expected_status, **extra):
+        factory = APIRequestFactory()
+        queries = 0
+        started = time.perf_counter()
+        for _ in range(iterations):
+            request = factory.post('/api/auth/login/', payload, format='json', **extra)
+            with CaptureQueriesContext(connection) as captured:
+                response = login_view(request)
+            queries += len(captured)
+            if response.status_code != expected_status:
+                self.stdout.write(self.style.ERROR(
+                    f'{label}: expected {expected_status}, got {response.status_code} {response.data}'
+                ))
+                return
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'{label:<22} {iterations / elapsed:10.1f} req/s  '
+            f'{elapsed / iterations * 1000:8.2f} ms/req  {queries / iterations:.1f} queries/req'
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        cache.clear()
+
+        with transaction.atomic():
+            AdminUser.objects.filter(username=BENCH_USERNAME).delete()
+            AdminUser.objects.create_user(
+                username=BENCH_USERNAME,
+                email=f'{BENCH_USERNAME}@example.invalid',
+                password=BENCH_PASSWORD,
+            )
+
+            with override_settings(LOGIN_THROTTLE_ENABLED=False):
+                self._run('successful login', iterations,
+                          {'username': BENCH_USERNAME, 'password': BENCH_PASSWORD}, 200)
+                self._run('successful (email)', iterations,
+                          {'username': f'{BENCH_USERNAME}@example.invalid', 'password': BENCH_PASSWORD}, 200)
+                self._run('wrong password', iterations,
+                          {'username': BENCH_USERNAME, 'password': 'wrong'}, 401)
+                self._run('unknown account', iterations,
+                          {'username': 'no-such-user', 'password': 'wrong'}, 401)
+
+            # Exhaust one IP's window, then measure how cheaply further guesses are turned away
+            with override_settings(LOGIN_THROTTLE_ENABLED=True, LOGIN_THROTTLE_IP_BURST=1,
+                                   LOGIN_THROTTLE_IP_PER_MINUTE=1):
+                extra = {'REMOTE_ADDR': '203.0.113.7'}
+                self._run('first guess', 1, {'username': BENCH_USERNAME, 'password': 'wrong'}, 401, **extra)
+                self._run('throttled guess', iterations * 50,
+                          {'username': BENCH_USERNAME, 'password': 'wrong'}, 429, **extra)
+
+            transaction.set_rollback(True)
+        cache.clear()
+
+        self.stdout.write(self.style.SUCCESS('✓ Benchmark complete (single process, i.e. per core)'))
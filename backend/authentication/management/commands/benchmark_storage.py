@@ -0,0 +1,82 @@
+"""
+Django management command to measure per-request storage overhead
+Compares building a boto3 client per request (the old pattern) with the pooled
+process-wide client from storage.py, signing one URL each time. Signing is
+local, so no network or real bucket is needed; dummy credentials are used
+when S3 is not configured.
+"""
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from authentication import presigned_urls, storage
+
+
+DUMMY_S3_SETTINGS = {
+    'AWS_STORAGE_BUCKET_NAME': 'benchmark-bucket',
+    'AWS_S3_REGION_NAME': 'ap-south-1',
+    'AWS_ACCESS_KEY_ID': 'AKIABENCHMARK',
+    'AWS_SECRET_ACCESS_KEY': 'benchmark-secret',
+}
+
+
+class Command(BaseCommand):
+    help = 'Measure per-request overhead of ad hoc vs pooled S3 clients, and of the local backend'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=50, help='Operations per scenario')
+
+    def _time(self, label, iterations, operation):
+        started = time.perf_counter()
+        for i in range(iterations):
+            operation(i)
+        elapsed = time.perf_counter() - started
+        per_op = elapsed / iterations * 1000
+        self.stdout.write(f'{label:<36} {per_op:9.3f} ms/op  {iterations / elapsed:10.1f} ops/s')
+        return per_op
+
+    def handle(self, *args, **options):
+        import boto3
+
+        iterations = options['iterations']
+        overrides = {} if storage.s3_configured() else DUMMY_S3_SETTINGS
+
+        with override_settings(**overrides):
+            from django.conf import settings
+
+            def ad_hoc(i):
+                client = boto3.client(
+                    's3',
+                    region_name=settings.AWS_S3_REGION_NAME,
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                )
+                client.generate_presigned_url(
+                    'get_object', Params={'Bucket': settings.AWS_STORAGE_BUCKET_NAME, 'Key': f'k/{i}'}, ExpiresIn=3600
+                )
+
+            def pooled(i):
+                storage.get_s3_client().generate_presigned_url(
+                    'get_object', Params={'Bucket': settings.AWS_STORAGE_BUCKET_NAME, 'Key': f'k/{i}'}, ExpiresIn=3600
+                )
+
+            saved_client = storage._client
+            storage._client = None
+            try:
+                before = self._time('before: client per request + sign', iterations, ad_hoc)
+                pooled(0)  # build the shared client once, as the first request would
+                after = self._time('after: pooled client + sign', iterations * 20, pooled)
+                presigned_urls._local_urls.clear()
+                self._time('after: cached signed_url (steady state)', iterations * 20,
+                           lambda i: storage.S3Storage().signed_url(f'k/{i % iterations}'))
+            finally:
+                storage._client = saved_client
+
+        with tempfile.TemporaryDirectory() as root:
+            local = storage.LocalStorage(root=root, base_url='/media/')
+            payload = b'x' * 4096
+            self._time('local backend: save 4 KB', iterations, lambda i: local.save(f'bench/{i}.bin', payload))
+
+        self.stdout.write(self.style.SUCCESS(f'✓ Per-request overhead: {before:.2f} ms before, {after:.3f} ms after'))
@@ -0,0 +1,43 @@
+"""
+Django management command to run OCR on uploaded expense bills
+Run it from a scheduler or as a long-lived worker with --loop
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from authentication.ocr import get_ocr_engine_path, process_pending_expenses
+
+
+class Command(BaseCommand):
+    help = 'Process unprocessed expense bills through the configured OCR engine'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None, help='Bills claimed per batch')
+        parser.add_argument('--workers', type=int, default=None, help='OCR worker processes')
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new bills')
+        parser.add_argument('--sleep', type=float, default=10.0, help='Seconds to wait when the queue is empty')
+
+    def handle(self, *args, **options):
+        if not get_ocr_engine_path():
+            self.stdout.write('OCR_ENGINE is not set; nothing to do')
+            return
+
+        total = 0
+        while True:
+            processed = process_pending_expenses(
+                batch_size=options['batch_size'],
+                workers=options['workers'],
+            )
+            total += processed
+
+            if processed:
+                self.stdout.write(f'Processed {processed} bills')
+                continue
+
+            if not options['loop']:
+                break
+            time.sleep(options['sleep'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'✓ OCR complete: {total} bills processed')
+        )
@@ -0,0 +1,40 @@
+"""
+Django management command to run queued background jobs
+Run it from a scheduler or as a long-lived worker with --loop
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from authentication.jobs import process_jobs, worker_configuration_errors
+
+
+class Command(BaseCommand):
+    help = 'Run queued background jobs (club declarations, member emails), retrying failures'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None, help='Jobs claimed per batch')
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new jobs')
+        parser.add_argument('--sleep', type=float, default=5.0, help='Seconds to wait when the queue is empty')
+
+    def handle(self, *args, **options):
+        errors = worker_configuration_errors()
+        if errors:
+            raise CommandError('Refusing to run jobs: ' + '; '.join(errors))
+
+        total_ok = total_failed = 0
+        while True:
+            succeeded, failed = process_jobs(batch_size=options['batch_size'])
+            total_ok += succeeded
+            total_failed += failed
+
+            if succeeded or failed:
+                self.stdout.write(f'Ran {succeeded + failed} jobs ({failed} failed or retrying)')
+                continue
+
+            if not options['loop']:
+                break
+            time.sleep(options['sleep'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'✓ Jobs complete: {total_ok} succeeded, {total_failed} failed or retrying')
+        )
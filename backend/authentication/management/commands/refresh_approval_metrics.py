@@ -0,0 +1,32 @@
+"""
+Django management command to rebuild the approval SLA summary tables
+Run it from a scheduler or as a long-lived worker with --loop
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from authentication.approval_metrics import refresh_approval_metrics
+
+
+class Command(BaseCommand):
+    help = 'Recompute approval stage latency, reviewer throughput and backlog age'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--window-days', type=int, default=None, help='Only count reviews finished in this many days')
+        parser.add_argument('--sla-hours', type=int, default=None, help='Backlog age that counts as over SLA')
+        parser.add_argument('--loop', action='store_true', help='Keep refreshing')
+        parser.add_argument('--sleep', type=float, default=300.0, help='Seconds between refreshes')
+
+    def handle(self, *args, **options):
+        while True:
+            stage_rows, reviewer_rows = refresh_approval_metrics(
+                window_days=options['window_days'],
+                sla_hours=options['sla_hours'],
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f'✓ Refreshed {stage_rows} stage and {reviewer_rows} reviewer metrics')
+            )
+
+            if not options['loop']:
+                break
+            time.sleep(options['sleep'])
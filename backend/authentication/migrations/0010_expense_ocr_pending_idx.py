@@ -0,0 +1,24 @@
+# Generated by Django 5.0.1 on 2026-10-18 22:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "authentication",
+            "0009_event_admin_approved_at_event_admin_approved_by_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="eventexpense",
+            index=models.Index(
+                condition=models.Q(("ocr_processed", False)),
+                fields=["created_at"],
+                name="expense_ocr_pending_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.0.1 on 2026-10-18 22:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0010_expense_ocr_pending_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventSpendSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "daily_spend",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=12),
+                ),
+                (
+                    "cumulative_spend",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                ("expense_count", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="spend_snapshots",
+                        to="authentication.event",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["event", "date"],
+                "unique_together": {("event", "date")},
+            },
+        ),
+    ]
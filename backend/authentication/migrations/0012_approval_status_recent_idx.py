@@ -0,0 +1,20 @@
+# Generated by Django 5.0.1 on 2026-10-18 22:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0011_eventspendsnapshot"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="approvalrequest",
+            index=models.Index(
+                fields=["status", "-created_at", "-id"],
+                name="approval_status_recent_idx",
+            ),
+        ),
+    ]
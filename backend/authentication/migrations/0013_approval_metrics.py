@@ -0,0 +1,82 @@
+# Generated by Django 5.0.1 on 2026-10-18 22:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0012_approval_status_recent_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ApprovalStageMetric",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("item_type", models.CharField(max_length=30)),
+                ("stage", models.CharField(max_length=20)),
+                ("completed_count", models.IntegerField(default=0)),
+                ("approved_count", models.IntegerField(default=0)),
+                ("rejected_count", models.IntegerField(default=0)),
+                ("avg_hours", models.FloatField(blank=True, null=True)),
+                ("p50_hours", models.FloatField(blank=True, null=True)),
+                ("p90_hours", models.FloatField(blank=True, null=True)),
+                ("p95_hours", models.FloatField(blank=True, null=True)),
+                ("max_hours", models.FloatField(blank=True, null=True)),
+                ("pending_count", models.IntegerField(default=0)),
+                ("pending_p50_hours", models.FloatField(blank=True, null=True)),
+                ("pending_oldest_hours", models.FloatField(blank=True, null=True)),
+                ("pending_over_sla", models.IntegerField(default=0)),
+                ("refreshed_at", models.DateTimeField()),
+            ],
+            options={
+                "ordering": ["item_type", "stage"],
+                "unique_together": {("item_type", "stage")},
+            },
+        ),
+        migrations.CreateModel(
+            name="ApprovalReviewerMetric",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("item_type", models.CharField(max_length=30)),
+                ("stage", models.CharField(max_length=20)),
+                ("decisions", models.IntegerField(default=0)),
+                ("approved_count", models.IntegerField(default=0)),
+                ("rejected_count", models.IntegerField(default=0)),
+                ("p50_hours", models.FloatField(blank=True, null=True)),
+                ("last_decision_at", models.DateTimeField(blank=True, null=True)),
+                ("refreshed_at", models.DateTimeField()),
+                (
+                    "reviewer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="approval_metrics",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-decisions"],
+                "unique_together": {("reviewer", "item_type", "stage")},
+            },
+        ),
+    ]
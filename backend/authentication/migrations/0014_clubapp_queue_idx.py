@@ -0,0 +1,20 @@
+# Generated by Django 5.0.1 on 2026-10-18 22:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0013_approval_metrics"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="clubapplication",
+            index=models.Index(
+                fields=["status", "-priority", "-created_at", "-id"],
+                name="clubapp_queue_idx",
+            ),
+        ),
+    ]
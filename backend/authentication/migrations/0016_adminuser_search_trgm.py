@@ -0,0 +1,42 @@
+# Trigram indexes for roster search (icontains on name, username and email).
+# PostgreSQL only; other backends fall back to a scan.
+
+from django.db import migrations
+
+
+SEARCH_COLUMNS = ['first_name', 'last_name', 'username', 'email']
+
+
+def _index_name(column):
+    return f"adminuser_{column}_trgm_idx"
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = schema_editor.quote_name(apps.get_model('authentication', 'AdminUser')._meta.db_table)
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        # Matches the UPPER(col::text) LIKE UPPER(%s) that icontains generates
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {_index_name(column)} ON {table} "
+            f"USING gin (UPPER({schema_editor.quote_name(column)}::text) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {_index_name(column)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0015_background_jobs"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
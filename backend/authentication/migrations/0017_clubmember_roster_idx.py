@@ -0,0 +1,20 @@
+# Generated by Django 5.0.1 on 2026-10-18 22:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0016_adminuser_search_trgm"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="clubmember",
+            index=models.Index(
+                fields=["club", "role", "-created_at", "-id"],
+                name="clubmember_roster_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-18 22:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0017_clubmember_roster_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="adminuser",
+            name="last_seen",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-18 23:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0019_image_derivatives"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventexpense",
+            name="ocr_claimed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
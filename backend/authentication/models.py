@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.utils import timezone
@@ -71,6 +73,7 @@ class AdminUser(AbstractBaseUser, PermissionsMixin):
     # Timestamps
     date_joined = models.DateTimeField(default=timezone.now)
     last_login = models.DateTimeField(null=True, blank=True)
+    last_seen = models.DateTimeField(null=True, blank=True)  # Written in batches by activity.py
     updated_at = models.DateTimeField(auto_now=True)
     
     objects = AdminUserManager()
@@ -159,6 +162,10 @@ class ClubMember(models.Model):
 
     class Meta:
         unique_together = ('club', 'user', 'role')
+        indexes = [
+            # Keyset order of the club roster
+            models.Index(fields=['club', 'role', '-created_at', '-id'], name='clubmember_roster_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.role} @ {self.club.name}"
@@ -316,6 +323,8 @@ class ApprovalRequest(models.Model):
             models.Index(fields=['status', 'request_type']),
             models.Index(fields=['club', 'status']),
             models.Index(fields=['-created_at']),
+            # Keyset pagination of the approvals list
+            models.Index(fields=['status', '-created_at', '-id'], name='approval_status_recent_idx'),
         ]
 
     def __str__(self):
@@ -969,6 +978,7 @@ class EventExpense(models.Model):
     ocr_data = models.JSONField(default=dict, blank=True)  # Extracted invoice details
     ocr_confidence = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
     ocr_processed_at = models.DateTimeField(null=True, blank=True)
+    ocr_claimed_at = models.DateTimeField(null=True, blank=True)  # Lease held by an OCR worker (ocr.py)
     ocr_verified = models.BooleanField(default=False)
     
     # Status & Approval
@@ -1003,11 +1013,47 @@ class EventExpense(models.Model):
             models.Index(fields=['event', 'status']),
             models.Index(fields=['status', '-created_at']),
             models.Index(fields=['submitted_by']),
+            # Queue index for the OCR worker (only unprocessed bills)
+            models.Index(
+                fields=['created_at'],
+                name='expense_ocr_pending_idx',
+                condition=models.Q(ocr_processed=False),
+            ),
         ]
 
     def __str__(self):
         return f"{self.expense_id} - {self.title} (₹{self.total_amount})"
 
+    # Statuses that count towards actual spend
+    COUNTED_STATUSES = ['approved', 'paid', 'reimbursed']
+
+    @property
+    def spend_date(self):
+        """Day this expense is booked against in the spend time-series."""
+        if self.payment_date:
+            return self.payment_date
+        return timezone.localdate(self.created_at) if self.created_at else None
+
+
+class EventSpendSnapshot(models.Model):
+    """
+    Per-event daily spend, maintained incrementally from EventExpense changes.
+    Backs the live ledger spend-over-time chart without rescanning expenses.
+    """
+    event = models.ForeignKey('Event', on_delete=models.CASCADE, related_name='spend_snapshots')
+    date = models.DateField()
+    daily_spend = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    cumulative_spend = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    expense_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['event', 'date']
+        unique_together = ('event', 'date')
+
+    def __str__(self):
+        return f"{self.event_id} @ {self.date}: ₹{self.daily_spend}"
+
 
 class EventCertificate(models.Model):
     """
@@ -1593,6 +1639,8 @@ class ClubApplication(models.Model):
             models.Index(fields=['application_type', 'status']),
             models.Index(fields=['submitted_by', '-created_at']),
             models.Index(fields=['status', '-created_at']),
+            # Review queues ordered by priority, then newest
+            models.Index(fields=['status', '-priority', '-created_at', '-id'], name='clubapp_queue_idx'),
         ]
 
     def __str__(self):
@@ -1684,3 +1732,135 @@ class ApplicationComment(models.Model):
 
     def __str__(self):
         return f"Comment on {self.application.application_id} by {self.user.username}"
+
+
+class ApprovalStageMetric(models.Model):
+    """
+    Time-in-state summary per workflow stage, rebuilt periodically from the
+    review timestamps (see authentication.approval_metrics).
+    Durations are in hours.
+    """
+    item_type = models.CharField(max_length=30)
+    stage = models.CharField(max_length=20)
+
+    # Reviews completed within the reporting window
+    completed_count = models.IntegerField(default=0)
+    approved_count = models.IntegerField(default=0)
+    rejected_count = models.IntegerField(default=0)
+    avg_hours = models.FloatField(null=True, blank=True)
+    p50_hours = models.FloatField(null=True, blank=True)
+    p90_hours = models.FloatField(null=True, blank=True)
+    p95_hours = models.FloatField(null=True, blank=True)
+    max_hours = models.FloatField(null=True, blank=True)
+
+    # Items still waiting in this stage
+    pending_count = models.IntegerField(default=0)
+    pending_p50_hours = models.FloatField(null=True, blank=True)
+    pending_oldest_hours = models.FloatField(null=True, blank=True)
+    pending_over_sla = models.IntegerField(default=0)
+
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['item_type', 'stage']
+        unique_together = ('item_type', 'stage')
+
+    def __str__(self):
+        return f"{self.item_type}/{self.stage}: p50 {self.p50_hours}h"
+
+
+class ApprovalReviewerMetric(models.Model):
+    """Per-reviewer decision throughput and latency, rebuilt with ApprovalStageMetric."""
+    reviewer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='approval_metrics'
+    )
+    item_type = models.CharField(max_length=30)
+    stage = models.CharField(max_length=20)
+
+    decisions = models.IntegerField(default=0)
+    approved_count = models.IntegerField(default=0)
+    rejected_count = models.IntegerField(default=0)
+    p50_hours = models.FloatField(null=True, blank=True)
+    last_decision_at = models.DateTimeField(null=True, blank=True)
+
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-decisions']
+        unique_together = ('reviewer', 'item_type', 'stage')
+
+    def __str__(self):
+        return f"{self.reviewer_id} {self.item_type}/{self.stage}: {self.decisions}"
+
+
+class BackgroundJob(models.Model):
+    """
+    Unit of deferred work on the database-backed queue (see authentication.jobs).
+    Jobs queued by one action share a handle that clients poll for progress.
+    """
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('succeeded', 'Succeeded'),
+        ('failed', 'Failed'),
+    ]
+
+    handle = models.UUIDField(default=uuid.uuid4, db_index=True)
+    job_type = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+
+    attempts = models.IntegerField(default=0)
+    max_attempts = models.IntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    result = models.JSONField(default=dict, blank=True)
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='background_jobs'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='job_ready_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_type} [{self.status}] {self.handle}"
+
+
+class ImageDerivative(models.Model):
+    """
+    Resized variants of one stored image, keyed by its URL
+    (see authentication.image_derivatives).
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('ready', 'Ready'),
+        ('skipped', 'Skipped'),
+        ('failed', 'Failed'),
+    ]
+
+    source_hash = models.CharField(max_length=64, unique=True)
+    source_url = models.TextField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    # {"320": {"webp": url, "jpeg": url}, ...}
+    variants = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.source_url} [{self.status}]"
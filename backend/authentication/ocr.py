@@ -0,0 +1,154 @@
+"""
+Expense Bill OCR Pipeline
+Background processing of EventExpense bills through a pluggable OCR engine
+(OCR_ENGINE; nothing runs until one is configured). Bills are claimed in a
+short transaction with SELECT ... FOR UPDATE SKIP LOCKED, which stamps a
+lease (ocr_claimed_at) on them; the engine then runs with no transaction or
+row locks open, and the results are written in a second transaction. A
+worker that dies mid-batch leaves leases that expire after OCR_CLAIM_TIMEOUT.
+"""
+
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+
+class OCREngine:
+    """
+    Base class for OCR engines.
+    Subclasses implement extract() and return a dict with 'data' (extracted
+    invoice fields) and 'confidence' (0-100).
+    """
+
+    def extract(self, bill_url):
+        raise NotImplementedError('OCR engines must implement extract()')
+
+
+class StubOCREngine(OCREngine):
+    """
+    Deterministic engine for tests. Derives stable fake invoice details from
+    the bill URL, without any network access; never configure it for real data.
+    """
+
+    def extract(self, bill_url):
+        digest = hashlib.sha256(bill_url.encode('utf-8')).hexdigest()
+        return {
+            'data': {
+                'invoice_number': f"INV-{digest[:8].upper()}",
+                'vendor': f"Vendor {digest[8:12].upper()}",
+                'total_amount': str(Decimal(int(digest[12:18], 16) % 100000) / 100),
+                'engine': 'stub',
+            },
+            'confidence': Decimal(50 + int(digest[18:20], 16) % 50),
+        }
+
+
+def get_ocr_engine_path():
+    """Dotted path of the configured OCR engine class, or '' if none is configured."""
+    return getattr(settings, 'OCR_ENGINE', '')
+
+
+def _run_engine(engine_path, expense_pk, bill_url):
+    """
+    Run a single bill through the engine.
+    Module-level so it can be pickled and executed in a worker process.
+    """
+    try:
+        engine = import_string(engine_path)()
+        result = engine.extract(bill_url)
+        return expense_pk, result.get('data', {}), result.get('confidence'), None
+    except Exception as exc:
+        return expense_pk, {}, None, str(exc)
+
+
+def pending_expenses():
+    """Expenses with an attached bill that have not been through OCR yet."""
+    from .models import EventExpense
+
+    return EventExpense.objects.filter(ocr_processed=False).filter(
+        ~Q(bill_image_url='') | ~Q(bill_pdf_url='')
+    )
+
+
+def claim_expenses(batch_size):
+    """Lease up to batch_size unclaimed bills (or bills whose lease expired). Returns them."""
+    from .models import EventExpense
+
+    now = timezone.now()
+    stale = now - timedelta(seconds=getattr(settings, 'OCR_CLAIM_TIMEOUT', 600))
+    with transaction.atomic():
+        batch = list(
+            pending_expenses()
+            .filter(Q(ocr_claimed_at__isnull=True) | Q(ocr_claimed_at__lt=stale))
+            .select_for_update(skip_locked=True)
+            .only('id', 'bill_image_url', 'bill_pdf_url', 'ocr_claimed_at')
+            .order_by('created_at')[:batch_size]
+        )
+        for expense in batch:
+            expense.ocr_claimed_at = now
+        EventExpense.objects.bulk_update(batch, ['ocr_claimed_at'])
+    return batch
+
+
+def process_pending_expenses(batch_size=None, workers=None, engine_path=None):
+    """
+    Claim one batch of unprocessed bills, run OCR across a process pool and
+    write the results back with a single bulk_update.
+    Returns the number of expenses processed.
+    """
+    from .models import EventExpense
+
+    engine_path = engine_path or get_ocr_engine_path()
+    if not engine_path:
+        raise ImproperlyConfigured('OCR_ENGINE is not set')
+    batch_size = batch_size or getattr(settings, 'OCR_BATCH_SIZE', 50)
+    workers = workers if workers is not None else getattr(settings, 'OCR_WORKERS', 2)
+
+    batch = claim_expenses(batch_size)
+    if not batch:
+        return 0
+
+    jobs = [(engine_path, e.pk, e.bill_image_url or e.bill_pdf_url) for e in batch]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_run_engine, *zip(*jobs)))
+    else:
+        results = [_run_engine(*job) for job in jobs]
+
+    now = timezone.now()
+    claims = {e.pk: e.ocr_claimed_at for e in batch}
+    with transaction.atomic():
+        # Only write rows whose lease is still ours (not expired and re-claimed meanwhile)
+        held = {
+            e.pk: e for e in EventExpense.objects.select_for_update()
+            .filter(pk__in=claims, ocr_processed=False)
+            .only('id', 'ocr_claimed_at')
+            if e.ocr_claimed_at == claims[e.pk]
+        }
+        for expense_pk, data, confidence, error in results:
+            expense = held.get(expense_pk)
+            if expense is None:
+                continue
+            if error:
+                # Mark as processed so a bad bill does not block the queue
+                data = {'error': error}
+            expense.ocr_data = data
+            expense.ocr_confidence = confidence
+            expense.ocr_processed = True
+            expense.ocr_processed_at = now
+            expense.ocr_claimed_at = None
+
+        EventExpense.objects.bulk_update(
+            list(held.values()),
+            ['ocr_data', 'ocr_confidence', 'ocr_processed', 'ocr_processed_at', 'ocr_claimed_at'],
+        )
+
+    return len(held)
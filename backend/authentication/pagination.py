@@ -0,0 +1,127 @@
+"""
+Keyset Pagination
+Cursor-based paging over a fixed ordering. Each page is a range scan that
+starts after the last row of the previous page, so deep pages cost the same
+as the first one (no OFFSET).
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.db.models import Q
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded or does not match the ordering."""
+
+
+def _to_json(value):
+    if isinstance(value, datetime):
+        return {'t': 'dt', 'v': value.isoformat()}
+    if isinstance(value, date):
+        return {'t': 'd', 'v': value.isoformat()}
+    if isinstance(value, Decimal):
+        return {'t': 'dec', 'v': str(value)}
+    return value
+
+
+def _from_json(value):
+    if isinstance(value, dict):
+        kind, raw = value.get('t'), value.get('v')
+        if kind == 'dt':
+            return parse_datetime(raw)
+        if kind == 'd':
+            return parse_date(raw)
+        if kind == 'dec':
+            return Decimal(raw)
+        raise InvalidCursor('Unknown cursor value type')
+    return value
+
+
+def encode_cursor(values):
+    payload = json.dumps([_to_json(v) for v in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, size):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor('Malformed cursor') from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursor('Cursor does not match ordering')
+    values = [_from_json(v) for v in values]
+    if any(v is None for v in values):
+        raise InvalidCursor('Cursor does not match ordering')
+    return values
+
+
+def parse_page_size(raw, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Clamp a page_size query parameter to [1, maximum]."""
+    if raw in (None, ''):
+        return default
+    try:
+        size = int(raw)
+    except (TypeError, ValueError):
+        raise InvalidCursor('page_size must be an integer')
+    return max(1, min(size, maximum))
+
+
+def _split(ordering):
+    """'-created_at' -> ('created_at', True)"""
+    return [(f[1:], True) if f.startswith('-') else (f, False) for f in ordering]
+
+
+def _after(ordering, values):
+    """
+    Q selecting rows strictly after `values` in `ordering`:
+    (a > x) OR (a = x AND b > y) OR ...
+    """
+    fields = _split(ordering)
+    condition = Q()
+    for i, (field, descending) in enumerate(fields):
+        step = Q(**{f"{field}__{'lt' if descending else 'gt'}": values[i]})
+        for j, (prev_field, _) in enumerate(fields[:i]):
+            step &= Q(**{prev_field: values[j]})
+        condition |= step
+    return condition
+
+
+def cursor_condition(ordering, cursor):
+    """Q for rows after `cursor` in `ordering` (empty Q when there is no cursor)."""
+    if not cursor:
+        return Q()
+    return _after(ordering, decode_cursor(cursor, len(ordering)))
+
+
+def _row_value(row, field):
+    if isinstance(row, dict):
+        return row[field]
+    return getattr(row, field)
+
+
+def page_from_rows(rows, ordering, page_size):
+    """Trim a page_size + 1 fetch to one page and build the cursor for the next one."""
+    rows = list(rows)
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor([_row_value(last, field) for field, _ in _split(ordering)])
+
+
+def keyset_paginate(queryset, ordering, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Return (rows, next_cursor) for one page of `queryset` ordered by `ordering`.
+    The last ordering field must be unique (e.g. 'id') so the order is total.
+    """
+    queryset = queryset.order_by(*ordering).filter(cursor_condition(ordering, cursor))
+    return page_from_rows(queryset[:page_size + 1], ordering, page_size)
@@ -0,0 +1,121 @@
+"""
+Presigned URLs
+Private S3 objects are linked through presigned GET URLs, signed with the
+pooled client from storage.py. Signed URLs are cached per (bucket, key, expiry
+tier), in process memory and in the shared cache, and handed out again until
+shortly before they expire, so listing pages do no signing work in the steady
+state.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .storage import get_s3_client, object_url_prefix
+
+
+# Lifetime of the signed URL per tier, in seconds
+EXPIRY_TIERS = {
+    'hour': 3600,
+    'day': 86400,
+    'week': 604800,
+}
+
+# A cached URL is handed out while at least this fraction of its lifetime remains
+MIN_REMAINING_FRACTION = 0.1
+
+# Upper bound on URLs remembered in process memory
+LOCAL_CACHE_MAX_ENTRIES = 10000
+
+# {cache key: (url, reuse_until)}, in front of the shared cache
+_local_urls = {}
+
+
+def key_from_url(url):
+    """Object key of a plain URL in the configured bucket, or None."""
+    prefix = object_url_prefix()
+    if url and url.startswith(prefix):
+        return url[len(prefix):]
+    return None
+
+
+def _cache_key(bucket, key, tier):
+    digest = hashlib.md5(f"{bucket}/{key}".encode('utf-8')).hexdigest()
+    return f"presigned:{tier}:{digest}"
+
+
+def presigned_get_urls(keys, tier='day', bucket=None):
+    """
+    {key: presigned GET URL} for many objects. URLs not held in process memory
+    are looked up with one get_many; only missing ones are signed. Keys that cannot be signed are
+    left out.
+    """
+    client = get_s3_client()
+    if client is None or not keys:
+        return {}
+
+    bucket = bucket or settings.AWS_STORAGE_BUCKET_NAME
+    expires_in = EXPIRY_TIERS[tier]
+    cache_keys = {_cache_key(bucket, key, tier): key for key in set(keys)}
+    now = time.time()
+
+    urls = {}
+    missing = []
+    for cache_key, key in cache_keys.items():
+        entry = _local_urls.get(cache_key)
+        if entry and entry[1] > now:
+            urls[key] = entry[0]
+        else:
+            missing.append(cache_key)
+
+    if missing:
+        for cache_key, entry in cache.get_many(missing).items():
+            if entry[1] > now:
+                urls[cache_keys[cache_key]] = entry[0]
+                _local_urls[cache_key] = entry
+
+    signed = {}
+    # Stop reusing a URL while it still has MIN_REMAINING_FRACTION of its lifetime left
+    reuse_for = int(expires_in * (1 - MIN_REMAINING_FRACTION))
+    for cache_key, key in cache_keys.items():
+        if key in urls:
+            continue
+        try:
+            url = client.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': bucket, 'Key': key},
+                ExpiresIn=expires_in
+            )
+        except Exception:
+            continue
+        urls[key] = url
+        signed[cache_key] = (url, now + reuse_for)
+
+    if signed:
+        if len(_local_urls) + len(signed) > LOCAL_CACHE_MAX_ENTRIES:
+            _local_urls.clear()
+        _local_urls.update(signed)
+        cache.set_many(signed, reuse_for)
+    return urls
+
+
+def presigned_get_url(key, tier='day', bucket=None):
+    return presigned_get_urls([key], tier, bucket).get(key)
+
+
+def presign_object_urls(urls, tier='day'):
+    """
+    Map plain object URLs of the configured bucket to presigned URLs. Any URL
+    that is outside the bucket, or cannot be signed, maps to itself.
+    """
+    keys = {url: key_from_url(url) for url in urls if url}
+    signed = presigned_get_urls([key for key in keys.values() if key], tier)
+    return {url: signed.get(key, url) for url, key in keys.items()}
+
+
+def presign_object_url(url, tier='day'):
+    if not url:
+        return url
+    return presign_object_urls([url], tier)[url]
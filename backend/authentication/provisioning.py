@@ -0,0 +1,235 @@
+"""
+Bulk User Provisioning
+Creates accounts and club memberships for many people at once: existing users
+are resolved by email in one query, new passwords are hashed across a process
+pool, and AdminUser / ClubMember rows are written with bulk_create.
+Used by club creation and 'manage.py provision_users'.
+"""
+
+import csv
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from .club_directory import invalidate_club_directory
+from .reviewer_scope import invalidate_reviewer_scopes
+
+
+PROVISIONING_BATCH_SIZE = 1000
+
+CSV_COLUMNS = ['email', 'name', 'role', 'department', 'academic_year', 'club_number']
+
+
+class ProvisioningError(ValueError):
+    """Invalid provisioning input."""
+
+
+class ProvisioningResult:
+    def __init__(self):
+        # [(user, raw password or None)] for new accounts
+        self.created = []
+        self.existing = []
+        self.memberships_created = 0
+        self.memberships_existing = 0
+        # [(row number, message)]
+        self.errors = []
+
+
+def hash_passwords(passwords, workers=None):
+    """Hash many passwords with the configured hasher, across a process pool."""
+    workers = workers if workers is not None else getattr(settings, 'PROVISIONING_HASH_WORKERS', 4)
+    if workers > 1 and len(passwords) > 1:
+        chunksize = max(1, len(passwords) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(make_password, passwords, chunksize=chunksize))
+    return [make_password(p) for p in passwords]
+
+
+def read_members_csv(file_obj):
+    """Rows of a provisioning CSV (header: email,name,role,department,academic_year,club_number)."""
+    reader = csv.DictReader(file_obj)
+    if 'email' not in (reader.fieldnames or []):
+        raise ProvisioningError('CSV must have an email column')
+    return [
+        {column: (row.get(column) or '').strip() for column in CSV_COLUMNS}
+        for row in reader
+    ]
+
+
+def _split_name(full_name):
+    parts = (full_name or '').strip().split(maxsplit=1)
+    return (parts[0] if parts else ''), (parts[1] if len(parts) > 1 else '')
+
+
+def _unique_usernames(emails):
+    """{email: username} from the email's local part, suffixed where it is already taken."""
+    from .models import AdminUser
+
+    wanted = {email: email.split('@')[0] for email in emails}
+    assigned = {}
+    taken = set()
+    suffix = 0
+    while wanted:
+        taken |= set(
+            AdminUser.objects.filter(username__in=set(wanted.values())).values_list('username', flat=True)
+        )
+        retry = {}
+        for email, username in wanted.items():
+            if username in taken:
+                retry[email] = f"{email.split('@')[0]}{suffix + 1}"
+            else:
+                assigned[email] = username
+                taken.add(username)
+        wanted = retry
+        suffix += 1
+    return assigned
+
+
+def provision_members(rows, club=None, issue_passwords=True, workers=None, batch_size=PROVISIONING_BATCH_SIZE,
+                      memberships=True):
+    """
+    Create missing users and memberships for `rows` (dicts with email, name,
+    role, department, academic_year and optionally club_number).
+    Memberships go to `club` when given, otherwise to each row's club_number;
+    with memberships=False only the users are resolved (see add_memberships).
+    With issue_passwords=False new accounts get an unusable password (to be
+    issued later, e.g. by the club notification jobs).
+    Returns (result, [(user, row)] in input order).
+    """
+    from .models import AdminUser, Club, ClubMember
+
+    result = ProvisioningResult()
+
+    cleaned = {}
+    for number, row in enumerate(rows, start=1):
+        email = (row.get('email') or '').strip().lower()
+        if '@' not in email:
+            result.errors.append((number, f"Invalid email: {row.get('email')!r}"))
+            continue
+        role = (row.get('role') or 'member').strip().lower()
+        if role not in dict(ClubMember.ROLE_CHOICES):
+            result.errors.append((number, f"Unknown role: {role}"))
+            continue
+        # A repeated email keeps its first name/role for the account
+        cleaned.setdefault(email, []).append((number, {**row, 'email': email, 'role': role}))
+
+    clubs = {}
+    if club is None and memberships:
+        numbers = {r['club_number'] for entries in cleaned.values() for _, r in entries if r.get('club_number')}
+        clubs = {c.club_number: c for c in Club.objects.filter(club_number__in=numbers)}
+
+    users = {u.email.lower(): u for u in AdminUser.objects.filter(email__in=list(cleaned))}
+    result.existing = list(users.values())
+
+    # Hashing takes minutes for large imports, so it happens before the
+    # transaction opens; only the writes below hold row locks
+    new_emails = [email for email in cleaned if email not in users]
+    if issue_passwords:
+        passwords = [secrets.token_urlsafe(10) for _ in new_emails]
+        hashes = hash_passwords(passwords, workers)
+    else:
+        passwords = [None] * len(new_emails)
+        hashes = [make_password(None) for _ in new_emails]
+
+    with transaction.atomic():
+        # Fill in names that were never set
+        named = []
+        for email, user in users.items():
+            full_name = cleaned[email][0][1].get('name')
+            if full_name and not user.first_name and not user.last_name:
+                user.first_name, user.last_name = _split_name(full_name)
+                named.append(user)
+        AdminUser.objects.bulk_update(named, ['first_name', 'last_name'], batch_size=batch_size)
+
+        usernames = _unique_usernames(new_emails)
+        new_users = []
+        for email, password, hashed in zip(new_emails, passwords, hashes):
+            first = cleaned[email][0][1]
+            first_name, last_name = _split_name(first.get('name'))
+            user = AdminUser(
+                username=usernames[email],
+                email=email,
+                role='faculty' if first['role'] == 'faculty' else 'student',
+                first_name=first_name,
+                last_name=last_name,
+                department=first.get('department', ''),
+                password=hashed,
+            )
+            new_users.append(user)
+            result.created.append((user, password))
+        AdminUser.objects.bulk_create(new_users, batch_size=batch_size)
+        # bulk_create may not return primary keys on every backend
+        if new_users and new_users[0].pk is None:
+            by_email = {u.email: u for u in AdminUser.objects.filter(email__in=new_emails)}
+            new_users = [by_email[u.email] for u in new_users]
+            result.created = [(by_email[u.email], p) for u, p in result.created]
+        users.update({u.email: u for u in new_users})
+
+        ordered = sorted(
+            ((number, users[email], row) for email, entries in cleaned.items() for number, row in entries),
+            key=lambda entry: entry[0],
+        )
+        if memberships:
+            _create_memberships(ordered, result, club, clubs, batch_size)
+
+    return result, [(user, row) for _, user, row in ordered]
+
+
+def add_memberships(members, club, batch_size=PROVISIONING_BATCH_SIZE):
+    """
+    Memberships in `club` for [(user, row)] as returned by
+    provision_members(..., memberships=False). Returns the ProvisioningResult.
+    """
+    result = ProvisioningResult()
+    entries = [(number, user, row) for number, (user, row) in enumerate(members, start=1)]
+    with transaction.atomic():
+        _create_memberships(entries, result, club, {}, batch_size)
+    return result
+
+
+def _create_memberships(entries, result, club, clubs, batch_size):
+    """Bulk-create the missing memberships for [(row number, user, row)]."""
+    from .models import ClubMember
+
+    wanted = []
+    for number, user, row in entries:
+        target = club or clubs.get(row.get('club_number'))
+        if target is None:
+            if row.get('club_number'):
+                result.errors.append((number, f"Unknown club: {row['club_number']}"))
+            continue
+        wanted.append((target, user, row))
+
+    existing_members = set()
+    if wanted:
+        existing_members = set(
+            ClubMember.objects.filter(
+                club_id__in={c.id for c, _, _ in wanted},
+                user_id__in={u.id for _, u, _ in wanted},
+            ).values_list('club_id', 'user_id', 'role')
+        )
+    memberships = []
+    for target, user, row in wanted:
+        key = (target.id, user.id, row['role'])
+        if key in existing_members:
+            result.memberships_existing += 1
+            continue
+        existing_members.add(key)
+        memberships.append(ClubMember(
+            club=target,
+            user=user,
+            role=row['role'],
+            department=row.get('department', ''),
+            academic_year=row.get('academic_year', ''),
+        ))
+    ClubMember.objects.bulk_create(memberships, batch_size=batch_size)
+    result.memberships_created += len(memberships)
+
+    if memberships:
+        # bulk_create skips the ClubMember signals that drop cached scopes and the directory
+        affected = {m.user_id for m in memberships}
+        transaction.on_commit(lambda: invalidate_reviewer_scopes(affected))
+        transaction.on_commit(invalidate_club_directory)
@@ -0,0 +1,162 @@
+"""
+Budget Reports
+Cross-club budget utilization computed with grouped SQL instead of per-event calls.
+"""
+
+from decimal import Decimal
+
+from django.db.models import Case, Count, DecimalField, IntegerField, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, ExtractYear
+from django.utils import timezone
+
+from .caching import generational_key
+
+
+BUDGET_REPORT_NAMESPACE = 'budget_report'
+
+# Events whose budget has been signed off by admin
+APPROVED_EVENT_STATUSES = ['approved', 'in_progress', 'completed', 'closed']
+
+TOP_CATEGORY_LIMIT = 3
+
+
+def academic_term(year, half):
+    """
+    Label for an academic term.
+    half=1 is the odd semester (Jul-Dec), half=2 the even semester (Jan-Jun).
+    """
+    if half == 1:
+        return f"{year}-{(year + 1) % 100:02d} Odd"
+    return f"{year - 1}-{year % 100:02d} Even"
+
+
+def _utilization(actual, approved):
+    if approved:
+        return round(float(actual / approved * 100), 2)
+    return 0
+
+
+def _money(value):
+    return float(value or 0)
+
+
+def build_budget_utilization_report():
+    """
+    Approved vs. actual spend per club and academic term.
+    One grouped query over Event (actual spend via a correlated expense subquery)
+    plus one grouped query for spend by category.
+    """
+    from .models import Event, EventExpense
+
+    money = DecimalField(max_digits=14, decimal_places=2)
+    zero = Value(Decimal('0'), output_field=money)
+    approved_events = Q(status__in=APPROVED_EVENT_STATUSES)
+
+    event_spend = EventExpense.objects.filter(
+        event=OuterRef('pk'),
+        status__in=EventExpense.COUNTED_STATUSES,
+    ).order_by().values('event').annotate(total=Sum('total_amount')).values('total')
+
+    rows = Event.objects.annotate(
+        event_actual_spend=Coalesce(Subquery(event_spend, output_field=money), zero),
+        term_year=ExtractYear('start_date'),
+        term_half=Case(
+            When(start_date__month__gte=7, then=Value(1)),
+            default=Value(2),
+            output_field=IntegerField(),
+        ),
+    ).order_by().values(
+        'primary_club_id', 'primary_club__name', 'primary_club__club_number', 'term_year', 'term_half'
+    ).annotate(
+        event_count=Count('id'),
+        approved_event_count=Count('id', filter=approved_events),
+        estimated_budget=Coalesce(Sum('estimated_budget'), zero),
+        approved_budget=Coalesce(Sum('approved_budget', filter=approved_events), zero),
+        actual_spend=Coalesce(Sum('event_actual_spend', filter=approved_events), zero),
+    )
+
+    category_rows = EventExpense.objects.filter(
+        status__in=EventExpense.COUNTED_STATUSES,
+        event__status__in=APPROVED_EVENT_STATUSES,
+    ).order_by().values('event__primary_club_id', 'category').annotate(
+        total=Sum('total_amount'),
+        expense_count=Count('id'),
+    )
+
+    clubs = {}
+    for row in rows:
+        club = clubs.setdefault(row['primary_club_id'], {
+            'club_id': row['primary_club_id'],
+            'club_name': row['primary_club__name'],
+            'club_number': row['primary_club__club_number'],
+            'event_count': 0,
+            'approved_event_count': 0,
+            'estimated_budget': Decimal('0'),
+            'approved_budget': Decimal('0'),
+            'actual_spend': Decimal('0'),
+            'terms': [],
+            'top_categories': [],
+        })
+        club['event_count'] += row['event_count']
+        club['approved_event_count'] += row['approved_event_count']
+        club['estimated_budget'] += row['estimated_budget']
+        club['approved_budget'] += row['approved_budget']
+        club['actual_spend'] += row['actual_spend']
+        club['terms'].append({
+            'term': academic_term(row['term_year'], row['term_half']),
+            'sort_key': (row['term_year'], -row['term_half']),
+            'event_count': row['event_count'],
+            'approved_event_count': row['approved_event_count'],
+            'estimated_budget': _money(row['estimated_budget']),
+            'approved_budget': _money(row['approved_budget']),
+            'actual_spend': _money(row['actual_spend']),
+            'variance': _money(row['approved_budget'] - row['actual_spend']),
+            'utilization': _utilization(row['actual_spend'], row['approved_budget']),
+        })
+
+    categories_by_club = {}
+    for row in category_rows:
+        categories_by_club.setdefault(row['event__primary_club_id'], []).append(row)
+
+    category_labels = dict(EventExpense.CATEGORY_CHOICES)
+    report = []
+    for club_id, club in clubs.items():
+        top = sorted(categories_by_club.get(club_id, []), key=lambda r: r['total'], reverse=True)
+        club['top_categories'] = [
+            {
+                'category': r['category'],
+                'category_display': category_labels.get(r['category'], r['category']),
+                'total': _money(r['total']),
+                'expense_count': r['expense_count'],
+                'share': _utilization(r['total'], club['actual_spend']),
+            }
+            for r in top[:TOP_CATEGORY_LIMIT]
+        ]
+        club['terms'].sort(key=lambda t: t['sort_key'], reverse=True)
+        for term in club['terms']:
+            del term['sort_key']
+        club['variance'] = _money(club['approved_budget'] - club['actual_spend'])
+        club['utilization'] = _utilization(club['actual_spend'], club['approved_budget'])
+        for field in ['estimated_budget', 'approved_budget', 'actual_spend']:
+            club[field] = _money(club[field])
+        report.append(club)
+
+    report.sort(key=lambda c: c['club_name'].lower())
+
+    total_approved = round(sum(c['approved_budget'] for c in report), 2)
+    total_actual = round(sum(c['actual_spend'] for c in report), 2)
+
+    return {
+        'clubs': report,
+        'totals': {
+            'approved_budget': total_approved,
+            'actual_spend': total_actual,
+            'variance': round(total_approved - total_actual, 2),
+            'utilization': round(total_actual / total_approved * 100, 2) if total_approved else 0,
+        },
+        'generated_at': timezone.now().isoformat(),
+    }
+
+
+def budget_report_cache_key():
+    return generational_key(BUDGET_REPORT_NAMESPACE, 'utilization')
@@ -0,0 +1,87 @@
+"""
+Reviewer Scope
+Which clubs a user may review for, resolved once per request. Active club
+memberships are loaded in one query, memoized on the request and kept in a
+short-TTL cache keyed by user; ClubMember writes drop the cached entry.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def _cache_key(user_id):
+    return f"reviewer_scope:{user_id}"
+
+
+class ReviewerScope:
+    """What a user may review: every club as admin, or the clubs they mentor as faculty."""
+
+    def __init__(self, is_admin, club_roles):
+        self.is_admin = is_admin
+        # {club_id: [roles]} for the user's active memberships
+        self.club_roles = club_roles
+        self.faculty_club_ids = [
+            club_id for club_id, roles in club_roles.items() if 'faculty' in roles
+        ]
+
+    @property
+    def is_faculty(self):
+        return bool(self.faculty_club_ids)
+
+    @property
+    def is_reviewer(self):
+        return self.is_admin or self.is_faculty
+
+    def is_faculty_of(self, club_id):
+        return club_id in self.faculty_club_ids
+
+    def can_review_club(self, club_id):
+        return self.is_admin or self.is_faculty_of(club_id)
+
+    def roles_in(self, club_id):
+        return self.club_roles.get(club_id, [])
+
+    @classmethod
+    def for_user(cls, user):
+        """Build the scope from the database, bypassing every cache."""
+        return cls(getattr(user, 'role', None) == 'admin', load_club_roles(user.pk))
+
+
+def load_club_roles(user_id):
+    from .models import ClubMember
+
+    club_roles = {}
+    memberships = ClubMember.objects.filter(
+        user_id=user_id,
+        status='active'
+    ).values_list('club_id', 'role')
+    for club_id, role in memberships:
+        club_roles.setdefault(club_id, []).append(role)
+    return club_roles
+
+
+def get_reviewer_scope(request):
+    """Reviewer scope of request.user, computed at most once per request."""
+    scope = getattr(request, '_reviewer_scope', None)
+    if scope is not None:
+        return scope
+
+    user = request.user
+    key = _cache_key(user.pk)
+    club_roles = cache.get(key)
+    if club_roles is None:
+        club_roles = load_club_roles(user.pk)
+        cache.set(key, club_roles, getattr(settings, 'REVIEWER_SCOPE_CACHE_TTL', 60))
+
+    # Role is read from the freshly authenticated user, never from the cache
+    scope = ReviewerScope(getattr(user, 'role', None) == 'admin', club_roles)
+    request._reviewer_scope = scope
+    return scope
+
+
+def invalidate_reviewer_scope(user_id):
+    cache.delete(_cache_key(user_id))
+
+
+def invalidate_reviewer_scopes(user_ids):
+    cache.delete_many([_cache_key(user_id) for user_id in user_ids])
@@ -0,0 +1,146 @@
+"""
+Refresh Token Revocation
+Read path for simplejwt's token blacklist, so checking a refresh token
+(TokenRefreshView, logout_view) costs no query in the common case:
+
+- a Bloom filter of every unexpired blacklisted jti, rebuilt from the
+  database at most every TOKEN_BLACKLIST_SYNC_INTERVAL seconds (expired
+  entries simply are not reloaded). A negative answer is final; a positive
+  one is confirmed against the database, since it is either a real reuse of
+  a revoked token or a rare false positive.
+- an exact set of jtis revoked or confirmed by this process since the last
+  sync.
+
+Revocations (logout, rotation) are written to the blacklist tables when
+they happen, so they survive restarts; other processes pick them up at
+their next sync. Expired rows are removed from the database by
+`manage.py flushexpiredtokens`.
+"""
+
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing of one blake2b digest)."""
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(capacity, 1)
+        self.size = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class _Blacklist:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bloom = None
+        self.recent = {}    # jti -> time.monotonic() it was revoked or confirmed here
+        self.synced_at = 0.0
+
+    def _sync_interval(self):
+        return getattr(settings, 'TOKEN_BLACKLIST_SYNC_INTERVAL', 30)
+
+    def maybe_sync(self):
+        if time.monotonic() - self.synced_at >= self._sync_interval():
+            self.sync()
+
+    def sync(self):
+        """Rebuild the filter from the unexpired blacklist rows."""
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+        started = time.monotonic()
+        with self.lock:
+            # Claim the interval first so concurrent requests keep using the old filter
+            previous, self.synced_at = self.synced_at, started
+        try:
+            jtis = list(
+                BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+                .values_list('token__jti', flat=True)
+            )
+        except Exception:
+            with self.lock:
+                self.synced_at = previous
+            raise
+
+        bloom = BloomFilter(
+            int(len(jtis) * 1.5) + 1000,
+            getattr(settings, 'TOKEN_BLACKLIST_ERROR_RATE', 0.01),
+        )
+        for jti in jtis:
+            bloom.add(jti)
+
+        with self.lock:
+            self.bloom = bloom
+            # Entries from before the query are in the filter now
+            self.recent = {jti: at for jti, at in self.recent.items() if at >= started}
+
+    def is_revoked(self, jti):
+        self.maybe_sync()
+        if jti in self.recent:
+            return True
+        if self.bloom is None or jti not in self.bloom:
+            return False
+
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+        if BlacklistedToken.objects.filter(token__jti=jti).exists():
+            self.remember(jti)
+            return True
+        return False
+
+    def remember(self, jti):
+        """Treat `jti` as revoked in this process without waiting for the next sync."""
+        with self.lock:
+            self.recent[jti] = time.monotonic()
+
+
+_blacklist = _Blacklist()
+
+
+def is_revoked(jti):
+    return _blacklist.is_revoked(jti)
+
+
+def sync_blacklist():
+    _blacklist.sync()
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """RefreshToken whose blacklist check goes through the in-process filter."""
+
+    def check_blacklist(self):
+        if is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError('Token is blacklisted')
+
+    def blacklist(self):
+        # Written to the database right away, so a restart or another worker cannot miss it
+        blacklisted = super().blacklist()
+        _blacklist.remember(self.payload[api_settings.JTI_CLAIM])
+        return blacklisted
+
+
+class CachedBlacklistTokenRefreshSerializer(TokenRefreshSerializer):
+    """TokenRefreshView serializer (SIMPLE_JWT['TOKEN_REFRESH_SERIALIZER'])."""
+    token_class = CachedBlacklistRefreshToken
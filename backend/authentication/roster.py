@@ -0,0 +1,74 @@
+"""
+Club Roster
+Filtered, searchable and keyset-paginated listing of one club's members.
+Name/email search uses icontains, which PostgreSQL serves from the trigram
+indexes on AdminUser (migration 0016).
+"""
+
+from django.db.models import Q
+
+from .pagination import keyset_paginate
+
+
+ROSTER_ORDERING = ['role', '-created_at', '-id']
+
+# Query parameters matched exactly; role and status accept comma-separated lists
+ROSTER_FILTERS = ['role', 'status', 'department', 'academic_year']
+MULTI_VALUE_FILTERS = {'role', 'status'}
+
+SEARCH_MIN_LENGTH = 2
+
+
+def roster_queryset(club_id, params):
+    """Members of a club narrowed by the roster filters and ?q= search."""
+    from .models import ClubMember
+
+    members = ClubMember.objects.filter(club_id=club_id).select_related('user')
+
+    for name in ROSTER_FILTERS:
+        value = (params.get(name) or '').strip()
+        if not value or value == 'all':
+            continue
+        if name in MULTI_VALUE_FILTERS:
+            members = members.filter(**{f'{name}__in': [v.strip() for v in value.split(',') if v.strip()]})
+        else:
+            members = members.filter(**{name: value})
+
+    search = (params.get('q') or '').strip()
+    if len(search) >= SEARCH_MIN_LENGTH:
+        condition = (
+            Q(user__first_name__icontains=search)
+            | Q(user__last_name__icontains=search)
+            | Q(user__username__icontains=search)
+            | Q(user__email__icontains=search)
+        )
+        # "First Last" searches match across both name columns
+        first, _, last = search.partition(' ')
+        if last.strip():
+            condition |= Q(user__first_name__icontains=first, user__last_name__icontains=last.strip())
+        members = members.filter(condition)
+
+    return members
+
+
+def roster_page(club_id, params, cursor=None, page_size=50):
+    return keyset_paginate(roster_queryset(club_id, params), ROSTER_ORDERING, cursor, page_size)
+
+
+def serialize_roster_member(member):
+    return {
+        'id': member.id,
+        'user_id': member.user_id,
+        'username': member.user.username,
+        'first_name': member.user.first_name,
+        'last_name': member.user.last_name,
+        'email': member.user.email,
+        'student_id': member.user.student_id,
+        'role': member.role,
+        'role_display': member.get_role_display(),
+        'status': member.status,
+        'department': member.department,
+        'academic_year': member.academic_year,
+        'created_at': member.created_at,
+        'approved_at': member.approved_at,
+    }
@@ -4,6 +4,7 @@ from .models import (
     AdminUser, UniversityProfile, ClubMember, RoleHistory, Club, 
     ApprovalRequest, ApprovalHistory, Event, EventCollaborator, EventLog, EventReport
 )
+from .activity import record_login
 
 
 class AdminUserSerializer(serializers.ModelSerializer):
@@ -14,9 +15,9 @@ class AdminUserSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'username', 'email', 'first_name', 'last_name', 
             'role', 'student_id', 'employee_id', 'department',
-            'is_active', 'two_factor_enabled', 'date_joined', 'last_login'
+            'is_active', 'two_factor_enabled', 'date_joined', 'last_login', 'last_seen'
         ]
-        read_only_fields = ['id', 'date_joined', 'last_login']
+        read_only_fields = ['id', 'date_joined', 'last_login', 'last_seen']
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -25,6 +26,9 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         data = super().validate(attrs)
         
+        # last_login is buffered instead of written here (UPDATE_LAST_LOGIN is off)
+        record_login(self.user.pk)
+        
         # Add custom user data to the response
         data['user'] = {
             'id': self.user.id,
@@ -196,6 +200,13 @@ class ApprovalRequestSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at', 'reviewed_at', 'approved_by', 'rejected_by']
 
 
+class ApprovalRequestListSerializer(ApprovalRequestSerializer):
+    """List representation of ApprovalRequest; history is served by the history endpoint."""
+
+    class Meta(ApprovalRequestSerializer.Meta):
+        fields = [f for f in ApprovalRequestSerializer.Meta.fields if f != 'history']
+
+
 class ApprovalRequestCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating approval requests."""
 
@@ -0,0 +1,121 @@
+"""
+Model signal handlers for derived data and cache invalidation.
+Connected in AuthenticationConfig.ready().
+"""
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from .caching import bump_generation
+from .club_directory import invalidate_club_directory
+from .models import AdminUser, Club, ClubMember, Event, EventExpense, UniversityProfile
+from .reports import BUDGET_REPORT_NAMESPACE
+from .reviewer_scope import invalidate_reviewer_scope
+from .stateless_auth import invalidate_cached_user
+from .university_profile import invalidate_university_profile
+
+
+# ==================== SPEND SNAPSHOTS ====================
+
+@receiver(post_init, sender=EventExpense)
+def remember_spend_bucket(sender, instance, **kwargs):
+    """Remember which daily bucket the expense was loaded in, so a move can update both."""
+    deferred = instance.get_deferred_fields()
+    if not instance.pk or deferred & {'event_id', 'payment_date', 'created_at'}:
+        # Avoid loading deferred fields (one query per row) for partial loads
+        instance._original_spend_bucket = None
+        return
+    instance._original_spend_bucket = (instance.event_id, instance.spend_date)
+
+
+@receiver(post_save, sender=EventExpense)
+def update_spend_snapshot_on_save(sender, instance, raw=False, **kwargs):
+    from .spend_snapshots import refresh_spend_bucket
+
+    if raw:
+        return
+    buckets = {(instance.event_id, instance.spend_date)}
+    if getattr(instance, '_original_spend_bucket', None):
+        buckets.add(instance._original_spend_bucket)
+    for event_id, day in buckets:
+        refresh_spend_bucket(event_id, day)
+    instance._original_spend_bucket = (instance.event_id, instance.spend_date)
+
+
+@receiver(post_delete, sender=EventExpense)
+def update_spend_snapshot_on_delete(sender, instance, **kwargs):
+    from .spend_snapshots import refresh_spend_bucket
+
+    refresh_spend_bucket(instance.event_id, instance.spend_date)
+
+
+# ==================== BUDGET REPORT CACHE ====================
+
+@receiver(post_save, sender=Club)
+@receiver(post_delete, sender=Club)
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=EventExpense)
+@receiver(post_delete, sender=EventExpense)
+def invalidate_budget_report(sender, **kwargs):
+    bump_generation(BUDGET_REPORT_NAMESPACE)
+
+
+# ==================== REVIEWER SCOPE CACHE ====================
+
+@receiver(post_save, sender=ClubMember)
+@receiver(post_delete, sender=ClubMember)
+def invalidate_member_reviewer_scope(sender, instance, **kwargs):
+    invalidate_reviewer_scope(instance.user_id)
+
+
+# ==================== CLUB DIRECTORY CACHE ====================
+
+@receiver(post_save, sender=Club)
+@receiver(post_delete, sender=Club)
+@receiver(post_save, sender=ClubMember)
+@receiver(post_delete, sender=ClubMember)
+def invalidate_club_directory_cache(sender, **kwargs):
+    invalidate_club_directory()
+
+
+# ==================== AUTHENTICATED USER CACHE ====================
+
+@receiver(post_save, sender=AdminUser)
+@receiver(post_delete, sender=AdminUser)
+def invalidate_auth_user_cache(sender, instance, **kwargs):
+    invalidate_cached_user(instance.pk)
+
+
+# ==================== UNIVERSITY PROFILE CACHE ====================
+
+@receiver(post_save, sender=UniversityProfile)
+@receiver(post_delete, sender=UniversityProfile)
+def invalidate_university_profile_cache(sender, **kwargs):
+    invalidate_university_profile()
+
+
+# ==================== IMAGE DERIVATIVES ====================
+
+@receiver(post_init, sender=Event)
+def remember_event_images(sender, instance, **kwargs):
+    from .image_derivatives import image_urls
+
+    if instance.get_deferred_fields() & {'poster_url', 'banner_url', 'gallery_urls'}:
+        instance._original_image_urls = None
+        return
+    instance._original_image_urls = image_urls(instance)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_save, sender=UniversityProfile)
+def queue_image_derivatives(sender, instance, raw=False, **kwargs):
+    from .image_derivatives import image_urls, request_derivatives
+
+    if raw:
+        return
+    urls = image_urls(instance)
+    # Events are saved often (status, counters); only look up images that changed
+    if urls != getattr(instance, '_original_image_urls', None):
+        request_derivatives(urls)
+    instance._original_image_urls = urls
@@ -0,0 +1,115 @@
+"""
+Event Spend Time-Series
+Keeps EventSpendSnapshot in sync with EventExpense. Single expense changes
+update one daily bucket (and shift the cumulative totals after it); a full
+rebuild is one INSERT ... SELECT with a window function.
+"""
+
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+
+def refresh_spend_bucket(event_id, day):
+    """Recompute the snapshot for one (event, day) bucket and propagate the cumulative delta."""
+    from .models import Event, EventExpense, EventSpendSnapshot
+
+    if event_id is None or day is None:
+        return
+
+    with transaction.atomic():
+        # Serialize snapshot maintenance per event
+        list(Event.objects.select_for_update().filter(pk=event_id).values_list('pk', flat=True))
+
+        totals = EventExpense.objects.filter(
+            event_id=event_id,
+            status__in=EventExpense.COUNTED_STATUSES,
+        ).annotate(
+            spend_day=Coalesce('payment_date', TruncDate('created_at'))
+        ).filter(spend_day=day).aggregate(
+            daily=Sum('total_amount'),
+            count=Count('id'),
+        )
+        daily = totals['daily'] or Decimal('0')
+        count = totals['count']
+
+        snapshot = EventSpendSnapshot.objects.filter(event_id=event_id, date=day).first()
+        old_daily = snapshot.daily_spend if snapshot else Decimal('0')
+        delta = daily - old_daily
+
+        if snapshot:
+            if count == 0:
+                snapshot.delete()
+            else:
+                snapshot.daily_spend = daily
+                snapshot.cumulative_spend = snapshot.cumulative_spend + delta
+                snapshot.expense_count = count
+                snapshot.save(update_fields=['daily_spend', 'cumulative_spend', 'expense_count', 'updated_at'])
+        elif count:
+            previous = EventSpendSnapshot.objects.filter(
+                event_id=event_id, date__lt=day
+            ).order_by('-date').values_list('cumulative_spend', flat=True).first()
+            EventSpendSnapshot.objects.create(
+                event_id=event_id,
+                date=day,
+                daily_spend=daily,
+                cumulative_spend=(previous or Decimal('0')) + daily,
+                expense_count=count,
+            )
+
+        if delta:
+            EventSpendSnapshot.objects.filter(event_id=event_id, date__gt=day).update(
+                cumulative_spend=F('cumulative_spend') + delta
+            )
+
+
+def rebuild_spend_snapshots(event_id=None):
+    """
+    Rebuild snapshots for one event (or all events) with a single windowed query.
+    Returns the number of snapshot rows written.
+    """
+    from .models import EventExpense, EventSpendSnapshot
+
+    snapshot_table = connection.ops.quote_name(EventSpendSnapshot._meta.db_table)
+    expense_table = connection.ops.quote_name(EventExpense._meta.db_table)
+    placeholders = ', '.join(['%s'] * len(EventExpense.COUNTED_STATUSES))
+
+    params = [timezone.now(), *EventExpense.COUNTED_STATUSES]
+    event_filter = ''
+    if event_id is not None:
+        event_filter = 'AND event_id = %s'
+        params.append(event_id)
+
+    sql = f"""
+        INSERT INTO {snapshot_table}
+            (event_id, date, daily_spend, cumulative_spend, expense_count, updated_at)
+        SELECT
+            event_id,
+            spend_day,
+            daily,
+            SUM(daily) OVER (PARTITION BY event_id ORDER BY spend_day),
+            expense_count,
+            %s
+        FROM (
+            SELECT
+                event_id,
+                COALESCE(payment_date, DATE(created_at)) AS spend_day,
+                SUM(total_amount) AS daily,
+                COUNT(*) AS expense_count
+            FROM {expense_table}
+            WHERE status IN ({placeholders}) {event_filter}
+            GROUP BY event_id, COALESCE(payment_date, DATE(created_at))
+        ) AS daily_totals
+    """
+
+    with transaction.atomic():
+        existing = EventSpendSnapshot.objects.all()
+        if event_id is not None:
+            existing = existing.filter(event_id=event_id)
+        existing.delete()
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
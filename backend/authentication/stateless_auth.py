@@ -0,0 +1,93 @@
+"""
+Stateless JWT Authentication
+Opt-in alternative to JWTAuthentication for hot read endpoints: request.user
+is built from the username/email/role claims that login_view and
+CustomTokenObtainPairSerializer put in every token, so authenticating costs
+no query. Role changes and deactivation take effect when the access token
+expires (JWT_ACCESS_TOKEN_LIFETIME); views that need the full AdminUser get
+it from a short-TTL cache through full_user().
+
+    @api_view(['GET'])
+    @authentication_classes([StatelessJWTAuthentication])
+    @permission_classes([IsAuthenticated])
+    def my_view(request): ...
+
+request.user is not a model instance here, so filter with user_id=request.user.id
+rather than user=request.user.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+
+# Claims that must be present for a token to be served without the database
+REQUIRED_CLAIMS = ('username', 'email', 'role')
+
+
+def _cache_key(user_id):
+    return f"auth_user:{user_id}"
+
+
+class ClaimsUser(TokenUser):
+    """AdminUser stand-in backed by the token claims."""
+
+    @cached_property
+    def email(self):
+        return self.token.get('email', '')
+
+    @cached_property
+    def role(self):
+        return self.token.get('role', '')
+
+
+def get_cached_user(user_id):
+    """The AdminUser for `user_id` from the cache, loading it on a miss. None if it does not exist."""
+    from .models import AdminUser
+
+    key = _cache_key(user_id)
+    user = cache.get(key)
+    if user is None:
+        user = AdminUser.objects.filter(pk=user_id).first()
+        if user is None:
+            return None
+        cache.set(key, user, getattr(settings, 'AUTH_USER_CACHE_TTL', 60))
+    return user
+
+
+def invalidate_cached_user(user_id):
+    cache.delete(_cache_key(user_id))
+
+
+def full_user(request):
+    """request.user as an AdminUser instance, whichever authentication class ran."""
+    user = request.user
+    if isinstance(user, ClaimsUser):
+        user = get_cached_user(user.id)
+        if user is None or not user.is_active:
+            raise AuthenticationFailed('User not found or inactive', code='user_not_found')
+    return user
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """JWT authentication that trusts the token's claims instead of loading the user."""
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken('Token contained no recognizable user identification')
+
+        if all(claim in validated_token for claim in REQUIRED_CLAIMS):
+            return ClaimsUser(validated_token)
+
+        # Tokens issued without the custom claims fall back to the cached model
+        user = get_cached_user(validated_token[api_settings.USER_ID_CLAIM])
+        if user is None:
+            raise AuthenticationFailed('User not found', code='user_not_found')
+        if not user.is_active:
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+        return user
@@ -0,0 +1,225 @@
+"""
+Object Storage
+Every read and write of stored files goes through a backend from
+get_storage(). Both backends offer the same interface:
+
+    save(key, content, content_type) -> URL of the stored object
+        content is bytes or a file-like object
+    read(key) -> bytes
+    key_for_url(url) -> key of a URL this backend produced, or None
+    public_url(key) -> URL the object is recorded by
+    signed_url(key, tier) -> URL a client can fetch it with
+    presign_upload(key, content_type, max_bytes, expires_in) -> {'url', 'fields'}
+        a POST form the client submits with the file as its last field
+    verify_upload(key) -> {'size', 'content_type'} or None
+        whether the object exists, checked before an upload is recorded
+
+S3Storage uses one boto3 client per process with a pooled HTTP connection
+pool (STORAGE_MAX_POOL_CONNECTIONS); building a client costs tens of
+milliseconds, so it is never done per request. LocalStorage keeps files under
+LOCAL_STORAGE_ROOT and accepts presigned forms at local_upload_view, with the
+policy signed by Django, so everything works without S3 in development and
+tests. It is only picked when asked for (STORAGE_BACKEND=local) or, with
+'auto', under DEBUG; a production server without S3 settings gets
+ImproperlyConfigured instead of quietly writing to its own disk.
+"""
+
+import mimetypes
+import os
+import threading
+from urllib.parse import unquote, urlparse
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+
+
+LOCAL_UPLOAD_SALT = 'authentication.storage.local_upload'
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def s3_configured():
+    return all([
+        settings.AWS_STORAGE_BUCKET_NAME,
+        settings.AWS_S3_REGION_NAME,
+        settings.AWS_ACCESS_KEY_ID,
+        settings.AWS_SECRET_ACCESS_KEY,
+    ])
+
+
+def get_s3_client():
+    """Process-wide S3 client (boto3 clients are thread-safe), or None if S3 is not configured."""
+    global _client
+    if _client is None and s3_configured():
+        with _client_lock:
+            if _client is None:
+                import boto3
+                from botocore.config import Config
+
+                _client = boto3.client(
+                    's3',
+                    region_name=settings.AWS_S3_REGION_NAME,
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    config=Config(
+                        max_pool_connections=getattr(settings, 'STORAGE_MAX_POOL_CONNECTIONS', 20),
+                        retries={'max_attempts': 3, 'mode': 'standard'},
+                    ),
+                )
+    return _client
+
+
+def object_url_prefix(bucket=None):
+    bucket = bucket or settings.AWS_STORAGE_BUCKET_NAME
+    return f"https://{bucket}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/"
+
+
+class S3Storage:
+    name = 's3'
+
+    def __init__(self, bucket=None):
+        self.bucket = bucket or settings.AWS_STORAGE_BUCKET_NAME
+
+    def save(self, key, content, content_type='application/octet-stream'):
+        client = get_s3_client()
+        if isinstance(content, bytes):
+            client.put_object(Bucket=self.bucket, Key=key, Body=content, ContentType=content_type)
+        else:
+            client.upload_fileobj(content, self.bucket, key, ExtraArgs={'ContentType': content_type})
+        return self.public_url(key)
+
+    def read(self, key):
+        return get_s3_client().get_object(Bucket=self.bucket, Key=key)['Body'].read()
+
+    def public_url(self, key):
+        return object_url_prefix(self.bucket) + key
+
+    def key_for_url(self, url):
+        prefix = object_url_prefix(self.bucket)
+        if url and url.startswith(prefix):
+            return url[len(prefix):]
+        return None
+
+    def signed_url(self, key, tier='day'):
+        from .presigned_urls import presigned_get_url
+
+        return presigned_get_url(key, tier, self.bucket)
+
+    def presign_upload(self, key, content_type, max_bytes, expires_in):
+        return get_s3_client().generate_presigned_post(
+            Bucket=self.bucket,
+            Key=key,
+            Fields={'Content-Type': content_type},
+            Conditions=[
+                {'Content-Type': content_type},
+                ['content-length-range', 1, max_bytes],
+            ],
+            ExpiresIn=expires_in,
+        )
+
+    def verify_upload(self, key):
+        from botocore.exceptions import ClientError
+
+        try:
+            head = get_s3_client().head_object(Bucket=self.bucket, Key=key)
+        except ClientError as exc:
+            if exc.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+        return {'size': head['ContentLength'], 'content_type': head.get('ContentType', '')}
+
+
+class LocalStorage:
+    name = 'local'
+
+    def __init__(self, root=None, base_url=None):
+        self.root = os.path.abspath(root or settings.LOCAL_STORAGE_ROOT)
+        self.base_url = base_url or settings.LOCAL_STORAGE_URL
+
+    def path(self, key):
+        """Filesystem path of `key`; refuses keys that would escape the root."""
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.root + os.sep):
+            raise ValueError(f'Invalid storage key: {key}')
+        return path
+
+    def save(self, key, content, content_type='application/octet-stream'):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as out:
+            if isinstance(content, bytes):
+                out.write(content)
+            elif hasattr(content, 'chunks'):
+                for chunk in content.chunks():
+                    out.write(chunk)
+            else:
+                for chunk in iter(lambda: content.read(64 * 1024), b''):
+                    out.write(chunk)
+        return self.public_url(key)
+
+    def read(self, key):
+        with open(self.path(key), 'rb') as f:
+            return f.read()
+
+    def public_url(self, key):
+        return self.base_url.rstrip('/') + '/' + key
+
+    def key_for_url(self, url):
+        # Recorded URLs may have been made absolute with the request host
+        path = urlparse(url or '').path
+        prefix = urlparse(self.base_url).path.rstrip('/') + '/'
+        if path.startswith(prefix) and len(path) > len(prefix):
+            return unquote(path[len(prefix):])
+        return None
+
+    def signed_url(self, key, tier='day'):
+        # Served as-is by the media route; nothing to sign
+        return self.public_url(key)
+
+    def presign_upload(self, key, content_type, max_bytes, expires_in):
+        policy = signing.dumps(
+            {'key': key, 'content_type': content_type, 'max_bytes': max_bytes, 'expires_in': expires_in},
+            salt=LOCAL_UPLOAD_SALT,
+        )
+        return {
+            'url': reverse('local_upload'),
+            'fields': {'key': key, 'Content-Type': content_type, 'policy': policy},
+        }
+
+    def load_policy(self, policy):
+        """Policy fields of a presigned local upload; raises signing.BadSignature if invalid or expired."""
+        data = signing.loads(policy, salt=LOCAL_UPLOAD_SALT)
+        # Re-check with the age limit the policy was issued for
+        return signing.loads(policy, salt=LOCAL_UPLOAD_SALT, max_age=data['expires_in'])
+
+    def verify_upload(self, key):
+        try:
+            size = os.path.getsize(self.path(key))
+        except (OSError, ValueError):
+            return None
+        return {'size': size, 'content_type': mimetypes.guess_type(key)[0] or 'application/octet-stream'}
+
+
+def local_storage_enabled():
+    """STORAGE_BACKEND is 'local', or 'auto' under DEBUG without S3 settings."""
+    backend = getattr(settings, 'STORAGE_BACKEND', 'auto')
+    return backend == 'local' or (backend == 'auto' and settings.DEBUG and not s3_configured())
+
+
+def get_storage():
+    """
+    Backend chosen by STORAGE_BACKEND: 's3', 'local', or 'auto' (S3 when
+    configured, local under DEBUG). Raises ImproperlyConfigured when S3 is
+    needed but its settings are missing.
+    """
+    if local_storage_enabled():
+        return LocalStorage()
+    if not s3_configured():
+        raise ImproperlyConfigured(
+            'AWS configuration missing: set AWS_STORAGE_BUCKET_NAME, AWS_S3_REGION_NAME, '
+            'AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY (or STORAGE_BACKEND=local)'
+        )
+    return S3Storage()
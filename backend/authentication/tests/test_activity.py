@@ -0,0 +1,81 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from authentication import activity
+from authentication.activity import flush_activity, record_login, record_seen
+from authentication.models import AdminUser
+
+
+@override_settings(ACTIVITY_FLUSH_INTERVAL=3600)
+class ActivityBufferTests(TestCase):
+    """Buffered last_login / last_seen writes (flushed by hand here, the timer is never started)."""
+
+    def setUp(self):
+        self.user = AdminUser.objects.create_user(username='student', email='student@uni.edu', password='x')
+        self.addCleanup(flush_activity)
+        timer = mock.patch('authentication.activity.threading.Timer')
+        timer.start()
+        self.addCleanup(timer.stop)
+        self.now = timezone.now()
+
+    def test_flush_writes_buffered_login_and_seen(self):
+        record_login(self.user.pk, self.now)
+        record_seen(self.user.pk, self.now + timedelta(minutes=5))
+
+        self.assertEqual(flush_activity(), 1)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.last_login, self.now)
+        self.assertEqual(self.user.last_seen, self.now + timedelta(minutes=5))
+        self.assertEqual(flush_activity(), 0)
+
+    def test_nothing_is_written_before_the_flush(self):
+        record_login(self.user.pk, self.now)
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.last_login)
+
+    def test_an_older_flush_never_overwrites_a_newer_value(self):
+        AdminUser.objects.filter(pk=self.user.pk).update(last_login=self.now, last_seen=self.now)
+
+        record_login(self.user.pk, self.now - timedelta(hours=1))
+        flush_activity()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.last_login, self.now)
+        self.assertEqual(self.user.last_seen, self.now)
+
+    def test_flush_leaves_updated_at_alone(self):
+        updated_at = self.now - timedelta(days=1)
+        AdminUser.objects.filter(pk=self.user.pk).update(updated_at=updated_at)
+
+        record_seen(self.user.pk, self.now)
+        flush_activity()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.last_seen, self.now)
+        self.assertEqual(self.user.updated_at, updated_at)
+
+    def test_failed_flush_keeps_the_batch(self):
+        record_seen(self.user.pk, self.now)
+        with mock.patch.object(AdminUser.objects, 'bulk_update', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                flush_activity()
+
+        self.assertEqual(flush_activity(), 1)
+
+
+@override_settings(ACTIVITY_FLUSH_INTERVAL=0)
+class SynchronousActivityTests(TestCase):
+    def test_zero_interval_writes_immediately_without_a_timer(self):
+        user = AdminUser.objects.create_user(username='student', email='student@uni.edu', password='x')
+        now = timezone.now()
+
+        with mock.patch('authentication.activity.threading.Timer') as timer:
+            record_login(user.pk, now)
+
+        timer.assert_not_called()
+        self.assertIsNone(activity._timer)
+        user.refresh_from_db()
+        self.assertEqual(user.last_login, now)
@@ -0,0 +1,40 @@
+from django.test import TestCase
+
+from authentication.image_derivatives import request_derivatives, source_hash
+from authentication.models import BackgroundJob, ImageDerivative
+
+
+class RequestDerivativesTests(TestCase):
+    """Only ready or pending derivatives count as known; the rest are tried again."""
+
+    URL = 'https://bucket.s3.ap-south-1.amazonaws.com/branding/logo.png'
+
+    def queued_hashes(self):
+        return [
+            job.payload['source_hash']
+            for job in BackgroundJob.objects.filter(job_type='image_derivatives').order_by('id')
+        ]
+
+    def test_new_url_is_queued_once(self):
+        self.assertEqual(request_derivatives([self.URL, self.URL]), 1)
+        self.assertEqual(request_derivatives([self.URL]), 0)
+        self.assertEqual(self.queued_hashes(), [source_hash(self.URL)])
+
+    def test_ready_and_pending_rows_are_not_requeued(self):
+        for status in ('ready', 'pending'):
+            ImageDerivative.objects.update_or_create(
+                source_hash=source_hash(self.URL), defaults={'source_url': self.URL, 'status': status}
+            )
+            self.assertEqual(request_derivatives([self.URL]), 0)
+        self.assertEqual(self.queued_hashes(), [])
+
+    def test_failed_and_skipped_rows_are_reset_and_requeued(self):
+        for status in ('failed', 'skipped'):
+            ImageDerivative.objects.update_or_create(
+                source_hash=source_hash(self.URL),
+                defaults={'source_url': self.URL, 'status': status, 'error': 'boom'},
+            )
+            self.assertEqual(request_derivatives([self.URL]), 1)
+            record = ImageDerivative.objects.get()
+            self.assertEqual((record.status, record.error), ('pending', ''))
+        self.assertEqual(self.queued_hashes(), [source_hash(self.URL)] * 2)
@@ -0,0 +1,33 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+
+S3_SETTINGS = {
+    'AWS_ACCESS_KEY_ID': 'key',
+    'AWS_SECRET_ACCESS_KEY': 'secret',
+    'AWS_STORAGE_BUCKET_NAME': 'bucket',
+    'AWS_S3_REGION_NAME': 'ap-south-1',
+}
+
+
+@override_settings(DEBUG=False)
+class JobWorkerStartupTests(TestCase):
+    """process_jobs refuses to start where it would log passwords or lose files."""
+
+    @override_settings(EMAIL_BACKEND='django.core.mail.backends.console.EmailBackend', **S3_SETTINGS)
+    def test_refuses_a_mail_backend_that_does_not_send(self):
+        with self.assertRaisesMessage(CommandError, 'does not send mail'):
+            call_command('process_jobs', stdout=StringIO())
+
+    @override_settings(EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend', AWS_ACCESS_KEY_ID='')
+    def test_refuses_to_run_without_object_storage(self):
+        with self.assertRaisesMessage(CommandError, 'S3 is not configured'):
+            call_command('process_jobs', stdout=StringIO())
+
+    @override_settings(EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend', **S3_SETTINGS)
+    def test_runs_when_mail_and_storage_are_configured(self):
+        out = StringIO()
+        call_command('process_jobs', stdout=out)
+        self.assertIn('Jobs complete', out.getvalue())
@@ -0,0 +1,85 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from authentication.models import Club, Event, EventExpense
+from authentication.ocr import OCREngine, process_pending_expenses
+
+
+STUB = 'authentication.ocr.StubOCREngine'
+
+
+class RecordingEngine(OCREngine):
+    """Records how many atomic blocks are open while the engine runs."""
+    depths = []
+
+    def extract(self, bill_url):
+        self.depths.append(len(connection.atomic_blocks))
+        return {'data': {'engine': 'recording'}, 'confidence': Decimal('90')}
+
+
+class ReclaimingEngine(OCREngine):
+    """Simulates another worker taking over the lease while this one runs."""
+
+    def extract(self, bill_url):
+        EventExpense.objects.update(ocr_claimed_at=timezone.now() + timedelta(seconds=1))
+        return {'data': {'engine': 'late'}, 'confidence': Decimal('10')}
+
+
+class ExpenseOCRTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        club = Club.objects.create(club_number='CLB001', name='Robotics')
+        now = timezone.now()
+        cls.event = Event.objects.create(
+            event_id='EVT001', title='Expo', description='', event_type='workshop', primary_club=club,
+            start_date=now, end_date=now, venue='Hall', estimated_budget=Decimal('1000'),
+        )
+        cls.expenses = [
+            EventExpense.objects.create(
+                event=cls.event, expense_id=f'EXP{i}', category='food', title='Lunch', description='',
+                amount=Decimal('10'), total_amount=Decimal('10'), paid_to='Cafe',
+                bill_image_url=f'https://bills.example/{i}.png',
+            )
+            for i in range(3)
+        ]
+
+    def test_command_does_nothing_without_an_engine(self):
+        out = StringIO()
+        with override_settings(OCR_ENGINE=''):
+            call_command('process_expense_ocr', stdout=out)
+        self.assertIn('OCR_ENGINE is not set', out.getvalue())
+        self.assertFalse(EventExpense.objects.filter(ocr_processed=True).exists())
+
+    @override_settings(OCR_ENGINE=STUB)
+    def test_processes_and_releases_every_bill(self):
+        self.assertEqual(process_pending_expenses(workers=1), 3)
+        self.assertEqual(EventExpense.objects.filter(ocr_processed=True, ocr_claimed_at=None).count(), 3)
+        self.assertEqual(process_pending_expenses(workers=1), 0)
+
+    def test_engine_runs_outside_any_transaction(self):
+        RecordingEngine.depths = []
+        base = len(connection.atomic_blocks)
+        process_pending_expenses(workers=1, engine_path='authentication.tests.test_ocr.RecordingEngine')
+        self.assertEqual(RecordingEngine.depths, [base] * 3)
+
+    @override_settings(OCR_ENGINE=STUB, OCR_CLAIM_TIMEOUT=600)
+    def test_live_leases_are_skipped_and_expired_ones_reclaimed(self):
+        live, expired, _ = self.expenses
+        EventExpense.objects.filter(pk=live.pk).update(ocr_claimed_at=timezone.now())
+        EventExpense.objects.filter(pk=expired.pk).update(ocr_claimed_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(process_pending_expenses(workers=1), 2)
+        live.refresh_from_db()
+        self.assertFalse(live.ocr_processed)
+
+    def test_results_are_dropped_when_the_lease_was_lost(self):
+        processed = process_pending_expenses(workers=1, engine_path='authentication.tests.test_ocr.ReclaimingEngine')
+        self.assertEqual(processed, 0)
+        self.assertFalse(EventExpense.objects.filter(ocr_processed=True).exists())
@@ -0,0 +1,65 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from authentication import revocation
+from authentication.models import AdminUser
+from authentication.revocation import CachedBlacklistRefreshToken, _Blacklist
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class RefreshTokenRevocationTests(TestCase):
+    """Revocations are stored at once and seen by processes that never made them."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = AdminUser.objects.create_user(username='student', email='student@uni.edu', password='x')
+
+    def setUp(self):
+        # Each test starts as a freshly started worker
+        patcher = mock.patch.object(revocation, '_blacklist', _Blacklist())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_blacklist_writes_the_row_immediately(self):
+        token = CachedBlacklistRefreshToken.for_user(self.user)
+        token.blacklist()
+        self.assertTrue(BlacklistedToken.objects.filter(token__jti=token['jti']).exists())
+
+    def test_revoked_token_is_rejected_by_a_new_blacklist(self):
+        token = CachedBlacklistRefreshToken.for_user(self.user)
+        token.blacklist()
+
+        other_worker = _Blacklist()
+        self.assertTrue(other_worker.is_revoked(token['jti']))
+        self.assertFalse(other_worker.is_revoked(CachedBlacklistRefreshToken.for_user(self.user)['jti']))
+
+    def test_unrevoked_token_check_costs_no_query_after_sync(self):
+        token = CachedBlacklistRefreshToken.for_user(self.user)
+        revocation.sync_blacklist()
+        with self.assertNumQueries(0):
+            token.check_blacklist()
+
+    def test_logged_out_token_cannot_refresh_on_another_worker(self):
+        client = APIClient()
+        refresh = str(CachedBlacklistRefreshToken.for_user(self.user))
+        client.force_authenticate(self.user)
+        self.assertEqual(client.post(reverse('logout'), {'refresh': refresh}, format='json').status_code, 200)
+
+        with mock.patch.object(revocation, '_blacklist', _Blacklist()):
+            response = APIClient().post(reverse('token_refresh'), {'refresh': refresh}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_rotated_token_cannot_be_reused(self):
+        client = APIClient()
+        refresh = str(CachedBlacklistRefreshToken.for_user(self.user))
+        response = client.post(reverse('token_refresh'), {'refresh': refresh}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.json()['refresh'], refresh)
+
+        with mock.patch.object(revocation, '_blacklist', _Blacklist()):
+            response = client.post(reverse('token_refresh'), {'refresh': refresh}, format='json')
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,127 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authentication.models import AdminUser, Club, ClubMember
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class ClubRosterTests(TestCase):
+    """club_roster_view: stable query count per page, filters, search and access."""
+
+    MEMBER_COUNT = 120
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.create(club_number='CLB001', name='Robotics')
+        cls.viewer = AdminUser.objects.create_user(
+            username='viewer', email='viewer@uni.edu', password='x', first_name='Vera', last_name='Viewer'
+        )
+        ClubMember.objects.create(club=cls.club, user=cls.viewer, role='president', status='active')
+
+        users = AdminUser.objects.bulk_create([
+            AdminUser(
+                username=f'student{i}',
+                email=f'student{i}@uni.edu',
+                first_name='Asha' if i % 10 == 0 else f'First{i}',
+                last_name='Rao' if i % 20 == 0 else f'Last{i}',
+                student_id=f'S{i:04d}',
+            )
+            for i in range(cls.MEMBER_COUNT)
+        ])
+        ClubMember.objects.bulk_create([
+            ClubMember(
+                club=cls.club,
+                user=user,
+                role='treasurer' if i % 30 == 0 else 'member',
+                status='pending' if i % 4 == 0 else 'active',
+                department='CSE' if i % 2 == 0 else 'ECE',
+                academic_year='2025' if i % 3 == 0 else '2024',
+            )
+            for i, user in enumerate(users)
+        ])
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.viewer)
+        self.url = reverse('club_roster', args=[self.club.id])
+
+    def fetch(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def fetch_all(self, **params):
+        """Every member across all pages, following next_cursor."""
+        members, cursor = [], None
+        while True:
+            page = self.fetch(**params, **({'cursor': cursor} if cursor else {}))
+            members.extend(page['results'])
+            cursor = page['next_cursor']
+            if not cursor:
+                return members
+
+    # The synchronous last_seen write (ACTIVITY_FLUSH_INTERVAL=0 under tests) is not the view's
+    @mock.patch('authentication.activity.record_seen')
+    def test_query_count_is_the_same_on_first_and_deep_pages(self, record_seen):
+        # reviewer scope, membership check, one page query
+        with self.assertNumQueries(3):
+            page = self.fetch(page_size=10)
+        for _ in range(8):
+            cache.clear()
+            with self.assertNumQueries(3):
+                page = self.fetch(page_size=10, cursor=page['next_cursor'])
+        self.assertEqual(len(page['results']), 10)
+
+    def test_pages_cover_every_member_once(self):
+        members = self.fetch_all(page_size=25)
+        ids = [m['id'] for m in members]
+        self.assertEqual(len(ids), self.MEMBER_COUNT + 1)
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_role_and_status_filters(self):
+        self.assertEqual(len(self.fetch_all(role='treasurer')), 4)
+        self.assertEqual(len(self.fetch_all(role='treasurer,president')), 5)
+        self.assertEqual(len(self.fetch_all(status='pending')), 30)
+        self.assertEqual(len(self.fetch_all(status='pending,active')), self.MEMBER_COUNT + 1)
+        self.assertEqual(len(self.fetch_all(role='all', status='all')), self.MEMBER_COUNT + 1)
+
+    def test_department_and_academic_year_filters_combine(self):
+        members = self.fetch_all(department='CSE', academic_year='2025')
+        # i divisible by 2 and by 3
+        self.assertEqual(len(members), 20)
+        self.assertTrue(all(m['department'] == 'CSE' and m['academic_year'] == '2025' for m in members))
+
+    def test_search_matches_name_email_and_full_name(self):
+        self.assertEqual(len(self.fetch_all(q='asha')), 12)
+        self.assertEqual(len(self.fetch_all(q='Asha Rao')), 6)
+        self.assertEqual([m['username'] for m in self.fetch_all(q='student7@')], ['student7'])
+        # Too short to search: everything comes back
+        self.assertEqual(len(self.fetch_all(q='a')), self.MEMBER_COUNT + 1)
+
+    def test_search_combines_with_filters(self):
+        members = self.fetch_all(q='asha', status='active', role='member')
+        # Asha is every 10th student; every 4th is pending and every 30th a treasurer
+        self.assertEqual(len(members), 4)
+        self.assertTrue(all(m['first_name'] == 'Asha' and m['status'] == 'active' for m in members))
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_inactive_members_cannot_read_or_export_the_roster(self):
+        export_url = reverse('club_roster_export', args=[self.club.id])
+        for membership_status in ('pending', 'revoked'):
+            ClubMember.objects.filter(club=self.club, user=self.viewer).update(status=membership_status)
+            cache.clear()
+            self.assertEqual(self.client.get(self.url).status_code, 403)
+            self.assertEqual(self.client.get(export_url).status_code, 403)
+
+    def test_non_members_cannot_read_the_roster(self):
+        outsider = AdminUser.objects.create_user(username='outsider', email='outsider@uni.edu', password='x')
+        self.client.force_authenticate(outsider)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIClient
+
+from authentication.throttling import AttemptWindow, client_ident
+
+
+PROXY_SETTINGS = {
+    'DEFAULT_AUTHENTICATION_CLASSES': ('rest_framework_simplejwt.authentication.JWTAuthentication',),
+    'DEFAULT_PERMISSION_CLASSES': ('rest_framework.permissions.IsAuthenticated',),
+    'NUM_PROXIES': 1,
+}
+
+
+@override_settings(REST_FRAMEWORK=PROXY_SETTINGS, SECURE_SSL_REDIRECT=False)
+class LoginThrottleIdentTests(TestCase):
+    """Spoofed X-Forwarded-For values must not give a client fresh IP buckets."""
+
+    PROXY_HOP = '203.0.113.7'
+
+    def setUp(self):
+        cache.clear()
+
+    def test_client_ident_uses_the_hop_added_by_our_proxy(self):
+        factory = RequestFactory()
+        idents = {
+            client_ident(Request(factory.post(
+                '/', HTTP_X_FORWARDED_FOR=f'10.0.{i}.1, {self.PROXY_HOP}', REMOTE_ADDR='10.1.1.1'
+            )))
+            for i in range(5)
+        }
+        self.assertEqual(idents, {self.PROXY_HOP})
+
+    @override_settings(
+        LOGIN_THROTTLE_ENABLED=True,
+        LOGIN_THROTTLE_IP_BURST=3,
+        LOGIN_THROTTLE_IP_PER_MINUTE=1,
+        LOGIN_THROTTLE_ACCOUNT_BURST=100,
+    )
+    def test_rotating_forwarded_for_shares_one_ip_bucket(self):
+        client = APIClient()
+        statuses = []
+        for i in range(5):
+            response = client.post(
+                reverse('login'),
+                {'username': f'victim{i}@uni.edu', 'password': 'guess'},
+                format='json',
+                HTTP_X_FORWARDED_FOR=f'198.51.100.{i}, {self.PROXY_HOP}',
+            )
+            statuses.append(response.status_code)
+        self.assertEqual(statuses[:3], [401, 401, 401])
+        self.assertEqual(statuses[3:], [429, 429])
+        self.assertIn('Retry-After', response)
+
+
+class AttemptWindowTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_rejects_after_capacity_until_the_window_ends(self):
+        window = AttemptWindow('test', capacity=3, per_minute=1)
+        with mock.patch('authentication.throttling.time.time', return_value=1800.0):
+            self.assertEqual([window.take('a') for _ in range(3)], [0, 0, 0])
+            self.assertEqual(window.take('a'), 180)
+            self.assertEqual(window.take('b'), 0)
+        with mock.patch('authentication.throttling.time.time', return_value=1980.0):
+            self.assertEqual(window.take('a'), 0)
+
+    def test_reset_clears_the_current_window(self):
+        window = AttemptWindow('test', capacity=1, per_minute=1)
+        window.take('a')
+        self.assertTrue(window.take('a'))
+        window.reset('a')
+        self.assertEqual(window.take('a'), 0)
+
+    def test_concurrent_attempts_never_exceed_capacity(self):
+        window = AttemptWindow('test', capacity=10, per_minute=10)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            waits = list(pool.map(lambda _: window.take('a'), range(50)))
+        self.assertEqual(waits.count(0), 10)
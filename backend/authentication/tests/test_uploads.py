@@ -0,0 +1,122 @@
+import os
+import tempfile
+import time
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authentication.models import AdminUser, UniversityProfile
+from campusphere.urls import serve_local_media
+
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'0' * 32
+
+
+@override_settings(SECURE_SSL_REDIRECT=False, DEBUG=False, STORAGE_BACKEND='auto', AWS_ACCESS_KEY_ID='')
+class MissingStorageTests(TestCase):
+    """Without S3 settings outside DEBUG, uploads fail loudly instead of landing on the server's disk."""
+
+    def setUp(self):
+        admin = AdminUser.objects.create_user(username='admin1', email='admin@uni.edu', password='x', role='admin')
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+    def test_presign_reports_the_missing_configuration(self):
+        response = self.client.post(
+            reverse('university_upload_presign'),
+            {'filename': 'logo.png', 'content_type': 'image/png'},
+            format='json',
+        )
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json()['error'], 'AWS configuration missing')
+
+
+@override_settings(SECURE_SSL_REDIRECT=False, STORAGE_BACKEND='local', UPLOAD_MAX_BYTES=1024, UPLOAD_URL_EXPIRY=900)
+class LocalDirectUploadTests(TestCase):
+    """presign -> POST to local_upload_view -> complete, with the local backend."""
+
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        settings_override = override_settings(LOCAL_STORAGE_ROOT=root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.root = root.name
+
+        admin = AdminUser.objects.create_user(username='admin1', email='admin@uni.edu', password='x', role='admin')
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+    def presign(self, filename='logo.png', content_type='image/png', field='logo_url'):
+        response = self.client.post(
+            reverse('university_upload_presign'),
+            {'filename': filename, 'content_type': content_type, 'field': field},
+            format='json',
+        )
+        return response
+
+    def upload(self, payload, content=PNG, **overrides):
+        fields = {**payload['upload']['fields'], **overrides}
+        fields['file'] = SimpleUploadedFile('upload', content, content_type=fields['Content-Type'])
+        return APIClient().post(payload['upload']['url'], fields, format='multipart')
+
+    def complete(self, payload):
+        return self.client.post(
+            reverse('university_upload_complete'), {'upload_token': payload['upload_token']}, format='json'
+        )
+
+    def test_upload_round_trip_sets_the_profile_field(self):
+        payload = self.presign().json()
+        self.assertEqual(self.upload(payload).status_code, 204)
+
+        response = self.complete(payload)
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertTrue(response.json()['url'].endswith(payload['key']))
+        with open(os.path.join(self.root, payload['key']), 'rb') as stored:
+            self.assertEqual(stored.read(), PNG)
+        self.assertEqual(UniversityProfile.objects.get().logo_url, response.json()['url'])
+
+    def test_extension_follows_the_validated_content_type(self):
+        payload = self.presign(filename='logo.html').json()
+        self.assertTrue(payload['key'].endswith('_logo.png'), payload['key'])
+
+    def test_svg_is_not_accepted(self):
+        response = self.presign(filename='logo.svg', content_type='image/svg+xml')
+        self.assertEqual(response.status_code, 400)
+
+    def test_tampered_form_is_refused(self):
+        payload = self.presign().json()
+        self.assertEqual(self.upload(payload, key='branding/page.html').status_code, 403)
+        self.assertEqual(self.upload(payload, **{'Content-Type': 'text/html'}).status_code, 403)
+        self.assertEqual(self.upload(payload, policy=payload['upload']['fields']['policy'] + 'x').status_code, 403)
+        self.assertEqual(self.complete(payload).status_code, 400)
+
+    def test_oversized_file_is_refused(self):
+        payload = self.presign().json()
+        self.assertEqual(self.upload(payload, content=b'0' * 1025).status_code, 400)
+        self.assertEqual(self.complete(payload).status_code, 400)
+
+    def test_expired_policy_and_token_are_refused(self):
+        payload = self.presign().json()
+        later = time.time() + 2 * 900 + 1
+        with mock.patch('django.core.signing.time.time', return_value=later):
+            self.assertEqual(self.upload(payload).status_code, 403)
+            response = self.complete(payload)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Invalid or expired upload token')
+
+
+class LocalMediaTests(TestCase):
+    def test_media_is_served_as_a_nosniff_download(self):
+        with tempfile.TemporaryDirectory() as root:
+            with open(os.path.join(root, 'logo.png'), 'wb') as f:
+                f.write(PNG)
+            with override_settings(LOCAL_STORAGE_ROOT=root):
+                response = serve_local_media(RequestFactory().get('/media/logo.png'), 'logo.png')
+                response.close()
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertEqual(response['X-Content-Type-Options'], 'nosniff')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="logo.png"')
@@ -0,0 +1,98 @@
+"""
+Login Throttling
+Fixed-window attempt counters per client IP and per account, kept in the
+Django cache (the shared cache in deployments, so every worker counts against
+the same windows). Counters are bumped with cache.add + cache.incr, which are
+atomic on Redis, so concurrent workers cannot both spend the last attempt.
+Attempts are charged before any password hashing, so a burst of guesses is
+turned away cheaply instead of tying up worker CPU.
+"""
+
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+
+class AttemptWindow:
+    """
+    At most `capacity` attempts per window, the window being as long as it
+    takes to earn `capacity` attempts at `per_minute` (so the average rate
+    matches per_minute and up to `capacity` may come in a burst).
+    """
+
+    def __init__(self, name, capacity, per_minute):
+        self.name = name
+        self.capacity = capacity
+        self.window = math.ceil(capacity * 60 / per_minute) if per_minute else 3600
+
+    def _key(self, ident, now):
+        return f"throttle:{self.name}:{ident}:{int(now // self.window)}"
+
+    def take(self, ident):
+        """Count an attempt. Returns 0 if allowed, otherwise seconds until the window ends."""
+        now = time.time()
+        key = self._key(ident, now)
+        # The key expires with its window; add() is a no-op when it already exists
+        cache.add(key, 0, self.window + 1)
+        try:
+            attempts = cache.incr(key)
+        except ValueError:
+            # Evicted between add() and incr()
+            cache.add(key, 1, self.window + 1)
+            attempts = 1
+        if attempts > self.capacity:
+            return max(1, math.ceil(self.window - now % self.window))
+        return 0
+
+    def reset(self, ident):
+        cache.delete(self._key(ident, time.time()))
+
+
+def login_windows():
+    return (
+        AttemptWindow(
+            'login_ip',
+            getattr(settings, 'LOGIN_THROTTLE_IP_BURST', 20),
+            getattr(settings, 'LOGIN_THROTTLE_IP_PER_MINUTE', 10),
+        ),
+        AttemptWindow(
+            'login_account',
+            getattr(settings, 'LOGIN_THROTTLE_ACCOUNT_BURST', 5),
+            getattr(settings, 'LOGIN_THROTTLE_ACCOUNT_PER_MINUTE', 2),
+        ),
+    )
+
+
+def client_ident(request):
+    """
+    Client IP. With REST_FRAMEWORK['NUM_PROXIES'] set, only the hop added by
+    our own proxy is read from X-Forwarded-For, so a client cannot pick a new
+    window by sending its own header.
+    """
+    return BaseThrottle().get_ident(request)
+
+
+def account_ident(username_or_email):
+    return username_or_email.strip().lower()
+
+
+def check_login_throttle(request, username_or_email):
+    """
+    Charge one login attempt to the client IP and the account.
+    Returns 0 if the attempt may proceed, otherwise seconds to wait.
+    """
+    if not getattr(settings, 'LOGIN_THROTTLE_ENABLED', True):
+        return 0
+    ip_window, account_window = login_windows()
+    wait = ip_window.take(client_ident(request))
+    if wait:
+        return wait
+    return account_window.take(account_ident(username_or_email))
+
+
+def clear_account_throttle(username_or_email):
+    """Forget failed attempts against an account after a successful login."""
+    login_windows()[1].reset(account_ident(username_or_email))
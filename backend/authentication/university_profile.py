@@ -0,0 +1,78 @@
+"""
+University Profile
+The institution-wide branding record, read on every dashboard page. Reads are
+served as a ready-to-send JSON body with its ETag, kept in process memory and
+in the shared cache under a version stamp (a cache generation). Saving the
+profile bumps the version, so every worker rebuilds on its next read. Reads
+never insert: until an admin saves the profile, the defaults are served.
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.utils.encoders import JSONEncoder
+
+from .caching import bump_generation, generational_key, get_generation
+from .image_derivatives import image_urls, variant_maps
+
+
+UNIVERSITY_PROFILE_NAMESPACE = 'university_profile'
+UNIVERSITY_PROFILE_PK = 1
+UNIVERSITY_PROFILE_DEFAULTS = {
+    'name': 'Your University',
+    'tagline': 'Excellence in Education',
+}
+
+# (generation, body, etag) of the last blob this process served
+_local_blob = None
+
+
+def get_university_profile():
+    """The saved profile, or an unsaved instance holding the defaults."""
+    from .models import UniversityProfile
+
+    profile = UniversityProfile.objects.filter(pk=UNIVERSITY_PROFILE_PK).first()
+    if profile is None:
+        profile = UniversityProfile(pk=UNIVERSITY_PROFILE_PK, **UNIVERSITY_PROFILE_DEFAULTS)
+    return profile
+
+
+def get_or_create_university_profile():
+    """For the update path only: the profile row, created with the defaults if missing."""
+    from .models import UniversityProfile
+
+    profile, _ = UniversityProfile.objects.get_or_create(
+        pk=UNIVERSITY_PROFILE_PK,
+        defaults=UNIVERSITY_PROFILE_DEFAULTS,
+    )
+    return profile
+
+
+def university_profile_blob():
+    """(json_bytes, etag) of the serialized profile at the current version."""
+    from .serializers import UniversityProfileSerializer
+
+    global _local_blob
+    generation = get_generation(UNIVERSITY_PROFILE_NAMESPACE)
+    local = _local_blob
+    if local is not None and local[0] == generation:
+        return local[1], local[2]
+
+    key = generational_key(UNIVERSITY_PROFILE_NAMESPACE, 'blob')
+    blob = cache.get(key)
+    if blob is None:
+        profile = get_university_profile()
+        data = UniversityProfileSerializer(profile).data
+        data['image_variants'] = variant_maps(image_urls(profile))
+        body = json.dumps(data, cls=JSONEncoder).encode('utf-8')
+        blob = (body, f'"{hashlib.md5(body).hexdigest()}"')
+        cache.set(key, blob, getattr(settings, 'UNIVERSITY_PROFILE_CACHE_TTL', 86400))
+
+    _local_blob = (generation, blob[0], blob[1])
+    return blob
+
+
+def invalidate_university_profile():
+    bump_generation(UNIVERSITY_PROFILE_NAMESPACE)
@@ -0,0 +1,111 @@
+"""
+Direct Uploads
+Two-step upload flow that keeps file bytes out of Django workers:
+
+1. issue_upload() picks a key and returns a presigned POST form plus a signed
+   upload token naming that key.
+2. The client posts the file straight to storage, then calls back with the
+   token; complete_upload() checks the object really exists and returns its
+   key and URL so the caller can record it.
+"""
+
+import mimetypes
+import re
+import uuid
+
+from django.conf import settings
+from django.core import signing
+
+from .storage import get_storage
+
+
+UPLOAD_TOKEN_SALT = 'authentication.uploads.token'
+
+# Branding assets accepted by the university upload flow. Raster only: an SVG
+# can carry script, which runs when the file is opened from our own origin
+BRANDING_CONTENT_TYPES = {
+    'image/png', 'image/jpeg', 'image/gif', 'image/webp',
+    'image/x-icon', 'image/vnd.microsoft.icon',
+}
+# Extensions stored objects get, so the served type follows the validated one
+# rather than whatever the client named the file
+CONTENT_TYPE_EXTENSIONS = {
+    'image/png': '.png',
+    'image/jpeg': '.jpg',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'image/x-icon': '.ico',
+    'image/vnd.microsoft.icon': '.ico',
+    'application/pdf': '.pdf',
+}
+BRANDING_FIELDS = ['logo_url', 'favicon_url', 'hero_image_url']
+
+
+class UploadError(Exception):
+    """An upload could not be issued or completed; the message is safe to show."""
+
+
+def upload_key(folder, filename, content_type):
+    """
+    Unique key under `folder`. The client's filename only contributes its
+    stem; the extension comes from `content_type` ('.bin' if unknown).
+    """
+    safe_folder = '/'.join(re.sub(r'[^A-Za-z0-9_-]', '-', part) for part in folder.strip('/').split('/') if part)
+    stem = filename.rsplit('/', 1)[-1].rsplit('.', 1)[0]
+    safe_stem = re.sub(r'[^A-Za-z0-9_-]', '-', stem)[-100:] or 'file'
+    extension = (
+        CONTENT_TYPE_EXTENSIONS.get(content_type)
+        or mimetypes.guess_extension(content_type or '')
+        or '.bin'
+    )
+    return f"{safe_folder or 'uploads'}/{uuid.uuid4()}_{safe_stem}{extension}"
+
+
+def issue_upload(folder, filename, content_type, allowed_types=None, max_bytes=None, target=None):
+    """
+    Presigned upload for one file. `target` is echoed back on completion (for
+    example the profile field the URL goes into). Returns the response payload.
+    """
+    if not filename:
+        raise UploadError('filename is required')
+    if allowed_types is not None and content_type not in allowed_types:
+        raise UploadError(f'Unsupported content type: {content_type or "none"}')
+
+    storage = get_storage()
+    max_bytes = max_bytes or getattr(settings, 'UPLOAD_MAX_BYTES', 10 * 1024 * 1024)
+    expires_in = getattr(settings, 'UPLOAD_URL_EXPIRY', 900)
+    key = upload_key(folder, filename, content_type)
+
+    form = storage.presign_upload(key, content_type, max_bytes, expires_in)
+    token = signing.dumps(
+        {'key': key, 'backend': storage.name, 'max_bytes': max_bytes, 'target': target},
+        salt=UPLOAD_TOKEN_SALT,
+    )
+    return {
+        'key': key,
+        'upload': form,
+        'upload_token': token,
+        'expires_in': expires_in,
+        'max_bytes': max_bytes,
+    }
+
+
+def complete_upload(token):
+    """(key, url, target) for a finished upload; raises UploadError if the token or object is bad."""
+    # Completion may follow a slow upload, so allow twice the form's lifetime
+    max_age = getattr(settings, 'UPLOAD_URL_EXPIRY', 900) * 2
+    try:
+        ticket = signing.loads(token or '', salt=UPLOAD_TOKEN_SALT, max_age=max_age)
+    except signing.BadSignature:
+        raise UploadError('Invalid or expired upload token')
+
+    storage = get_storage()
+    if storage.name != ticket['backend']:
+        raise UploadError('Storage backend changed since the upload was issued')
+
+    info = storage.verify_upload(ticket['key'])
+    if info is None:
+        raise UploadError('Uploaded object not found')
+    if info['size'] > ticket['max_bytes']:
+        raise UploadError('Uploaded object is larger than allowed')
+    return ticket['key'], storage.public_url(ticket['key']), ticket['target']
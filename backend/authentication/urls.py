@@ -22,10 +22,16 @@ urlpatterns = [
     # University profile
     path('university/', views.university_profile_view, name='university_profile'),
     path('university/upload/', views.university_upload_view, name='university_upload'),
+    path('university/upload/presign/', views.university_upload_presign_view, name='university_upload_presign'),
+    path('university/upload/complete/', views.university_upload_complete_view, name='university_upload_complete'),
+    path('uploads/local/', views.local_upload_view, name='local_upload'),
     path('clubs/', views.clubs_view, name='clubs'),
+    path('jobs/<uuid:handle>/', views.job_status_view, name='job_status'),
     path('clubs/all/', views.all_clubs_view, name='all_clubs'),
     path('clubs/<int:club_id>/', views.club_detail_view, name='club_detail'),
     path('clubs/<int:club_id>/members/', views.club_members_view, name='club_members'),
+    path('clubs/<int:club_id>/roster/', views.club_roster_view, name='club_roster'),
+    path('clubs/<int:club_id>/roster/export/', views.club_roster_export_view, name='club_roster_export'),
     
     # Club Applications
     path('club-applications/', views.club_applications_view, name='club_applications'),
@@ -39,12 +45,17 @@ urlpatterns = [
     
     # Approval Management endpoints
     path('approvals/', views.approvals_view, name='approvals'),
+    path('approvals/bulk-approve/', views.bulk_approve_requests_view, name='bulk_approve_requests'),
+    path('approvals/bulk-reject/', views.bulk_reject_requests_view, name='bulk_reject_requests'),
     path('approvals/<int:approval_id>/', views.approval_detail_view, name='approval_detail'),
     path('approvals/<int:approval_id>/approve/', views.approve_request_view, name='approve_request'),
     path('approvals/<int:approval_id>/reject/', views.reject_request_view, name='reject_request'),
     path('approvals/<int:approval_id>/review/', views.mark_under_review_view, name='mark_under_review'),
     path('approvals/<int:approval_id>/history/', views.approval_history_view, name='approval_history'),
     
+    # Reviewer inbox (approvals, event applications and club applications together)
+    path('inbox/', views.reviewer_inbox_view, name='reviewer_inbox'),
+    
     # Event Management endpoints
     path('events/', event_views.events_list_view, name='events_list'),
     path('events/<int:event_id>/', event_views.event_detail_view, name='event_detail'),
@@ -58,6 +69,8 @@ urlpatterns = [
     path('my-event-applications/', event_views.my_event_applications_view, name='my_event_applications'),
     path('event-applications/pending-faculty/', event_views.pending_faculty_approvals_view, name='pending_faculty_approvals'),
     path('event-applications/pending-admin/', event_views.pending_admin_approvals_view, name='pending_admin_approvals'),
+    path('event-applications/bulk-approve/', event_views.bulk_approve_events_view, name='bulk_approve_events'),
+    path('event-applications/bulk-reject/', event_views.bulk_reject_events_view, name='bulk_reject_events'),
     path('event-applications/<int:event_id>/faculty-approve/', event_views.faculty_approve_event_view, name='faculty_approve_event'),
     path('event-applications/<int:event_id>/faculty-reject/', event_views.faculty_reject_event_view, name='faculty_reject_event'),
     path('event-applications/<int:event_id>/admin-approve/', event_views.admin_approve_event_view, name='admin_approve_event'),
@@ -68,6 +81,9 @@ urlpatterns = [
     path('my-club-applications/', application_views.my_club_applications_view, name='my_club_applications'),
     path('club-applications/pending-faculty/', application_views.pending_faculty_club_applications_view, name='pending_faculty_club_applications'),
     path('club-applications/pending-admin/', application_views.pending_admin_club_applications_view, name='pending_admin_club_applications'),
+    path('club-applications/bulk-approve/', application_views.bulk_approve_club_applications_view, name='bulk_approve_club_applications'),
+    path('club-applications/bulk-reject/', application_views.bulk_reject_club_applications_view, name='bulk_reject_club_applications'),
+    path('club-applications/bulk-implement/', application_views.bulk_implement_club_applications_view, name='bulk_implement_club_applications'),
     path('club-applications/<int:application_id>/faculty-approve/', application_views.faculty_approve_club_application_view, name='faculty_approve_club_application'),
     path('club-applications/<int:application_id>/faculty-reject/', application_views.faculty_reject_club_application_view, name='faculty_reject_club_application'),
     path('club-applications/<int:application_id>/admin-approve/', application_views.admin_approve_club_application_view, name='admin_approve_club_application'),
@@ -77,6 +93,14 @@ urlpatterns = [
     # Event Expense Management (for organizers)
     path('events/<int:event_id>/expenses/', event_views.event_expenses_view, name='event_expenses'),
     path('events/<int:event_id>/expenses/add/', event_views.add_event_expense_view, name='add_event_expense'),
+    path('events/<int:event_id>/expenses/import/', event_views.import_event_expenses_view, name='import_event_expenses'),
+    path('events/<int:event_id>/expenses/timeseries/', event_views.event_spend_timeseries_view, name='event_spend_timeseries'),
+    path('events/<int:event_id>/registrations/export/', event_views.export_event_registrations_view, name='export_event_registrations'),
+    path('events/<int:event_id>/attendance/export/', event_views.export_event_attendance_view, name='export_event_attendance'),
+    
+    # Reports
+    path('reports/budget-utilization/', event_views.budget_utilization_report_view, name='budget_utilization_report'),
+    path('reports/approval-sla/', views.approval_sla_report_view, name='approval_sla_report'),
     
     # Health check
     path('health/', views.health_check, name='health_check'),
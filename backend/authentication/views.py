@@ -4,12 +4,13 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.tokens import RefreshToken
-from django.contrib.auth import authenticate
+from django.contrib.auth.signals import user_login_failed
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
 from django.views.decorators.csrf import csrf_exempt
-import uuid
-import boto3
-from .models import AdminUser, UniversityProfile
+import math
+from .models import AdminUser
 from .models import Club, ClubMember, RoleHistory, ApprovalRequest, ApprovalHistory
 from .serializers import (
     AdminUserSerializer, 
@@ -18,8 +19,18 @@ from .serializers import (
     RegisterSerializer,
     UniversityProfileSerializer,
     ClubSerializer, ClubMemberDetailSerializer, RoleHistorySerializer,
-    ApprovalRequestSerializer, ApprovalRequestCreateSerializer, ApprovalHistorySerializer
+    ApprovalRequestSerializer, ApprovalRequestCreateSerializer, ApprovalHistorySerializer,
+    ApprovalRequestListSerializer
 )
+from .pagination import InvalidCursor, keyset_paginate, parse_page_size
+from .inbox import ITEM_TYPES, inbox_counts, inbox_page, serialize_inbox_row
+from .reviewer_scope import get_reviewer_scope
+from .bulk_actions import BulkActionError, bulk_review_approval_requests, parse_bulk_ids
+from .throttling import check_login_throttle, clear_account_throttle
+from .stateless_auth import StatelessJWTAuthentication, full_user
+from .revocation import CachedBlacklistRefreshToken
+from .activity import record_login
+from .university_profile import get_or_create_university_profile, university_profile_blob
 
 
 class CustomTokenObtainPairView(TokenObtainPairView):
@@ -47,41 +58,38 @@ def login_view(request):
     role = serializer.validated_data.get('role')
     two_factor_code = serializer.validated_data.get('two_factor_code')
     
-    # Try to find user by username or email
-    user = None
-    username_to_auth = None
-    
-    # First, check if input looks like an email
-    if '@' in username_or_email:
-        # Try to find user by email
-        try:
-            user_obj = AdminUser.objects.get(email=username_or_email)
-            username_to_auth = user_obj.username
-        except AdminUser.DoesNotExist:
-            return Response(
-                {'error': 'No account found with this email'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
-    else:
-        # Treat as username
-        username_to_auth = username_or_email
+    # Charge the attempt before any lookup or password hashing
+    wait = check_login_throttle(request, username_or_email)
+    if wait:
+        response = Response(
+            {'error': 'Too many login attempts. Please try again later.'},
+            status=status.HTTP_429_TOO_MANY_REQUESTS
+        )
+        response['Retry-After'] = str(int(math.ceil(wait)))
+        return response
     
-    # Authenticate user
-    user = authenticate(username=username_to_auth, password=password)
+    # One query: by email if the input looks like one, otherwise by username
+    lookup = 'email' if '@' in username_or_email else 'username'
+    user = AdminUser.objects.filter(**{lookup: username_or_email}).first()
     
     if user is None:
-        # Check if user exists but password is wrong
-        try:
-            AdminUser.objects.get(username=username_to_auth)
-            return Response(
-                {'error': 'Invalid password'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
-        except AdminUser.DoesNotExist:
-            return Response(
-                {'error': 'No account found with this username'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
+        return Response(
+            {'error': f'No account found with this {lookup}'},
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+    
+    if not user.check_password(password):
+        user_login_failed.send(
+            sender=__name__,
+            credentials={'username': username_or_email},
+            request=request
+        )
+        return Response(
+            {'error': 'Invalid password'},
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+    
+    clear_account_throttle(username_or_email)
     
     if not user.is_active:
         return Response(
@@ -114,6 +122,8 @@ def login_view(request):
     refresh['role'] = user.role
     refresh['email'] = user.email
     
+    record_login(user.pk)
+    
     return Response({
         'message': 'Login successful',
         'access': str(refresh.access_token),
@@ -150,6 +160,7 @@ def register_view(request):
 
 
 @api_view(['POST'])
+@authentication_classes([StatelessJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def logout_view(request):
     """
@@ -158,7 +169,7 @@ def logout_view(request):
     try:
         refresh_token = request.data.get('refresh')
         if refresh_token:
-            token = RefreshToken(refresh_token)
+            token = CachedBlacklistRefreshToken(refresh_token)
             token.blacklist()
         
         return Response(
@@ -173,12 +184,13 @@ def logout_view(request):
 
 
 @api_view(['GET'])
+@authentication_classes([StatelessJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def user_profile_view(request):
     """
     Get current user profile.
     """
-    serializer = AdminUserSerializer(request.user)
+    serializer = AdminUserSerializer(full_user(request))
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -240,94 +252,78 @@ def health_check(request):
 
 
 @api_view(['GET', 'PUT', 'PATCH'])
+@authentication_classes([StatelessJWTAuthentication])
 @permission_classes([AllowAny])
 def university_profile_view(request):
-    """Get or update global university profile. Public GET, admin updates."""
-
-    profile, _ = UniversityProfile.objects.get_or_create(
-        pk=1,
-        defaults={
-            'name': 'Your University',
-            'tagline': 'Excellence in Education'
-        }
-    )
+    """
+    Get or update global university profile. Public GET, admin updates.
+    GET is served from the cached body; clients revalidate with If-None-Match.
+    """
 
     # Allow anyone to read; restrict writes to admin role
     if request.method in ['PUT', 'PATCH']:
         if not request.user.is_authenticated or getattr(request.user, 'role', '') != 'admin':
             return Response({'error': 'Admin privileges required'}, status=status.HTTP_403_FORBIDDEN)
 
+        profile = get_or_create_university_profile()
         serializer = UniversityProfileSerializer(profile, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save(updated_by=request.user)
+            serializer.save(updated_by=full_user(request))
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response({'error': 'Invalid input', 'details': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
-    serializer = UniversityProfileSerializer(profile)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    from django.http import HttpResponse
+    from django.utils.cache import patch_cache_control
+
+    body, etag = university_profile_blob()
+    if etag in request.headers.get('If-None-Match', ''):
+        response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    patch_cache_control(response, public=True, max_age=getattr(settings, 'UNIVERSITY_PROFILE_MAX_AGE', 300))
+    return response
+
+
+def _storage_missing(exc):
+    return Response({
+        'error': 'AWS configuration missing',
+        'details': str(exc),
+    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def university_upload_view(request):
-    """Upload branding assets to S3. Admin only."""
+    """Upload branding assets through the server. Admin only (prefer upload/presign/ for direct uploads)."""
     try:
-        print(f"Upload request received from user: {request.user.username}, role: {request.user.role}")
-        
         if getattr(request.user, 'role', '') != 'admin':
             return Response({'error': 'Admin privileges required'}, status=status.HTTP_403_FORBIDDEN)
 
         file_obj = request.FILES.get('file')
         folder = request.data.get('folder', 'branding')
         
-        print(f"File: {file_obj.name if file_obj else 'None'}, Folder: {folder}")
-        
         if not file_obj:
             return Response({'error': 'No file provided'}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Get AWS settings from Django settings
-        bucket = getattr(settings, 'AWS_STORAGE_BUCKET_NAME', '')
-        region = getattr(settings, 'AWS_S3_REGION_NAME', '')
-        access_key = getattr(settings, 'AWS_ACCESS_KEY_ID', '')
-        secret_key = getattr(settings, 'AWS_SECRET_ACCESS_KEY', '')
-
-        print(f"AWS Config - Bucket: {bucket}, Region: {region}, Has Key: {bool(access_key)}, Has Secret: {bool(secret_key)}")
+        from .storage import get_storage
+        from .uploads import BRANDING_CONTENT_TYPES, upload_key
 
-        if not bucket or not region or not access_key or not secret_key:
+        content_type = file_obj.content_type or ''
+        if content_type not in BRANDING_CONTENT_TYPES:
             return Response({
-                'error': 'AWS configuration missing',
-                'details': f'Bucket: {bool(bucket)}, Region: {bool(region)}, Key: {bool(access_key)}, Secret: {bool(secret_key)}'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        print("Initializing S3 client...")
-        # Initialize S3 client
-        s3_client = boto3.client(
-            's3',
-            region_name=region,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-        )
+                'error': f'Unsupported content type: {content_type or "none"}'
+            }, status=status.HTTP_400_BAD_REQUEST)
 
-        # Generate unique filename
-        key = f"{folder.strip('/')}/{uuid.uuid4()}_{file_obj.name}"
-        print(f"Generated S3 key: {key}")
-        
-        print("Uploading to S3...")
-        # Upload to S3 (without ACL since bucket may have ACLs disabled)
-        s3_client.upload_fileobj(
-            file_obj,
-            bucket,
-            key,
-            ExtraArgs={
-                'ContentType': file_obj.content_type or 'application/octet-stream'
-            }
-        )
-        
-        print("Upload successful!")
-        # Return public URL
-        url = f"https://{bucket}.s3.{region}.amazonaws.com/{key}"
+        try:
+            storage = get_storage()
+        except ImproperlyConfigured as exc:
+            return _storage_missing(exc)
+
+        key = upload_key(folder, file_obj.name, content_type)
+        url = storage.save(key, file_obj, content_type)
         return Response({
-            'url': url, 
+            'url': request.build_absolute_uri(url), 
             'key': key,
             'message': 'File uploaded successfully'
         }, status=status.HTTP_201_CREATED)
@@ -343,15 +339,134 @@ def university_upload_view(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['POST'])
+@authentication_classes([StatelessJWTAuthentication])
+@permission_classes([IsAuthenticated])
+def university_upload_presign_view(request):
+    """
+    Step 1 of a direct branding upload. Admin only.
+    Body: filename, content_type, folder (default branding), field (optional:
+    logo_url, favicon_url or hero_image_url to set on completion).
+    Returns a POST form for the storage backend and an upload_token.
+    """
+    from .uploads import BRANDING_CONTENT_TYPES, BRANDING_FIELDS, UploadError, issue_upload
+
+    if getattr(request.user, 'role', '') != 'admin':
+        return Response({'error': 'Admin privileges required'}, status=status.HTTP_403_FORBIDDEN)
+
+    field = request.data.get('field') or None
+    if field and field not in BRANDING_FIELDS:
+        return Response({
+            'error': f"Invalid field. Choose from {', '.join(BRANDING_FIELDS)}"
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        payload = issue_upload(
+            request.data.get('folder') or 'branding',
+            request.data.get('filename', ''),
+            request.data.get('content_type', ''),
+            allowed_types=BRANDING_CONTENT_TYPES,
+            target=field,
+        )
+    except UploadError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    except ImproperlyConfigured as exc:
+        return _storage_missing(exc)
+
+    payload['upload']['url'] = request.build_absolute_uri(payload['upload']['url'])
+    payload['complete_url'] = request.build_absolute_uri(reverse('university_upload_complete'))
+    return Response(payload, status=status.HTTP_200_OK)
+
+
+@api_view(['POST'])
+@authentication_classes([StatelessJWTAuthentication])
+@permission_classes([IsAuthenticated])
+def university_upload_complete_view(request):
+    """
+    Step 2 of a direct branding upload. Admin only.
+    Body: upload_token from step 1. Verifies the object exists and, if a
+    field was requested, stores its URL on the university profile.
+    """
+    from .uploads import UploadError, complete_upload
+
+    if getattr(request.user, 'role', '') != 'admin':
+        return Response({'error': 'Admin privileges required'}, status=status.HTTP_403_FORBIDDEN)
+
+    try:
+        key, url, field = complete_upload(request.data.get('upload_token'))
+    except UploadError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    except ImproperlyConfigured as exc:
+        return _storage_missing(exc)
+
+    url = request.build_absolute_uri(url)
+    if field:
+        profile = get_or_create_university_profile()
+        setattr(profile, field, url)
+        profile.updated_by = full_user(request)
+        profile.save(update_fields=[field, 'updated_by', 'updated_at'])
+
+    return Response({
+        'key': key,
+        'url': url,
+        'field': field,
+        'message': 'File uploaded successfully'
+    }, status=status.HTTP_201_CREATED)
+
+
+@api_view(['POST'])
+@authentication_classes([])  # The signed policy in the form authorizes the upload
+@permission_classes([AllowAny])
+def local_upload_view(request):
+    """
+    Upload target of the local storage backend, mirroring an S3 presigned POST:
+    form fields key, Content-Type and policy, then the file.
+    """
+    from django.core import signing
+    from .storage import LocalStorage
+
+    storage = LocalStorage()
+    try:
+        policy = storage.load_policy(request.data.get('policy', ''))
+    except signing.BadSignature:
+        return Response({'error': 'Invalid or expired policy'}, status=status.HTTP_403_FORBIDDEN)
+
+    file_obj = request.FILES.get('file')
+    if request.data.get('key') != policy['key'] or request.data.get('Content-Type') != policy['content_type']:
+        return Response({'error': 'Form does not match policy'}, status=status.HTTP_403_FORBIDDEN)
+    if not file_obj or not 0 < file_obj.size <= policy['max_bytes']:
+        return Response({'error': 'File missing or larger than allowed'}, status=status.HTTP_400_BAD_REQUEST)
+
+    storage.save(policy['key'], file_obj)
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+def _optional_jwt_user(request):
+    """User from a bearer token, if any, for views that disable authentication for public access."""
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+    
+    try:
+        authenticated = JWTAuthentication().authenticate(request)
+    except Exception:
+        return None
+    return authenticated[0] if authenticated else None
+
+
 @api_view(['GET', 'POST'])
-@authentication_classes([])  # Allow public access for GET, require auth for POST via method check
+@authentication_classes([])  # Allow public access for GET; the bearer token is checked in the view
 @permission_classes([AllowAny])
 def clubs_view(request):
-    """List all clubs (PUBLIC) or create a new club (admin only)."""
-    if request.method == 'GET':
+    """
+    List all clubs (PUBLIC; admins get members and declarations) or create a
+    new club (admin only).
+    """
+    user = _optional_jwt_user(request)
+    is_admin = getattr(user, 'role', '') == 'admin'
+    
+    if request.method == 'GET' and not is_admin:
         # Public endpoint - no authentication required
         try:
-            clubs = Club.objects.all().order_by('name')
+            clubs = Club.objects.select_related('faculty_mentor').order_by('name')
             clubs_data = []
             for club in clubs:
                 # Get faculty mentor email if available
@@ -371,44 +486,17 @@ def clubs_view(request):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
-    # POST method - require authentication
-    if not request.user.is_authenticated:
-        return Response({'error': 'Authentication required'}, status=status.HTTP_401_UNAUTHORIZED)
-    
-    if request.method == 'POST':
-        clubs = Club.objects.all().order_by('-created_at')
-        # Prepare S3 client for presigned URLs
-        bucket = settings.AWS_STORAGE_BUCKET_NAME
-        region = settings.AWS_S3_REGION_NAME
-        access_key = settings.AWS_ACCESS_KEY_ID
-        secret_key = settings.AWS_SECRET_ACCESS_KEY
-        s3_client = None
-        if bucket and region and access_key and secret_key:
-            try:
-                s3_client = boto3.client(
-                    's3',
-                    region_name=region,
-                    aws_access_key_id=access_key,
-                    aws_secret_access_key=secret_key
-                )
-            except Exception:
-                s3_client = None
+    if request.method == 'GET':
+        from .presigned_urls import presign_object_urls
+        
+        clubs = list(
+            Club.objects.select_related('faculty_mentor').prefetch_related('members__user').order_by('-created_at')
+        )
+        # Presigned URLs for private declarations, reused from cache until near expiry
+        declaration_urls = presign_object_urls([c.declaration_url for c in clubs], tier='day')
         payload = []
         for c in clubs:
-            # Generate presigned URL if object is private
-            dec_url = c.declaration_url
-            if s3_client and dec_url:
-                prefix = f"https://{bucket}.s3.{region}.amazonaws.com/"
-                if dec_url.startswith(prefix):
-                    key = dec_url[len(prefix):]
-                    try:
-                        dec_url = s3_client.generate_presigned_url(
-                            'get_object',
-                            Params={'Bucket': bucket, 'Key': key},
-                            ExpiresIn=86400
-                        )
-                    except Exception:
-                        pass
+            dec_url = declaration_urls.get(c.declaration_url, c.declaration_url)
             payload.append({
                 'id': c.id,
                 'club_number': c.club_number,
@@ -428,7 +516,9 @@ def clubs_view(request):
         return Response(payload, status=status.HTTP_200_OK)
 
     # POST - create club
-    if getattr(request.user, 'role', '') != 'admin':
+    if user is None:
+        return Response({'error': 'Authentication required'}, status=status.HTTP_401_UNAUTHORIZED)
+    if not is_admin:
         return Response({'error': 'Admin privileges required'}, status=status.HTTP_403_FORBIDDEN)
 
     serializer = ClubSerializer(data=request.data)
@@ -437,180 +527,88 @@ def clubs_view(request):
 
     data = serializer.validated_data
 
-    # Create or get users for members
-    import secrets
-    created_users = []
-    faculty_user = None
     try:
-        for member in data['members']:
-            email = member['email'].lower()
-            username = email.split('@')[0]
-            role = 'faculty' if member['role'] == 'faculty' else 'student'
+        from django.db import transaction
+        from .club_setup import enqueue_club_setup
+        from .provisioning import ProvisioningError, add_memberships, provision_members
+        
+        with transaction.atomic():
+            # Resolve or create the users in bulk; passwords are issued by the notification jobs
+            result, members = provision_members(data['members'], issue_passwords=False, memberships=False)
+            if result.errors:
+                raise ProvisioningError('; '.join(message for _, message in result.errors))
             
-            # Parse full name into first and last name
-            full_name = member.get('name', '').strip()
-            name_parts = full_name.split(maxsplit=1)
-            first_name = name_parts[0] if len(name_parts) > 0 else ''
-            last_name = name_parts[1] if len(name_parts) > 1 else ''
-
-            user, created = AdminUser.objects.get_or_create(
-                email=email,
-                defaults={
-                    'username': username,
-                    'role': role,
-                    'first_name': first_name,
-                    'last_name': last_name
-                }
-            )
-            # Update only if user was just created or has no name set
-            if created:
-                # Already set via defaults
-                pass
-            else:
-                # Only update name if both first_name and last_name are empty
-                if not user.first_name and not user.last_name and full_name:
-                    parts = full_name.split(maxsplit=1)
-                    user.first_name = parts[0] if len(parts) > 0 else ''
-                    user.last_name = parts[1] if len(parts) > 1 else ''
-                # Update email only if missing
-                if not user.email:
-                    user.email = email
+            faculty_user = None
+            faculty_mentor_name = ''
+            for member_user, member in members:
+                if member['role'] == 'faculty' and faculty_user is None:
+                    faculty_user = member_user
+                    faculty_mentor_name = member.get('name', '')
             
-            # Generate random password for new users
-            random_password = secrets.token_urlsafe(10)
-            user.set_password(random_password)
-            user.save()
-
-            created_users.append({'user': user, 'password': random_password, 'member': member})
-            if member['role'] == 'faculty':
-                faculty_user = user
-
-        # Create club
-        # Extract faculty mentor name from members
-        faculty_mentor_name = ''
-        for member in data['members']:
-            if member['role'] == 'faculty':
-                faculty_mentor_name = member.get('name', '')
-                break
-        
-        club = Club.objects.create(
-            name=data['name'],
-            club_number=data['club_number'],
-            faculty_mentor=faculty_user,
-            faculty_mentor_name=faculty_mentor_name
-        )
-
-        # Create memberships
-        for entry in created_users:
-            ClubMember.objects.create(
-                club=club,
-                user=entry['user'],
-                role=entry['member']['role'],
-                department=entry['member'].get('department', ''),
-                academic_year=entry['member'].get('academic_year', ''),
+            club = Club.objects.create(
+                name=data['name'],
+                club_number=data['club_number'],
+                faculty_mentor=faculty_user,
+                faculty_mentor_name=faculty_mentor_name
             )
 
-        # Generate PDF declaration and upload to S3
-        try:
-            from io import BytesIO
-            from reportlab.lib.pagesizes import A4
-            from reportlab.pdfgen import canvas
-
-            buffer = BytesIO()
-            p = canvas.Canvas(buffer, pagesize=A4)
-            p.setFont("Helvetica-Bold", 16)
-            p.drawString(72, 800, "Declaration of Inclusion")
-            p.setFont("Helvetica", 12)
-            p.drawString(72, 770, f"Club: {club.name} ({club.club_number})")
-            p.drawString(72, 750, f"Issued On: {club.created_at.strftime('%Y-%m-%d')}")
-            p.drawString(72, 730, "Members:")
-            y = 710
-            for m in club.members.all():
-                text = f"- {m.user.username} ({m.user.email}) - {m.role.title()}"
-                p.drawString(90, y, text)
-                y -= 18
-                if y < 100:
-                    p.showPage()
-                    y = 800
-            p.showPage()
-            p.save()
-            buffer.seek(0)
-
-            # Upload to S3
-            bucket = settings.AWS_STORAGE_BUCKET_NAME
-            region = settings.AWS_S3_REGION_NAME
-            access_key = settings.AWS_ACCESS_KEY_ID
-            secret_key = settings.AWS_SECRET_ACCESS_KEY
-            s3_client = boto3.client('s3', region_name=region, aws_access_key_id=access_key, aws_secret_access_key=secret_key)
-            s3_key = f"clubs/{club.club_number}/declaration_{club.club_number}.pdf"
-            s3_client.put_object(Bucket=bucket, Key=s3_key, Body=buffer.getvalue(), ContentType='application/pdf')
-            declaration_url = f"https://{bucket}.s3.{region}.amazonaws.com/{s3_key}"
-            club.declaration_url = declaration_url
-            club.save()
-        except Exception as pdf_exc:
-            # Not critical to block creation
-            print(f"PDF generation/upload failed: {pdf_exc}")
-
-        # Generate presigned URL for declaration before sending emails
-        declaration_url_to_send = club.declaration_url
-        if club.declaration_url:
-            prefix = f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/"
-            if club.declaration_url.startswith(prefix):
-                key = club.declaration_url[len(prefix):]
-                try:
-                    s3_client = boto3.client(
-                        's3',
-                        region_name=settings.AWS_S3_REGION_NAME,
-                        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-                    )
-                    declaration_url_to_send = s3_client.generate_presigned_url(
-                        'get_object',
-                        Params={'Bucket': settings.AWS_STORAGE_BUCKET_NAME, 'Key': key},
-                        ExpiresIn=604800  # 7 days
-                    )
-                    print(f"Generated presigned URL for declaration: {declaration_url_to_send[:80]}...")
-                except Exception as presign_exc:
-                    print(f"Presigned URL generation failed: {presign_exc}")
-
-        # Send emails with credentials and declaration link
-        from django.core.mail import send_mail
-        for entry in created_users:
-            member = entry['member']
-            user = entry['user']
-            pwd = entry['password']
-            role_label = member['role'].replace('_', ' ').title()
-            member_name = member.get('name', user.username)
-            body = (
-                f"Hello {member_name},\n\n"
-                f"You have been added to the club '{club.name}' as {role_label}.\n"
-                f"Login credentials:\nUsername: {user.username}\nPassword: {pwd}\n\n"
-                f"Declaration link: {declaration_url_to_send or 'TBD'}\n\n"
-                "Regards, CAMPUSPHERE"
+            # Create memberships for the users resolved above
+            add_memberships(members, club)
+
+            # Declaration PDF, S3 upload and emails run on the job queue
+            handle = enqueue_club_setup(
+                club,
+                [
+                    {'user_id': member_user.id, 'name': member.get('name', ''), 'role': member['role']}
+                    for member_user, member in members
+                ],
+                created_by=user,
             )
-            try:
-                send_mail(
-                    subject=f"{club.name} Club Membership",
-                    message=body,
-                    from_email=settings.DEFAULT_FROM_EMAIL if hasattr(settings, 'DEFAULT_FROM_EMAIL') else 'no-reply@campusphere.local',
-                    recipient_list=[user.email],
-                    fail_silently=False,
-                )
-                print(f"Email sent successfully to {user.email}")
-            except Exception as mail_exc:
-                print(f"Email sending failed for {user.email}: {mail_exc}")
 
         return Response({
-            'message': 'Club created successfully',
+            'message': 'Club created. Declaration and member emails are being processed.',
             'club_id': club.id,
-            'declaration_url': declaration_url_to_send
-        }, status=status.HTTP_201_CREATED)
+            'job': str(handle),
+            'job_status_url': f'/api/auth/jobs/{handle}/',
+        }, status=status.HTTP_202_ACCEPTED)
 
+    except ProvisioningError as exc:
+        return Response({'error': 'Invalid members', 'details': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as exc:
         import traceback
         return Response({'error': 'Failed to create club', 'details': str(exc), 'traceback': traceback.format_exc() if settings.DEBUG else None}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def job_status_view(request, handle):
+    """Progress of the background jobs queued under one handle (creator or admin only)."""
+    try:
+        from .jobs import job_group_status, serialize_job
+        from .models import BackgroundJob
+        
+        jobs = list(BackgroundJob.objects.filter(handle=handle))
+        if not jobs:
+            return Response({'error': 'Job not found'}, status=status.HTTP_404_NOT_FOUND)
+        
+        if getattr(request.user, 'role', '') != 'admin' and jobs[0].created_by_id != request.user.id:
+            return Response({
+                'error': 'Access denied.'
+            }, status=status.HTTP_403_FORBIDDEN)
+        
+        return Response({
+            'job': str(handle),
+            'status': job_group_status(jobs),
+            'jobs': [serialize_job(job) for job in jobs],
+        }, status=status.HTTP_200_OK)
+    
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to fetch job status', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def membership_requests_view(request):
@@ -729,29 +727,14 @@ def role_history_view(request):
         return Response({'error': 'Failed to fetch role history', 'details': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def club_members_view(request, club_id):
-    """Get all members of a specific club."""
-    try:
-        members = ClubMember.objects.filter(club_id=club_id).select_related('club', 'user', 'approved_by', 'revoked_by')
-        
-        serializer = ClubMemberDetailSerializer(members, many=True)
-        return Response({
-            'members': serializer.data
-        }, status=status.HTTP_200_OK)
-    
-    except Exception as exc:
-        return Response({'error': 'Failed to fetch club members', 'details': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-
 # ==================== APPROVAL MANAGEMENT ====================
 
 @api_view(['GET', 'POST'])
 @permission_classes([IsAuthenticated])
 def approvals_view(request):
     """
-    GET: List all approval requests (with optional filters)
+    GET: List approval requests (with optional filters), newest first.
+         Keyset-paginated: pass the returned next_cursor as ?cursor= for the next page.
     POST: Create a new approval request
     """
     if request.method == 'GET':
@@ -763,7 +746,7 @@ def approvals_view(request):
             
             approvals = ApprovalRequest.objects.select_related(
                 'club', 'requested_by', 'approved_by', 'rejected_by'
-            ).prefetch_related('history__performed_by')
+            )
             
             # Apply filters
             if request_type and request_type != 'all':
@@ -775,8 +758,23 @@ def approvals_view(request):
             if club_id:
                 approvals = approvals.filter(club_id=club_id)
             
-            serializer = ApprovalRequestSerializer(approvals, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            try:
+                page_size = parse_page_size(request.query_params.get('page_size'))
+                page, next_cursor = keyset_paginate(
+                    approvals,
+                    ['-created_at', '-id'],
+                    cursor=request.query_params.get('cursor'),
+                    page_size=page_size,
+                )
+            except InvalidCursor as exc:
+                return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+            
+            serializer = ApprovalRequestListSerializer(page, many=True)
+            return Response({
+                'results': serializer.data,
+                'next_cursor': next_cursor,
+                'page_size': page_size,
+            }, status=status.HTTP_200_OK)
         
         except Exception as exc:
             return Response({'error': 'Failed to fetch approvals', 'details': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -809,6 +807,58 @@ def approvals_view(request):
             return Response({'error': 'Failed to create approval request', 'details': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['GET'])
+@authentication_classes([StatelessJWTAuthentication])
+@permission_classes([IsAuthenticated])
+def reviewer_inbox_view(request):
+    """
+    Everything awaiting the current reviewer in one list: approval requests,
+    event applications and club applications, highest priority and oldest first.
+    Query params: type (comma-separated subset of approval,event,club_application),
+    cursor, page_size.
+    """
+    try:
+        scope = get_reviewer_scope(request)
+        if not scope.is_reviewer:
+            return Response({
+                'error': 'Access denied. Faculty or admin role required.'
+            }, status=status.HTTP_403_FORBIDDEN)
+        
+        item_types = None
+        type_param = request.query_params.get('type')
+        if type_param and type_param != 'all':
+            item_types = [t.strip() for t in type_param.split(',') if t.strip()]
+            invalid = [t for t in item_types if t not in ITEM_TYPES]
+            if invalid:
+                return Response({
+                    'error': f"Invalid type: {', '.join(invalid)}. Choose from {', '.join(ITEM_TYPES)}"
+                }, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            page_size = parse_page_size(request.query_params.get('page_size'))
+            rows, next_cursor = inbox_page(
+                scope,
+                item_types=item_types,
+                cursor=request.query_params.get('cursor'),
+                page_size=page_size,
+            )
+        except InvalidCursor as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        counts = inbox_counts(scope)
+        return Response({
+            'results': [serialize_inbox_row(row) for row in rows],
+            'next_cursor': next_cursor,
+            'page_size': page_size,
+            'counts': counts,
+            'total': sum(counts.values()),
+            'reviewer_role': 'admin' if scope.is_admin else 'faculty',
+        }, status=status.HTTP_200_OK)
+    
+    except Exception as exc:
+        return Response({'error': 'Failed to fetch inbox', 'details': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def approval_detail_view(request, approval_id):
@@ -922,6 +972,55 @@ def reject_request_view(request, approval_id):
         return Response({'error': 'Failed to reject request', 'details': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def _bulk_review_approvals(request, approve):
+    scope = get_reviewer_scope(request)
+    if not scope.is_reviewer:
+        return Response({
+            'error': 'Access denied. Faculty or admin role required.'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        ids = parse_bulk_ids(request.data)
+    except BulkActionError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    rejection_reason = request.data.get('rejection_reason')
+    if not approve and not rejection_reason:
+        return Response({'error': 'Rejection reason is required'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    result = bulk_review_approval_requests(
+        request.user, scope, ids, approve,
+        comment=request.data.get('comment', ''),
+        reason=rejection_reason or '',
+        admin_notes=request.data.get('admin_notes'),
+    )
+    verb = 'approved' if approve else 'rejected'
+    return Response({
+        'message': f"{len(result['processed'])} request(s) {verb}",
+        **result,
+    }, status=status.HTTP_200_OK)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def bulk_approve_requests_view(request):
+    """Approve many pending approval requests. Body: {"ids": [...], "comment": "...", "admin_notes": "..."}."""
+    try:
+        return _bulk_review_approvals(request, approve=True)
+    except Exception as exc:
+        return Response({'error': 'Failed to approve requests', 'details': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def bulk_reject_requests_view(request):
+    """Reject many pending approval requests. Body: {"ids": [...], "rejection_reason": "..."}."""
+    try:
+        return _bulk_review_approvals(request, approve=False)
+    except Exception as exc:
+        return Response({'error': 'Failed to reject requests', 'details': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def mark_under_review_view(request, approval_id):
@@ -976,12 +1075,34 @@ def approval_history_view(request, approval_id):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+def approval_sla_report_view(request):
+    """
+    Review latency percentiles per stage, reviewer throughput and backlog age.
+    Admin only. Served from the summary tables rebuilt by refresh_approval_metrics.
+    """
+    try:
+        from .approval_metrics import approval_metrics_payload
+        
+        if not get_reviewer_scope(request).is_admin:
+            return Response({
+                'error': 'Access denied. Admin role required.'
+            }, status=status.HTTP_403_FORBIDDEN)
+        
+        return Response(approval_metrics_payload(), status=status.HTTP_200_OK)
+    
+    except Exception as exc:
+        return Response({'error': 'Failed to fetch approval metrics', 'details': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['GET'])
+@authentication_classes([StatelessJWTAuthentication])
+@permission_classes([IsAuthenticated])
 def my_clubs_view(request):
     """Get all clubs the current user is a member of."""
     try:
         # Get all club memberships for the current user
         memberships = ClubMember.objects.filter(
-            user=request.user
+            user_id=request.user.id
         ).select_related('club').order_by('-created_at')
         
         # Serialize the data
@@ -1057,45 +1178,106 @@ def club_members_view(request, club_id):
         )
 
 
+def _can_view_roster(request, club_id):
+    """Active club members and the club's reviewers may read its roster."""
+    return get_reviewer_scope(request).can_review_club(club_id) or ClubMember.objects.filter(
+        user=request.user,
+        club_id=club_id,
+        status='active'
+    ).exists()
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def club_roster_view(request, club_id):
+    """
+    Paginated club roster for members of the club and its reviewers.
+    Filters: ?role=, ?status= (comma-separated), ?department=, ?academic_year=;
+    search: ?q= (name, username or email). Pass next_cursor as ?cursor=.
+    """
+    try:
+        from .roster import roster_page, serialize_roster_member
+        
+        if not _can_view_roster(request, club_id):
+            return Response(
+                {'error': 'You are not a member of this club'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        try:
+            page_size = parse_page_size(request.query_params.get('page_size'))
+            page, next_cursor = roster_page(
+                club_id,
+                request.query_params,
+                cursor=request.query_params.get('cursor'),
+                page_size=page_size,
+            )
+        except InvalidCursor as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response({
+            'results': [serialize_roster_member(member) for member in page],
+            'next_cursor': next_cursor,
+            'page_size': page_size,
+        }, status=status.HTTP_200_OK)
+    
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to fetch club roster', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def club_roster_export_view(request, club_id):
+    """Stream the club roster as CSV. Accepts the same filters and ?q= search as the roster."""
+    try:
+        from .exports import MEMBER_EXPORT_COLUMNS, csv_export_response, export_filename
+        from .roster import ROSTER_ORDERING, roster_queryset
+        
+        club = Club.objects.only('id', 'club_number').get(id=club_id)
+        if not _can_view_roster(request, club_id):
+            return Response(
+                {'error': 'You are not a member of this club'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        members = roster_queryset(club_id, request.query_params).order_by(*ROSTER_ORDERING)
+        return csv_export_response(members, MEMBER_EXPORT_COLUMNS, export_filename(club.club_number, 'members'))
+    
+    except Club.DoesNotExist:
+        return Response({'error': 'Club not found'}, status=status.HTTP_404_NOT_FOUND)
+    except Exception as exc:
+        return Response(
+            {'error': 'Failed to export club roster', 'details': str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 @api_view(['GET'])
 @authentication_classes([])  # Disable authentication for this endpoint
 @permission_classes([AllowAny])
 def all_clubs_view(request):
-    """Get all active clubs - PUBLIC endpoint for login page."""
+    """
+    Get all clubs with active member counts - PUBLIC endpoint for login page.
+    Served from a cached JSON body; clients revalidate with If-None-Match.
+    """
     try:
-        import traceback
-        print("all_clubs_view called")
-        
-        clubs = Club.objects.all().order_by('name')
-        print(f"Found {clubs.count()} clubs")
+        from django.http import HttpResponse
+        from django.utils.cache import patch_cache_control
+        from .club_directory import club_directory_blob
         
-        clubs_data = []
-        for club in clubs:
-            try:
-                member_count = ClubMember.objects.filter(club=club, status='active').count()
-                clubs_data.append({
-                    'id': club.id,
-                    'name': club.name,
-                    'club_number': club.club_number,
-                    'description': '',  # Club model doesn't have description field
-                    'domain': 'general',  # Club model doesn't have domain field yet
-                    'faculty_mentor_name': club.faculty_mentor_name or '',
-                    'faculty_mentor_email': club.faculty_mentor_email or '',
-                    'department': club.department or '',
-                    'member_count': member_count,
-                    'created_at': club.created_at,
-                })
-            except Exception as club_error:
-                print(f"Error processing club {club.id}: {str(club_error)}")
-                traceback.print_exc()
-        
-        print(f"Returning {len(clubs_data)} clubs")
-        return Response(clubs_data, status=status.HTTP_200_OK)
+        body, etag = club_directory_blob()
+        if etag in request.headers.get('If-None-Match', ''):
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        patch_cache_control(response, public=True, max_age=getattr(settings, 'CLUB_DIRECTORY_MAX_AGE', 60))
+        return response
     
     except Exception as exc:
-        print(f"Error in all_clubs_view: {str(exc)}")
-        import traceback
-        traceback.print_exc()
         return Response(
             {'error': 'Failed to fetch clubs', 'details': str(exc)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -6,6 +6,7 @@ from pathlib import Path
 from decouple import config, Csv
 from datetime import timedelta
 import os
+import sys
 import dj_database_url
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -37,6 +38,7 @@ INSTALLED_APPS = [
     # Third-party apps
     'rest_framework',
     'rest_framework_simplejwt',
+    'rest_framework_simplejwt.token_blacklist',
     'corsheaders',
     
     # Local apps
@@ -51,6 +53,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'authentication.activity.ActivityMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -148,6 +151,19 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
+# Cache
+# Local memory by default, for development only. Deployments must point
+# CACHE_BACKEND/CACHE_LOCATION at a shared cache (render.yaml uses Redis): cache
+# generations are bumped by whichever process writes, including the job worker,
+# and a per-process cache never sees those bumps (check authentication.W001).
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='campusphere'),
+    }
+}
+
+
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -156,6 +172,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # Reverse proxies in front of the app (Render's load balancer). Client IPs
+    # for throttling are taken from this many hops from the right of
+    # X-Forwarded-For; the rest of the header is client-supplied. Use 0 when
+    # clients connect directly.
+    'NUM_PROXIES': config('NUM_PROXIES', default=1, cast=int),
 }
 
 
@@ -165,7 +186,7 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(minutes=config('JWT_REFRESH_TOKEN_LIFETIME', default=1440, cast=int)),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
-    'UPDATE_LAST_LOGIN': True,
+    'UPDATE_LAST_LOGIN': False,  # Buffered by authentication/activity.py instead
 
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
@@ -182,6 +203,9 @@ SIMPLE_JWT = {
     'TOKEN_TYPE_CLAIM': 'token_type',
 
     'JTI_CLAIM': 'jti',
+
+    # Blacklist checks on refresh go through the in-process filter (authentication/revocation.py)
+    'TOKEN_REFRESH_SERIALIZER': 'authentication.revocation.CachedBlacklistTokenRefreshSerializer',
 }
 
 
@@ -224,3 +248,76 @@ if EMAIL_BACKEND == 'django.core.mail.backends.smtp.EmailBackend':
     EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
     EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=True, cast=bool)
     EMAIL_USE_SSL = config('EMAIL_USE_SSL', default=False, cast=bool)
+
+# Expense bill OCR (processed in the background by `manage.py process_expense_ocr`).
+# Dotted path of an OCREngine subclass; OCR is off until one is set.
+OCR_ENGINE = config('OCR_ENGINE', default='')
+OCR_BATCH_SIZE = config('OCR_BATCH_SIZE', default=50, cast=int)
+OCR_WORKERS = config('OCR_WORKERS', default=2, cast=int)
+OCR_CLAIM_TIMEOUT = config('OCR_CLAIM_TIMEOUT', default=600, cast=int)
+
+# Bulk expense import
+EXPENSE_IMPORT_MAX_ROWS = config('EXPENSE_IMPORT_MAX_ROWS', default=5000, cast=int)
+
+# Cross-club budget utilization report (invalidated on event/expense writes)
+BUDGET_REPORT_CACHE_TTL = config('BUDGET_REPORT_CACHE_TTL', default=600, cast=int)
+
+# Approval SLA analytics (summary tables rebuilt by `manage.py refresh_approval_metrics`)
+APPROVAL_SLA_HOURS = config('APPROVAL_SLA_HOURS', default=72, cast=int)
+APPROVAL_METRICS_WINDOW_DAYS = config('APPROVAL_METRICS_WINDOW_DAYS', default=90, cast=int)
+
+# Reviewer scope (club memberships per user), dropped on any ClubMember change
+REVIEWER_SCOPE_CACHE_TTL = config('REVIEWER_SCOPE_CACHE_TTL', default=60, cast=int)
+
+# Public club directory (login page): server-side blob TTL and browser/CDN max-age
+CLUB_DIRECTORY_CACHE_TTL = config('CLUB_DIRECTORY_CACHE_TTL', default=3600, cast=int)
+CLUB_DIRECTORY_MAX_AGE = config('CLUB_DIRECTORY_MAX_AGE', default=60, cast=int)
+
+# Background job queue (run with `manage.py process_jobs --loop`)
+JOB_BATCH_SIZE = config('JOB_BATCH_SIZE', default=20, cast=int)
+JOB_MAX_ATTEMPTS = config('JOB_MAX_ATTEMPTS', default=5, cast=int)
+JOB_RETRY_BASE_DELAY = config('JOB_RETRY_BASE_DELAY', default=30, cast=int)
+JOB_LOCK_TIMEOUT = config('JOB_LOCK_TIMEOUT', default=600, cast=int)
+
+# Bulk user provisioning (`manage.py provision_users`): password hashing processes
+PROVISIONING_HASH_WORKERS = config('PROVISIONING_HASH_WORKERS', default=4, cast=int)
+
+# Streaming CSV exports: rows fetched per database round trip
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# Login throttle: fixed-window attempt counters per client IP and per account (kept in CACHES);
+# BURST attempts per window, the window lasting BURST / PER_MINUTE minutes
+LOGIN_THROTTLE_ENABLED = config('LOGIN_THROTTLE_ENABLED', default=True, cast=bool)
+LOGIN_THROTTLE_IP_BURST = config('LOGIN_THROTTLE_IP_BURST', default=20, cast=int)
+LOGIN_THROTTLE_IP_PER_MINUTE = config('LOGIN_THROTTLE_IP_PER_MINUTE', default=10, cast=int)
+LOGIN_THROTTLE_ACCOUNT_BURST = config('LOGIN_THROTTLE_ACCOUNT_BURST', default=5, cast=int)
+LOGIN_THROTTLE_ACCOUNT_PER_MINUTE = config('LOGIN_THROTTLE_ACCOUNT_PER_MINUTE', default=2, cast=int)
+
+# Stateless JWT views (authentication/stateless_auth.py): seconds the full AdminUser stays cached
+AUTH_USER_CACHE_TTL = config('AUTH_USER_CACHE_TTL', default=60, cast=int)
+
+# Refresh token blacklist: in-process Bloom filter resynced from the database this often (seconds)
+TOKEN_BLACKLIST_SYNC_INTERVAL = config('TOKEN_BLACKLIST_SYNC_INTERVAL', default=30, cast=int)
+TOKEN_BLACKLIST_ERROR_RATE = config('TOKEN_BLACKLIST_ERROR_RATE', default=0.01, cast=float)
+
+# User activity: last_login / last_seen are buffered and bulk-written at most this many seconds later;
+# 0 writes synchronously (the default under `manage.py test`, so no timer outlives the test database)
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+ACTIVITY_FLUSH_INTERVAL = config('ACTIVITY_FLUSH_INTERVAL', default=0 if TESTING else 60, cast=int)
+ACTIVITY_FLUSH_BATCH_SIZE = config('ACTIVITY_FLUSH_BATCH_SIZE', default=500, cast=int)
+
+# University profile (branding): cached body lifetime and browser max-age, in seconds
+UNIVERSITY_PROFILE_CACHE_TTL = config('UNIVERSITY_PROFILE_CACHE_TTL', default=86400, cast=int)
+UNIVERSITY_PROFILE_MAX_AGE = config('UNIVERSITY_PROFILE_MAX_AGE', default=300, cast=int)
+
+# Object storage for direct uploads: 's3', 'local', or 'auto' (S3 when the AWS settings are present,
+# local files only under DEBUG; otherwise storage raises ImproperlyConfigured)
+STORAGE_BACKEND = config('STORAGE_BACKEND', default='auto')
+LOCAL_STORAGE_ROOT = config('LOCAL_STORAGE_ROOT', default='') or str(BASE_DIR / 'media')
+LOCAL_STORAGE_URL = config('LOCAL_STORAGE_URL', default='/media/')
+UPLOAD_MAX_BYTES = config('UPLOAD_MAX_BYTES', default=10 * 1024 * 1024, cast=int)
+UPLOAD_URL_EXPIRY = config('UPLOAD_URL_EXPIRY', default=900, cast=int)
+STORAGE_MAX_POOL_CONNECTIONS = config('STORAGE_MAX_POOL_CONNECTIONS', default=20, cast=int)
+
+# Image derivatives (built by `manage.py process_jobs`): variant width list endpoints link as thumbnails
+IMAGE_THUMBNAIL_WIDTH = config('IMAGE_THUMBNAIL_WIDTH', default=320, cast=int)
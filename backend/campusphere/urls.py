@@ -1,9 +1,12 @@
 """
 URL configuration for campusphere project.
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 from django.http import FileResponse
+from django.views.static import serve
+from authentication.storage import local_storage_enabled
 from pathlib import Path
 import mimetypes
 
@@ -52,11 +55,25 @@ def serve_frontend_file(request, filepath=''):
     from django.http import JsonResponse
     return JsonResponse({'error': 'Not found'}, status=404)
 
+def serve_local_media(request, path):
+    """Local storage files; never sniffed or rendered as a page of this origin."""
+    response = serve(request, path, document_root=settings.LOCAL_STORAGE_ROOT)
+    response['X-Content-Type-Options'] = 'nosniff'
+    # <img> and <link rel=icon> still load it; opening the URL downloads it
+    response['Content-Disposition'] = f'attachment; filename="{Path(path).name}"'
+    return response
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/auth/', include('authentication.urls')),
 ]
 
+# Files of the local storage backend, served by Django only under DEBUG
+if settings.DEBUG and local_storage_enabled():
+    urlpatterns += [
+        path(f"{settings.LOCAL_STORAGE_URL.strip('/')}/<path:path>", serve_local_media, name='local_media'),
+    ]
+
 # Frontend routes (must be last for catch-all)
 urlpatterns += [
     path('', serve_frontend_file, name='frontend_root'),
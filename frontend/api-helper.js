@@ -24,3 +24,19 @@ function getApiUrl(path) {
 
 // Make it available globally
 window.getApiUrl = getApiUrl;
+
+// Resized copy of an image from the API's image_variants ({url: {width: {webp, jpeg}}}
+// or one url's {width: {webp, jpeg}}): the smallest variant at least `width` wide,
+// else the largest; the original URL until the variants exist.
+function pickImageVariant(variants, url, width) {
+    const byWidth = variants && (variants[url] || variants);
+    const widths = Object.keys(byWidth || {}).map(Number).filter(w => w > 0).sort((a, b) => a - b);
+    if (!url || !widths.length) {
+        return url;
+    }
+    const chosen = widths.find(w => w >= width) || widths[widths.length - 1];
+    const formats = byWidth[String(chosen)] || {};
+    return formats.webp || formats.jpeg || url;
+}
+
+window.pickImageVariant = pickImageVariant;